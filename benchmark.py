@@ -0,0 +1,740 @@
+"""Sözdizimi vurgulama performans ölçümleri
+
+Kullanım:
+    python benchmark.py                              # Tüm diller, 1k/10k/100k satır
+    python benchmark.py --sizes 1000 10000 --languages python css
+    python benchmark.py --output sonuc.json          # Sonuçları JSON olarak kaydet
+    python benchmark.py --compare onceki.json       # Önceki sonuçlarla karşılaştır
+    python benchmark.py --tk                         # Gizli bir Tk metin alanına da uygula
+    python benchmark.py --document --document-sizes 1 100   # Belge tamponu (MB cinsinden)
+    python benchmark.py --tabs --tab-count 500        # Sekme kaydı aramaları
+    python benchmark.py --tk --legacy-python          # Eski Python vurgulayıcısıyla karşılaştır
+    python benchmark.py --python-files editor.py      # Gerçek Python dosyalarında ölç
+
+Ölçümler ekran gerektirmeyen lexer katmanında yapılır; Tcl çağrı sayısı,
+editörün belirteçleri uygularken yapacağı toplu tag_add çağrılarından
+sayılır. --tk verildiğinde belirteçler gerçek bir Text widget'ına
+uygulanır ve Tcl çağrıları doğrudan sayılır (ekran veya Xvfb gerekir).
+
+--document, sekmelerin kullandığı Document tamponunu rastgele düzenleme,
+ardışık yazma ve satır arama işlemleriyle ölçer.
+
+--legacy-python, tokenize tabanlı PythonLexer'ı kaldırılan arama tabanlı
+vurgulayıcıyla (aşağıda referans olarak korunur) aynı Text widget'ında
+karşılaştırır; --tk gerektirir.
+
+--python-files, yapay belgelerin yanında verilen gerçek Python dosyalarını
+(ör. editor.py) ölçer; --legacy-python ile birlikte verilirse eski
+vurgulayıcıyla karşılaştırma bu dosyalarda da yapılır.
+
+--tabs, TabRegistry aramalarını registry öncesindeki doğrusal taramalarla
+karşılaştırır (notebook yerine sahte çerçeve yolları kullanılır).
+"""
+import argparse, json, os, platform, random, sys, time, tracemalloc
+from datetime import datetime
+
+from editor import Document, TabRegistry, build_language_registry, group_tokens_by_tag, apply_tag_ranges
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+LANGUAGES = ("python", "javascript", "html", "css", "json", "xml", "markdown")
+
+# Tek Tcl komutundaki en fazla indeks (editördeki apply_tag_ranges ile aynı)
+TAG_BATCH = 20000
+
+DOCUMENT_SIZES = (1, 10)      # MB
+DOCUMENT_OPERATIONS = 20000   # Her belge ölçümündeki işlem sayısı
+
+TAB_COUNT = 500               # Sekme ölçümündeki sekme sayısı
+TAB_LOOKUPS = 10000           # Sekme ölçümündeki arama sayısı
+
+def generate_python(lines, rng):
+    """Yaklaşık verilen satır sayısında Python kodu üretir"""
+    out = ["import os, sys", "from collections import OrderedDict", ""]
+    i = 0
+    while len(out) < lines:
+        out.extend([
+            "@property" if i % 3 == 0 else "@staticmethod",
+            f"def function_{i}(value, count=0x{i % 256:02X}, scale=1_000):",
+            f'    """İşlev {i} için belge dizesi"""',
+            f"    text = f\"{{value}} #{i} not a comment\"  # gerçek yorum",
+            f"    items = [n * {rng.random():.3f} for n in range(count) if n % 2]",
+            "    if len(items) > 10 and not isinstance(value, str):",
+            f"        return {{'key': '{i}', \"other\": None, 'escaped': 'it\\'s'}}",
+            f"    return sum(items) + {rng.randint(0, 10 ** 6)}",
+            "",
+            f"class Model{i}(OrderedDict):",
+            "    pass",
+            ""
+        ])
+        i += 1
+    return "\n".join(out[:lines])
+
+def generate_javascript(lines, rng):
+    """Yaklaşık verilen satır sayısında JavaScript kodu üretir"""
+    out = ["'use strict';", ""]
+    i = 0
+    while len(out) < lines:
+        out.extend([
+            f"// İşlev {i}",
+            f"async function handler{i}(request, options = {{}}) {{",
+            f"    const limit = options.limit || {rng.randint(1, 500)};",
+            f"    let message = `Kayıt ${{request.id}} / {i}`;",
+            "    /* çok satırlı",
+            "       yorum */",
+            f"    const result = await fetch(\"/api/items/{i}\", {{ method: 'GET' }});",
+            f"    if (result.status !== 200 && limit > 0x{i % 4096:X}) {{",
+            "        throw new Error(message);",
+            "    }",
+            "    return JSON.parse(await result.text());",
+            "}",
+            ""
+        ])
+        i += 1
+    return "\n".join(out[:lines])
+
+def generate_html(lines, rng):
+    """Yaklaşık verilen satır sayısında HTML üretir"""
+    out = ["<!DOCTYPE html>", "<html lang=\"tr\">", "<head>", "<style>",
+           "body { margin: 0; color: #333; }", "</style>", "</head>", "<body>"]
+    i = 0
+    while len(out) < lines - 2:
+        out.extend([
+            f"<!-- bölüm {i} -->",
+            f"<div class=\"card card-{i}\" id='item{i}' data-value=\"a>b\" hidden>",
+            f"  <h2 title=\"Başlık {i}\">Başlık {i}</h2>",
+            f"  <p>Metin <a href=\"/page/{i}?q={rng.randint(0, 999)}&amp;x=1\">bağlantı</a></p>",
+            "  <img src=\"image.png\" alt=\"\"/>",
+            "  <script>const x = \"</p>\"; console.log(x);</script>",
+            "</div>"
+        ])
+        i += 1
+    out.extend(["</body>", "</html>"])
+    return "\n".join(out[:lines])
+
+def generate_css(lines, rng):
+    """Yaklaşık verilen satır sayısında CSS üretir"""
+    out = ["@import url(\"base.css\");", "@charset \"utf-8\";"]
+    i = 0
+    while len(out) < lines:
+        out.extend([
+            f"/* kural {i} */",
+            f".block-{i} > a:hover, #id{i} {{",
+            f"    color: #{rng.randint(0, 0xffffff):06x};",
+            f"    margin: {rng.randint(0, 40)}px auto !important;",
+            "    background: url(img/bg.png) no-repeat;",
+            "}",
+            "@media screen and (max-width: 600px) {",
+            f"    .block-{i} {{ font-size: {rng.random() * 2:.2f}em; }}",
+            "}"
+        ])
+        i += 1
+    return "\n".join(out[:lines])
+
+def generate_json(lines, rng):
+    """Yaklaşık verilen satır sayısında biçimli JSON üretir"""
+    items = []
+    count = 0
+    i = 0
+    while count < lines:
+        items.append({
+            "id": i,
+            "name": f"kullanıcı {i}",
+            "active": i % 2 == 0,
+            "score": round(rng.random() * 100, 3),
+            "tags": ["a", "b"],
+            "meta": None
+        })
+        count += 12  # indent=2 ile kayıt başına satır sayısı
+        i += 1
+    return json.dumps(items, indent=2, ensure_ascii=False)
+
+def generate_xml(lines, rng):
+    """Yaklaşık verilen satır sayısında XML üretir"""
+    out = ["<?xml version=\"1.0\" encoding=\"UTF-8\"?>", "<!DOCTYPE catalog>", "<catalog>"]
+    i = 0
+    while len(out) < lines - 1:
+        out.extend([
+            f"  <!-- kayıt {i} -->",
+            f"  <item id=\"{i}\" price='{rng.random() * 100:.2f}' available=\"true\">",
+            f"    <name>Ürün {i}</name>",
+            "    <description><![CDATA[<b>kalın</b> & özel]]></description>",
+            "  </item>"
+        ])
+        i += 1
+    out.append("</catalog>")
+    return "\n".join(out[:lines])
+
+def generate_markdown(lines, rng):
+    """Yaklaşık verilen satır sayısında Markdown üretir"""
+    out = []
+    i = 0
+    while len(out) < lines:
+        out.extend([
+            f"## Bölüm {i}",
+            "",
+            f"Bu **kalın** ve *italik* metin `kod {i}` ile [bağlantı](http://example.com/{i}).",
+            "- madde bir",
+            f"{i % 9 + 1}. sıralı madde",
+            "> alıntı _vurgu_",
+            "",
+            "```python",
+            f"def f{i}(): return '# başlık değil'",
+            "```",
+            ""
+        ])
+        i += 1
+    return "\n".join(out[:lines])
+
+GENERATORS = {
+    "python": generate_python,
+    "javascript": generate_javascript,
+    "html": generate_html,
+    "css": generate_css,
+    "json": generate_json,
+    "xml": generate_xml,
+    "markdown": generate_markdown
+}
+
+def generate_corpus(language, lines, seed=0):
+    """Dil için tekrarlanabilir bir yapay belge üretir"""
+    return GENERATORS[language](lines, random.Random(seed))
+
+class TclCallCounter:
+    """Tk olmadan tag_add çağrılarını sayan metin alanı yerine geçen nesne"""
+    def __init__(self):
+        self.calls = 0
+
+    def tag_add(self, tag, *indices):
+        self.calls += 1
+
+class CountingTk:
+    """Gerçek Tk yorumlayıcısına giden çağrıları sayar"""
+    def __init__(self, tk_app):
+        self.tk_app = tk_app
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self.tk_app.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.tk_app, name)
+
+def legacy_highlight_python(text_widget, start_pos="1.0", end_pos="end"):
+    """PythonLexer'dan önceki, Text.search tabanlı vurgulayıcı (yalnızca karşılaştırma için)"""
+    keywords = [
+        "False", "None", "True", "and", "as", "assert", "async", "await", "break", "class",
+        "continue", "def", "del", "elif", "else", "except", "finally", "for", "from", "global",
+        "if", "import", "in", "is", "lambda", "nonlocal", "not", "or", "pass", "raise", "return",
+        "try", "while", "with", "yield"
+    ]
+    builtins = [
+        "abs", "all", "any", "ascii", "bin", "bool", "bytearray", "bytes", "callable", "chr",
+        "classmethod", "compile", "complex", "delattr", "dict", "dir", "divmod", "enumerate",
+        "eval", "exec", "filter", "float", "format", "frozenset", "getattr", "globals", "hasattr",
+        "hash", "help", "hex", "id", "input", "int", "isinstance", "issubclass", "iter", "len",
+        "list", "locals", "map", "max", "memoryview", "min", "next", "object", "oct", "open",
+        "ord", "pow", "print", "property", "range", "repr", "reversed", "round", "set", "setattr",
+        "slice", "sorted", "staticmethod", "str", "sum", "super", "tuple", "type", "vars", "zip"
+    ]
+
+    # Yorumlar
+    pos = start_pos
+    while True:
+        pos = text_widget.search(r'#', pos, end_pos, regexp=True)
+        if not pos:
+            break
+        line_end = text_widget.index(f"{pos} lineend")
+        text_widget.tag_add("comment", pos, line_end)
+        pos = line_end
+        pos = text_widget.search(r'"""', pos, end_pos, regexp=True)
+        if not pos:
+            break
+        comment_end = text_widget.search(r'"""', f"{pos}+3c", end_pos, regexp=True)
+        if comment_end:
+            text_widget.tag_add("comment", pos, f"{comment_end}+3c")
+            pos = f"{comment_end}+3c"
+        else:
+            pos = text_widget.index(f"{pos}+3c")
+
+    # Anahtar kelimeler ve yerleşik fonksiyonlar
+    for tag, words in (("keyword", keywords), ("builtin", builtins)):
+        for word in words:
+            pos = start_pos
+            while True:
+                pos = text_widget.search(r'\y' + word + r'\y', pos, end_pos, regexp=True)
+                if not pos:
+                    break
+                text_widget.tag_add(tag, pos, f"{pos}+{len(word)}c")
+                pos = text_widget.index(f"{pos}+1c")
+
+    # Sayılar
+    pos = start_pos
+    while True:
+        pos = text_widget.search(r'\b\d+(\.\d+)?\b', pos, end_pos, regexp=True)
+        if not pos:
+            break
+        number_end = text_widget.search(r'\b', pos, end_pos, regexp=True)
+        if number_end:
+            text_widget.tag_add("number", pos, number_end)
+            pos = number_end
+        else:
+            pos = text_widget.index(f"{pos}+1c")
+
+    # Dizeler
+    pos = start_pos
+    while True:
+        pos = text_widget.search(r'["\']', pos, end_pos, regexp=True)
+        if not pos:
+            break
+        quote = text_widget.get(pos)
+        string_end = text_widget.search(quote, f"{pos}+1c", end_pos)
+        if string_end:
+            text_widget.tag_add("string", pos, f"{string_end}+1c")
+            pos = f"{string_end}+1c"
+        else:
+            pos = text_widget.index(f"{pos}+1c")
+
+    # Fonksiyon ve sınıf adları
+    for tag, pattern, skip, terminator in (("function", r'\bdef\s+([a-zA-Z_]\w*)', 4, r'\('),
+                                           ("class", r'\bclass\s+([a-zA-Z_]\w*)', 6, r'[:(]')):
+        pos = start_pos
+        while True:
+            pos = text_widget.search(pattern, pos, end_pos, regexp=True)
+            if not pos:
+                break
+            name_start = text_widget.search(r'[a-zA-Z_]\w*', f"{pos}+{skip}c", end_pos)
+            name_end = text_widget.search(terminator, name_start, end_pos) if name_start else None
+            if name_end:
+                text_widget.tag_add(tag, name_start, name_end)
+                pos = name_end
+            else:
+                pos = text_widget.index(f"{pos}+1c")
+
+    # Dekoratörler
+    pos = start_pos
+    while True:
+        pos = text_widget.search(r'@[a-zA-Z_]\w*', pos, end_pos, regexp=True)
+        if not pos:
+            break
+        decorator_end = text_widget.search(r'[(\n]', pos, end_pos)
+        if decorator_end:
+            text_widget.tag_add("decorator", pos, decorator_end)
+            pos = decorator_end
+        else:
+            pos = text_widget.index(f"{pos}+1c")
+
+def measure_legacy_python(lexer, text, tk_root):
+    """Aynı Python belgesini eski ve yeni vurgulayıcıyla gerçek bir Text widget'ında vurgular"""
+    import tkinter as tk
+    results = {}
+    for name in ("legacy", "lexer"):
+        widget = tk.Text(tk_root)
+        widget.insert("1.0", text)
+        counter = CountingTk(widget.tk)
+        widget.tk = counter
+        started = time.perf_counter()
+        if name == "legacy":
+            legacy_highlight_python(widget)
+        else:
+            apply_tag_ranges(widget, group_tokens_by_tag(text, lexer.tokenize(text)), TAG_BATCH)
+        results[f"{name}_seconds"] = time.perf_counter() - started
+        results[f"{name}_tcl_calls"] = counter.calls
+        widget.destroy()
+    results["lines"] = text.count("\n") + 1
+    results["speedup"] = results["legacy_seconds"] / results["lexer_seconds"] if results["lexer_seconds"] else 0
+    return results
+
+def measure(lexer, text, repeat=3, tk_root=None):
+    """Lexer'ı metin üzerinde çalıştırır ve ölçümleri döndürür"""
+    best = None
+    tokens = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        tokens = lexer.tokenize(text)
+        ranges = group_tokens_by_tag(text, tokens)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Tepe bellek ayrı bir çalıştırmada ölçülür, süre ölçümünü etkilemesin
+    tracemalloc.start()
+    group_tokens_by_tag(text, lexer.tokenize(text))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if tk_root is not None:
+        import tkinter as tk
+        widget = tk.Text(tk_root)
+        widget.insert("1.0", text)
+        counter = CountingTk(widget.tk)
+        widget.tk = counter
+        started = time.perf_counter()
+        apply_tag_ranges(widget, ranges, TAG_BATCH)
+        apply_seconds = time.perf_counter() - started
+        tcl_calls = counter.calls
+        widget.destroy()
+    else:
+        counter = TclCallCounter()
+        apply_tag_ranges(counter, ranges, TAG_BATCH)
+        tcl_calls = counter.calls
+        apply_seconds = None
+
+    lines = text.count("\n") + 1
+    return {
+        "lines": lines,
+        "bytes": len(text.encode("utf-8")),
+        "seconds": best,
+        "lines_per_second": lines / best if best else 0,
+        "tokens": len(tokens),
+        "tokens_per_second": len(tokens) / best if best else 0,
+        "tcl_calls": tcl_calls,
+        "tk_apply_seconds": apply_seconds,
+        "peak_memory_kb": peak / 1024
+    }
+
+def measure_document(size_mb, operations=DOCUMENT_OPERATIONS, seed=0):
+    """Document tamponunda düzenleme ve satır arama sürelerini ölçer (işlem başına µs)
+    
+    Rastgele düzenlemeler yalnızca parça tablosunu ölçer; satır indeksi
+    (editörde Tk indeks dönüşümleri için kullanılır) yazmadan önce
+    oluşturulur ve yazma süresine dahildir.
+    """
+    rng = random.Random(seed)
+    chunk = generate_corpus("python", 2000, seed)
+    size = size_mb * 1024 * 1024
+    text = (chunk * (size // len(chunk) + 1))[:size]
+    
+    started = time.perf_counter()
+    document = Document(text)
+    load_seconds = time.perf_counter() - started
+    del text
+    
+    # Rastgele konumlarda ekleme ve silme
+    started = time.perf_counter()
+    for _ in range(operations):
+        offset = rng.randrange(len(document) + 1)
+        if rng.random() < 0.5:
+            document.insert(offset, rng.choice(("x", "yeni\n", "a = 1\n")))
+        else:
+            document.delete(offset, offset + rng.randint(1, 8))
+    random_edit = (time.perf_counter() - started) / operations
+    
+    # Belgenin ortasında karakter karakter yazma
+    document.line_index
+    offset = len(document) // 2
+    started = time.perf_counter()
+    for i in range(operations):
+        document.insert(offset + i, "\n" if i % 40 == 39 else "x")
+    typing = (time.perf_counter() - started) / operations
+    
+    # Konum <-> (satır, sütun) dönüşümleri
+    offsets = [rng.randrange(len(document) + 1) for _ in range(operations)]
+    started = time.perf_counter()
+    for offset in offsets:
+        line, column = document.offset_to_position(offset)
+        document.position_to_offset(line, column)
+    lookup = (time.perf_counter() - started) / operations
+    
+    # Sıralı konum listesinin Tk indekslerine toplu çevrimi (yazmadan kalan kayma önce uygulanır):
+    # belgeye dağılmış konumlar her seferinde satır değiştirir, belirteç
+    # yoğunluğundaki konumlar (ilk %2'lik bölüm) çoğunlukla aynı satırda kalır
+    offsets.sort()
+    document.line_index.to_indices(offsets[:1])
+    started = time.perf_counter()
+    document.line_index.to_indices(offsets)
+    bulk_index = (time.perf_counter() - started) / operations * 1000
+    dense = sorted(rng.randrange(len(document) // 50 + 1) for _ in range(operations))
+    started = time.perf_counter()
+    document.line_index.to_indices(dense)
+    bulk_dense = (time.perf_counter() - started) / operations * 1000
+    
+    return {
+        "size_mb": size_mb,
+        "lines": document.line_count(),
+        "load_ms": load_seconds * 1000,
+        "random_edit_us": random_edit * 1e6,
+        "typing_us": typing * 1e6,
+        "line_lookup_us": lookup * 1e6,
+        "bulk_index_us_per_1000": bulk_index * 1e6,
+        "bulk_dense_us_per_1000": bulk_dense * 1e6,
+        "pieces": document.table.piece_count()
+    }
+
+def measure_tabs(count=TAB_COUNT, lookups=TAB_LOOKUPS, seed=0):
+    """Sekme aramalarını TabRegistry ile ve eski doğrusal taramayla ölçer (µs)
+    
+    Eski yöntem: notebook.select() sonucunu her sekmenin çerçevesiyle
+    karşılaştırarak tab_id bulmak ve sürüklemeden sonra sırayı iç içe
+    döngüyle yeniden kurmak.
+    """
+    rng = random.Random(seed)
+    frames = [f".!notebook.!frame{i + 1}" for i in range(count)]
+    tabs = {f"tab_{i}": {"frame": frame} for i, frame in enumerate(frames)}
+    registry = TabRegistry()
+    for tab_id, tab_info in tabs.items():
+        registry.add(tab_id, tab_info["frame"])
+    targets = [rng.choice(frames) for _ in range(lookups)]
+    
+    def linear_lookup(frame):
+        for tab_id, tab_info in tabs.items():
+            if tab_info["frame"] == frame:
+                return tab_id
+        return None
+        
+    def linear_rebuild(order):
+        new_tabs = {}
+        for frame in order:
+            for tab_id, tab_info in tabs.items():
+                if tab_info["frame"] == frame:
+                    new_tabs[tab_id] = tab_info
+                    break
+        return new_tabs
+        
+    started = time.perf_counter()
+    for frame in targets:
+        linear_lookup(frame)
+    linear_lookup_us = (time.perf_counter() - started) / lookups * 1e6
+    
+    started = time.perf_counter()
+    for frame in targets:
+        registry.tab_id_for_frame(frame)
+    registry_lookup_us = (time.perf_counter() - started) / lookups * 1e6
+    
+    started = time.perf_counter()
+    for _ in range(lookups):
+        registry.tab_id_at(rng.randrange(count))
+    index_lookup_us = (time.perf_counter() - started) / lookups * 1e6
+    
+    # Sürüklemeden sonra sıranın yeniden kurulması
+    order = frames[:]
+    rng.shuffle(order)
+    repeat = 20
+    started = time.perf_counter()
+    for _ in range(repeat):
+        linear_rebuild(order)
+    linear_rebuild_ms = (time.perf_counter() - started) / repeat * 1000
+    
+    started = time.perf_counter()
+    for _ in range(repeat):
+        registry.sync_order(order)
+    registry_rebuild_ms = (time.perf_counter() - started) / repeat * 1000
+    
+    return {
+        "tabs": count,
+        "linear_lookup_us": linear_lookup_us,
+        "registry_lookup_us": registry_lookup_us,
+        "index_lookup_us": index_lookup_us,
+        "linear_rebuild_ms": linear_rebuild_ms,
+        "registry_rebuild_ms": registry_rebuild_ms
+    }
+
+def run(languages=LANGUAGES, sizes=DEFAULT_SIZES, repeat=3, use_tk=False, seed=0, progress=None):
+    """Seçilen diller ve boyutlar için ölçümleri çalıştırır"""
+    registry = build_language_registry()
+    tk_root = None
+    if use_tk:
+        import tkinter as tk
+        tk_root = tk.Tk()
+        tk_root.withdraw()
+
+    results = []
+    try:
+        for language in languages:
+            lexer = registry.get(language).lexer
+            for size in sizes:
+                text = generate_corpus(language, size, seed)
+                # Büyük belgelerde tekrar sayısını azalt
+                result = measure(lexer, text, repeat if size < 100000 else 1, tk_root)
+                result["language"] = language
+                result["size"] = size
+                results.append(result)
+                if progress:
+                    progress(result)
+    finally:
+        if tk_root is not None:
+            tk_root.destroy()
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+
+def compare(current, baseline, threshold=0.10):
+    """İki sonuç kümesini karşılaştırır; (dil, boyut, oran, gerileme mi) listesi döndürür"""
+    previous = {(r["language"], r["size"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = previous.get((result["language"], result["size"]))
+        if not old or not old["seconds"]:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        rows.append((result["language"], result["size"], ratio, ratio > 1 + threshold))
+        
+    # Belge ölçümleri işlem türü başına karşılaştırılır
+    previous = {r["size_mb"]: r for r in baseline.get("document", [])}
+    for result in current.get("document", []):
+        old = previous.get(result["size_mb"])
+        if not old:
+            continue
+        for key in ("random_edit_us", "typing_us", "line_lookup_us", "bulk_index_us_per_1000", "bulk_dense_us_per_1000"):
+            if old.get(key):
+                ratio = result[key] / old[key]
+                rows.append((f"doc:{key.split('_us')[0]}", f"{result['size_mb']}MB", ratio, ratio > 1 + threshold))
+                
+    previous = {r["tabs"]: r for r in baseline.get("tabs", [])}
+    for result in current.get("tabs", []):
+        old = previous.get(result["tabs"])
+        if not old:
+            continue
+        for key in ("registry_lookup_us", "index_lookup_us", "registry_rebuild_ms"):
+            if old.get(key):
+                ratio = result[key] / old[key]
+                rows.append((f"tabs:{key.rsplit('_', 1)[0]}", f"{result['tabs']} sekme", ratio, ratio > 1 + threshold))
+    return rows
+
+def format_result(result):
+    """Tek ölçümü okunabilir satıra çevirir"""
+    line = (
+        f"{result['language']:<11} {result['size']:>7} satır  "
+        f"{result['seconds'] * 1000:9.1f} ms  "
+        f"{result['lines_per_second']:>11,.0f} satır/s  "
+        f"{result['tokens_per_second']:>11,.0f} belirteç/s  "
+        f"{result['tcl_calls']:>4} Tcl  "
+        f"{result['peak_memory_kb'] / 1024:7.1f} MB"
+    )
+    if result["tk_apply_seconds"] is not None:
+        line += f"  Tk: {result['tk_apply_seconds'] * 1000:.1f} ms"
+    return line
+
+def format_document_result(result):
+    """Tek belge ölçümünü okunabilir satıra çevirir"""
+    return (
+        f"document {result['size_mb']:>5} MB  {result['lines']:>9,} satır  "
+        f"yükleme {result['load_ms']:8.1f} ms  "
+        f"düzenleme {result['random_edit_us']:6.1f} µs  "
+        f"yazma {result['typing_us']:6.1f} µs  "
+        f"satır arama {result['line_lookup_us']:6.1f} µs  "
+        f"toplu indeks {result['bulk_index_us_per_1000']:7.1f} µs/1000 "
+        f"(yoğun {result.get('bulk_dense_us_per_1000', 0):6.1f})  "
+        f"{result['pieces']:>6} parça"
+    )
+
+def format_tabs_result(result):
+    """Tek sekme ölçümünü okunabilir satıra çevirir"""
+    return (
+        f"tabs {result['tabs']:>5} sekme  "
+        f"çerçeve arama {result['linear_lookup_us']:7.2f} -> {result['registry_lookup_us']:5.2f} µs  "
+        f"indeks arama {result['index_lookup_us']:5.2f} µs  "
+        f"sıra yenileme {result['linear_rebuild_ms']:7.2f} -> {result['registry_rebuild_ms']:5.2f} ms"
+    )
+
+def format_file_result(result):
+    """Gerçek dosya ölçümünü okunabilir satıra çevirir"""
+    return (
+        f"{result['file']:<20} {result['lines']:>7} satır  "
+        f"{result['seconds'] * 1000:9.1f} ms  "
+        f"{result['lines_per_second']:>11,.0f} satır/s  "
+        f"{result['tokens_per_second']:>11,.0f} belirteç/s  "
+        f"{result['tcl_calls']:>4} Tcl"
+    )
+
+def format_legacy_result(result):
+    """Eski/yeni Python vurgulayıcı karşılaştırmasını okunabilir satıra çevirir"""
+    label = result.get("file", "python")
+    return (
+        f"{label} (eski/yeni) {result['lines']:>7} satır  "
+        f"{result['legacy_seconds'] * 1000:9.1f} ms / {result['lexer_seconds'] * 1000:7.1f} ms  "
+        f"{result['legacy_tcl_calls']:>8} / {result['lexer_tcl_calls']:>4} Tcl  "
+        f"x{result['speedup']:.1f}"
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sözdizimi vurgulama performansını ölçer.")
+    parser.add_argument("--languages", nargs="+", choices=LANGUAGES, default=list(LANGUAGES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--seed", type=int, default=0, help="Yapay belge üretimi için tohum")
+    parser.add_argument("--tk", action="store_true", help="Belirteçleri gizli bir Tk metin alanına da uygula")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Gerileme eşiği (varsayılan: %%10)")
+    parser.add_argument("--document", action="store_true", help="Belge tamponu ölçümlerini de çalıştır")
+    parser.add_argument("--document-sizes", nargs="+", type=int, default=list(DOCUMENT_SIZES),
+                        help="Belge ölçümleri için boyutlar (MB)")
+    parser.add_argument("--legacy-python", action="store_true",
+                        help="Python'u kaldırılan eski vurgulayıcıyla karşılaştır (--tk gerekir)")
+    parser.add_argument("--python-files", nargs="+", default=[], metavar="DOSYA",
+                        help="Yapay belgelerin yanında ölçülecek gerçek Python dosyaları")
+    parser.add_argument("--tabs", action="store_true", help="Sekme kaydı ölçümlerini de çalıştır")
+    parser.add_argument("--tab-count", nargs="+", type=int, default=[TAB_COUNT],
+                        help="Sekme ölçümleri için sekme sayıları")
+    args = parser.parse_args(argv)
+    if args.legacy_python and not args.tk:
+        parser.error("--legacy-python gerçek bir Text widget'ı kullanır, --tk ile birlikte verilmelidir")
+
+    results = run(args.languages, args.sizes, args.repeat, args.tk, args.seed,
+                  progress=lambda result: print(format_result(result), flush=True))
+    if args.document:
+        results["document"] = []
+        for size_mb in args.document_sizes:
+            result = measure_document(size_mb, seed=args.seed)
+            results["document"].append(result)
+            print(format_document_result(result), flush=True)
+    python_files = []
+    for path in args.python_files:
+        with open(path, "r", encoding="utf-8") as file:
+            python_files.append((os.path.basename(path), file.read()))
+    if python_files:
+        lexer = build_language_registry().get("python").lexer
+        results["python_files"] = []
+        for name, text in python_files:
+            result = measure(lexer, text, args.repeat)
+            result["file"] = name
+            results["python_files"].append(result)
+            print(format_file_result(result), flush=True)
+    if args.legacy_python:
+        import tkinter as tk
+        tk_root = tk.Tk()
+        tk_root.withdraw()
+        lexer = build_language_registry().get("python").lexer
+        results["legacy_python"] = []
+        try:
+            for size in args.sizes:
+                result = measure_legacy_python(lexer, generate_corpus("python", size, args.seed), tk_root)
+                results["legacy_python"].append(result)
+                print(format_legacy_result(result), flush=True)
+            for name, text in python_files:
+                result = measure_legacy_python(lexer, text, tk_root)
+                result["file"] = name
+                results["legacy_python"].append(result)
+                print(format_legacy_result(result), flush=True)
+        finally:
+            tk_root.destroy()
+    if args.tabs:
+        results["tabs"] = []
+        for count in args.tab_count:
+            result = measure_tabs(count, seed=args.seed)
+            results["tabs"].append(result)
+            print(format_tabs_result(result), flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = 0
+        print(f"\nKarşılaştırma ({args.compare}):")
+        for language, size, ratio, regressed in compare(results, baseline, args.threshold):
+            mark = "  GERİLEME" if regressed else ""
+            unit = " satır" if isinstance(size, int) else ""
+            print(f"{language:<15} {size:>7}{unit}  x{ratio:.2f}{mark}")
+            regressions += regressed
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,289 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, font, colorchooser, ttk
-import os, re, json, shutil, time, threading, logging, traceback, psutil
+from tkinter import filedialog, messagebox, simpledialog, font, colorchooser, ttk
+import os, re, sys, json, math, queue, shutil, time, threading, logging, traceback, psutil
+import argparse, bisect, builtins, codecs, contextlib, functools, heapq, keyword, random, tempfile, tokenize, zlib
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import platform
 
+class MetricSeries:
+    """Sabit kapasiteli, dizi tabanlı sayısal zaman serisi
+    
+    Kayıt O(1)'dir ve bellek sabittir: en eski örneğin üzerine yazılır,
+    toplam/en küçük/en büyük değerler kayıt sırasında güncellenir.
+    history_capacity verilirse her downsample örneğin ortalaması uzun
+    dönemli ikinci bir seriye eklenir.
+    """
+    def __init__(self, capacity=720, downsample=12, history_capacity=0):
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.size = 0
+        self.next = 0            # Bir sonraki yazılacak hücre
+        self.count = 0           # Oturum boyunca kaydedilen örnek sayısı
+        self.total = 0.0
+        self.window_total = 0.0  # Halkadaki örneklerin toplamı
+        self.minimum = None
+        self.maximum = None
+        self.downsample = downsample
+        self.history = MetricSeries(history_capacity, 0) if history_capacity else None
+        self._bucket_total = 0.0
+        self._bucket_count = 0
+        
+    def __len__(self):
+        return self.size
+        
+    def append(self, value, timestamp=None):
+        """Yeni örneği ekler; halka doluysa en eskisinin üzerine yazar"""
+        if timestamp is None:
+            timestamp = time.time()
+        index = self.next
+        if self.size == self.capacity:
+            self.window_total -= self.values[index]
+        else:
+            self.size += 1
+        self.timestamps[index] = timestamp
+        self.values[index] = value
+        self.next = (index + 1) % self.capacity
+        
+        self.count += 1
+        self.total += value
+        self.window_total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+            
+        if self.history is not None:
+            self._bucket_total += value
+            self._bucket_count += 1
+            if self._bucket_count >= self.downsample:
+                self.history.append(self._bucket_total / self._bucket_count, timestamp)
+                self._bucket_total, self._bucket_count = 0.0, 0
+                
+    def last(self):
+        """Son örneğin değeri (örnek yoksa None)"""
+        if not self.size:
+            return None
+        return self.values[self.next - 1]
+        
+    def mean(self):
+        """Oturum boyunca kaydedilen tüm örneklerin ortalaması"""
+        return self.total / self.count if self.count else 0.0
+        
+    def window_mean(self):
+        """Halkada kalan son örneklerin ortalaması"""
+        return self.window_total / self.size if self.size else 0.0
+        
+    def items(self):
+        """Halkadaki (zaman, değer) çiftleri, eskiden yeniye"""
+        start = self.next - self.size
+        return [(self.timestamps[i], self.values[i]) for i in range(start, self.next)]
+
+class LatencyHistogram:
+    """Logaritmik kovalı (HDR benzeri) akış histogramı
+    
+    Süreler mikrosaniye olarak kovalanır: 16 µs'ye kadar doğrusal, sonrasında
+    her ikinin kuvveti 16 alt kovaya bölünür (en fazla ~%6 göreli hata).
+    Kova sayısı sabit olduğundan bellek örnek sayısından bağımsızdır.
+    """
+    SUB_BUCKETS = 16
+    MAX_SHIFT = 32  # ~19 saate kadar olan süreler ayrı kovalara düşer
+    
+    def __init__(self):
+        self.counts = array("q", bytes(8 * (self.SUB_BUCKETS * (self.MAX_SHIFT + 2))))
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        
+    def record(self, seconds):
+        """Süreyi (saniye) histograma ekler"""
+        self.counts[self._bucket(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+            
+    def percentile(self, percent):
+        """Yüzdelik dilimin üst sınırını saniye olarak döndürür"""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                if index == len(self.counts) - 1:
+                    return self.maximum
+                return min(self._upper_bound(index) / 1e6, self.maximum)
+        return self.maximum
+        
+    def summary(self):
+        """Rapor için sayı, ortalama, p50/p90/p95/p99 ve en yüksek süre"""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.maximum
+        }
+        
+    def _bucket(self, micros):
+        """Mikrosaniye değerinin kova indeksi"""
+        sub = self.SUB_BUCKETS
+        if micros < sub:
+            return max(micros, 0)
+        shift = min(micros.bit_length() - sub.bit_length(), self.MAX_SHIFT)
+        return min(sub + shift * sub + (micros >> shift) - sub, len(self.counts) - 1)
+        
+    def _upper_bound(self, index):
+        """Kovanın mikrosaniye cinsinden üst sınırı"""
+        sub = self.SUB_BUCKETS
+        if index < sub:
+            return index + 1
+        shift, mantissa = divmod(index - sub, sub)
+        return (mantissa + sub + 1) << shift
+
+class MetricsLog:
+    """Metrik kayıtlarını JSON Lines olarak ekleyen, boyuta göre döndürülen dosya
+    
+    Her yazma yalnızca yeni kayıtları dosyanın sonuna ekler. Dosya max_bytes
+    sınırını aşınca .1, .2 ... yedeklerine kaydırılır; en eski yedek silinir.
+    """
+    def __init__(self, path="performance_metrics.jsonl", max_bytes=1024 * 1024, backups=3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        
+    def append(self, records):
+        """Kayıtları sıkıştırılmış JSON satırları olarak ekler"""
+        if not records:
+            return
+        data = "".join(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n" for record in records)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+            size = f.tell()
+        if size >= self.max_bytes:
+            self.rotate()
+            
+    def rotate(self):
+        """Geçerli dosyayı yedeklere kaydırır"""
+        for index in range(self.backups, 0, -1):
+            source = self.path if index == 1 else f"{self.path}.{index - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index}")
+                
+    def read(self):
+        """Tüm kayıtları eskiden yeniye döndürür; yarım kalmış satırlar atlanır"""
+        paths = [f"{self.path}.{index}" for index in range(self.backups, 0, -1)] + [self.path]
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+                
+    def load_history(self):
+        """Kayıtlı oturumların özetini rapor için yeniden oluşturur"""
+        history = {
+            "sessions": 0,
+            "since": None,
+            "samples": 0,
+            "peak_memory_usage": 0.0,
+            "error_count": 0,
+            "histograms": {}
+        }
+        for record in self.read():
+            kind = record.get("kind")
+            if history["since"] is None:
+                history["since"] = record.get("t")
+            if kind == "session":
+                history["sessions"] += 1
+            elif kind == "sample":
+                history["samples"] += 1
+                history["peak_memory_usage"] = max(history["peak_memory_usage"], record["memory_usage"])
+            elif kind == "response":
+                histogram = history["histograms"].get(record["op"])
+                if histogram is None:
+                    histogram = history["histograms"][record["op"]] = LatencyHistogram()
+                histogram.record(record["d"])
+            elif kind == "input":
+                histogram = history["histograms"].get("input_latency")
+                if histogram is None:
+                    histogram = history["histograms"]["input_latency"] = LatencyHistogram()
+                histogram.record(record["d"])
+            elif kind == "error":
+                history["error_count"] += 1
+        return history
+
 class PerformanceMonitor:
-    def __init__(self, editor):
+    MAX_BACKOFF = 300  # Art arda hatalarda örnekleme aralığının üst sınırı (saniye)
+    # Tuş gecikmesi için belge boyutu kovaları (karakter üst sınırı, etiket)
+    INPUT_SIZE_BUCKETS = ((100_000, "<100K"), (1_000_000, "100K-1M"), (10_000_000, "1M-10M"))
+    
+    def __init__(self, editor, sample_interval=5.0):
         self.editor = editor
         self.process = psutil.Process()
+        self.sample_interval = sample_interval
+        # Sabit boyutlu halkalar: uzun oturumlarda izleyici belleği büyümez
         self.metrics = {
-            "memory_usage": [],
-            "cpu_usage": [],
-            "response_times": [],
-            "errors": [],
+            "memory_usage": MetricSeries(history_capacity=1440),
+            "cpu_usage": MetricSeries(history_capacity=1440),
+            "response_times": MetricSeries(capacity=1000),
+            "thread_count": MetricSeries(),
+            "open_files": MetricSeries(),
+            "io_read_bytes": MetricSeries(),   # Örnekleme aralığında okunan bayt
+            "io_write_bytes": MetricSeries(),  # Örnekleme aralığında yazılan bayt
+            "errors": deque(maxlen=100),
+            "error_count": 0,
             "usage_stats": {
                 "files_opened": 0,
                 "files_saved": 0,
+                "files_saved_as": 0,
                 "search_count": 0,
                 "replace_count": 0,
                 "syntax_highlighting_time": 0
             }
         }
+        # İşlem başına gecikme histogramları (raporda bu sırayla gösterilir)
+        self.histograms = {
+            name: LatencyHistogram()
+            for name in ("open_file", "save_file", "search_text", "highlighting", "keystroke", "theme_switch")
+        }
         self.start_time = time.time()
         self.monitoring = False
         self.monitor_thread = None
+        self.stop_event = threading.Event()
+        self._last_io = None
+        
+        # Olay döngüsü gecikme ölçümü ve çalışan işlem işaretçisi
+        self.operation_stack = []     # [ad, başlangıç (ns), alt işlemlerin süresi (ns)]
+        self.window_operation = None  # Son kalp atışından beri en çok kendi süresini harcayan (yol, süre)
+        self.self_times = {}          # İşlem adı -> alt işlemler hariç toplam süre (saniye)
+        
+        # Tuş basımından ekran çizimine kadar geçen süre: (boyut kovası, dil) -> histogram
+        self.input_latency = {}
+        self.stall_threshold = 0.2    # Bu gecikmenin üzeri takılma sayılır (saniye)
+        self.stalls = deque(maxlen=50)
+        self.worst_stalls = []        # En kötü takılmalar için küçük yığın (gecikme, zaman, işlem)
+        self.stall_attribution = {}   # işlem -> [sayı, toplam gecikme]
+        self.stall_count = 0
+        self._heartbeat_job = None
+        self._next_tick = None
+        
+        # Kayıtlar arayüz iş parçacığından kuyrukla devredilir, izleme iş parçacığı dosyaya ekler
+        self.metrics_log = MetricsLog()
+        self.pending_records = queue.SimpleQueue()
+        self.pending_records.put({"kind": "session", "t": self.start_time})
+        self.memory_budget_mb = 512  # Sekme uyku politikası için bellek bütçesi
         
         # Logging ayarları
         logging.basicConfig(
@@ -36,51 +296,152 @@ class PerformanceMonitor:
         """Performans izlemeyi başlatır"""
         if not self.monitoring:
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self._monitor_performance)
+            self.stop_event.clear()
+            self.monitor_thread = threading.Thread(target=self._monitor_performance, name="perf-sampler")
             self.monitor_thread.daemon = True
             self.monitor_thread.start()
             
     def stop_monitoring(self):
-        """Performans izlemeyi durdurur"""
+        """Performans izlemeyi durdurur; örnekleyici beklemeden hemen uyanır"""
         self.monitoring = False
+        self.stop_event.set()
         if self.monitor_thread:
-            self.monitor_thread.join()
+            self.monitor_thread.join(timeout=2)
+            self.monitor_thread = None
+        self._save_metrics()  # Kuyrukta kalan kayıtları yaz
             
     def _monitor_performance(self):
-        """Performans metriklerini izler"""
-        while self.monitoring:
+        """Performans metriklerini sample_interval aralıklarla örnekler
+        
+        Bekleme stop_event üzerinde yapıldığından durdurma milisaniyeler
+        içinde gerçekleşir. Art arda hatalarda aralık katlanarak uzar.
+        """
+        # cpu_percent(None) önceki çağrıdan bu yana geçen süreyi ölçer; ilk çağrı referanstır
+        self.process.cpu_percent(None)
+        delay = self.sample_interval
+        while not self.stop_event.wait(delay):
             try:
-                # Bellek kullanımı
-                memory_info = self.process.memory_info()
-                memory_usage = memory_info.rss / 1024 / 1024  # MB cinsinden
-                self.metrics["memory_usage"].append({
-                    "timestamp": time.time(),
-                    "value": memory_usage
-                })
-                
-                # CPU kullanımı
-                cpu_percent = self.process.cpu_percent(interval=1)
-                self.metrics["cpu_usage"].append({
-                    "timestamp": time.time(),
-                    "value": cpu_percent
-                })
-                
-                # Metrikleri kaydet
+                self._sample()
                 self._save_metrics()
-                
-                # 5 saniye bekle
-                time.sleep(5)
-                
+                delay = self.sample_interval
             except Exception as e:
                 self._log_error("Performans izleme hatası", e)
+                delay = min(delay * 2, self.MAX_BACKOFF)
+                    
+    def _sample(self):
+        """Süreç sayaçlarını tek seferde okuyup serilere ve kayıt kuyruğuna ekler"""
+        now = time.time()
+        with self.process.oneshot():
+            samples = {
+                "memory_usage": self.process.memory_info().rss / 1024 / 1024,  # MB cinsinden
+                "cpu_usage": self.process.cpu_percent(None),
+                "thread_count": self.process.num_threads()
+            }
+            if hasattr(self.process, "num_fds"):
+                samples["open_files"] = self.process.num_fds()
+            elif hasattr(self.process, "num_handles"):
+                samples["open_files"] = self.process.num_handles()
+            if hasattr(self.process, "io_counters"):
+                io = self.process.io_counters()
+                if self._last_io is not None:
+                    samples["io_read_bytes"] = io.read_bytes - self._last_io.read_bytes
+                    samples["io_write_bytes"] = io.write_bytes - self._last_io.write_bytes
+                self._last_io = io
                 
+        for name, value in samples.items():
+            self.metrics[name].append(value, now)
+        self.pending_records.put({"kind": "sample", "t": now, **samples})
+        
+    def enter_operation(self, name):
+        """Arayüz iş parçacığında çalışmaya başlayan işlemi işaretler"""
+        self.operation_stack.append([name, time.perf_counter_ns(), 0])
+        
+    def exit_operation(self):
+        """Son işaretlenen işlemi kapatır ve süresini döndürür
+        
+        Takılma ilişkilendirmesi için iç içe işlemlerde yalnızca işlemin
+        kendi süresi (alt işlemler hariç) karşılaştırılır.
+        """
+        name, started, child_time = self.operation_stack.pop()
+        elapsed = time.perf_counter_ns() - started
+        if self.operation_stack:
+            self.operation_stack[-1][2] += elapsed
+        duration = elapsed / 1e9
+        own_time = (elapsed - child_time) / 1e9
+        self.self_times[name] = self.self_times.get(name, 0.0) + own_time
+        if self.window_operation is None or own_time > self.window_operation[1]:
+            path = " › ".join([entry[0] for entry in self.operation_stack] + [name])
+            self.window_operation = (path, own_time)
+        return duration
+        
+    def start_lag_detector(self, root, interval_ms=100):
+        """root.after ile kalp atışı planlayıp her atışın ne kadar geç geldiğini ölçer"""
+        self.stop_lag_detector()
+        
+        def heartbeat():
+            now = time.perf_counter()
+            lag = now - self._next_tick
+            if lag >= self.stall_threshold:
+                operation = self.window_operation[0] if self.window_operation else "bilinmiyor"
+                self.record_stall(lag, operation)
+            self.window_operation = None
+            self._next_tick = time.perf_counter() + interval_ms / 1000
+            self._heartbeat_job = (root, root.after(interval_ms, heartbeat))
+            
+        self._next_tick = time.perf_counter() + interval_ms / 1000
+        self._heartbeat_job = (root, root.after(interval_ms, heartbeat))
+        
+    def stop_lag_detector(self):
+        """Kalp atışını durdurur"""
+        if self._heartbeat_job is not None:
+            root, job = self._heartbeat_job
+            try:
+                root.after_cancel(job)
+            except tk.TclError:
+                pass
+            self._heartbeat_job = None
+            
+    def record_stall(self, lag, operation):
+        """Olay döngüsü takılmasını işlemiyle birlikte kaydeder"""
+        now = time.time()
+        self.stall_count += 1
+        self.stalls.append({"timestamp": now, "lag": lag, "operation": operation})
+        entry = (lag, now, operation)
+        if len(self.worst_stalls) < 10:
+            heapq.heappush(self.worst_stalls, entry)
+        else:
+            heapq.heappushpop(self.worst_stalls, entry)
+        attribution = self.stall_attribution.setdefault(operation, [0, 0.0])
+        attribution[0] += 1
+        attribution[1] += lag
+        self.pending_records.put({"kind": "stall", "t": now, "lag": lag, "op": operation})
+        
     def record_response_time(self, operation, duration):
         """Yanıt süresini kaydeder"""
-        self.metrics["response_times"].append({
-            "timestamp": time.time(),
-            "operation": operation,
-            "duration": duration
-        })
+        self.metrics["response_times"].append(duration)
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = LatencyHistogram()
+        histogram.record(duration)
+        self.pending_records.put({"kind": "response", "t": time.time(), "op": operation, "d": duration})
+        
+    @classmethod
+    def size_bucket(cls, length):
+        """Belge uzunluğunun tuş gecikmesi boyut kovası"""
+        for limit, label in cls.INPUT_SIZE_BUCKETS:
+            if length < limit:
+                return label
+        return ">=10M"
+        
+    def record_input_latency(self, duration, size_bucket, language):
+        """Tuş gecikmesini boyut kovası ve dile göre kaydeder, ilgili histogramı döndürür"""
+        key = (size_bucket, language)
+        histogram = self.input_latency.get(key)
+        if histogram is None:
+            histogram = self.input_latency[key] = LatencyHistogram()
+        histogram.record(duration)
+        self.pending_records.put({"kind": "input", "t": time.time(), "d": duration, "size": size_bucket, "lang": language})
+        return histogram
         
     def record_error(self, error_type, error_message, stack_trace=None):
         """Hatayı kaydeder"""
@@ -91,18 +452,25 @@ class PerformanceMonitor:
             "stack_trace": stack_trace
         }
         self.metrics["errors"].append(error_data)
+        self.metrics["error_count"] += 1
+        self.pending_records.put({"kind": "error", "t": error_data["timestamp"], "type": error_type, "message": str(error_message)})
         self._log_error(error_type, error_message, stack_trace)
         
     def update_usage_stats(self, stat_name, value=1):
         """Kullanım istatistiklerini günceller"""
-        if stat_name in self.metrics["usage_stats"]:
-            self.metrics["usage_stats"][stat_name] += value
+        usage_stats = self.metrics["usage_stats"]
+        usage_stats[stat_name] = usage_stats.get(stat_name, 0) + value
             
     def _save_metrics(self):
-        """Metrikleri dosyaya kaydeder"""
+        """Son kayıttan beri biriken metrikleri dosyaya ekler"""
+        records = []
+        try:
+            while True:
+                records.append(self.pending_records.get_nowait())
+        except queue.Empty:
+            pass
         try:
-            with open('performance_metrics.json', 'w') as f:
-                json.dump(self.metrics, f, indent=2)
+            self.metrics_log.append(records)
         except Exception as e:
             self._log_error("Metrik kaydetme hatası", e)
             
@@ -112,19 +480,2049 @@ class PerformanceMonitor:
             stack_trace = traceback.format_exc()
         logging.error(f"{error_type}: {error_message}\n{stack_trace}")
         
+    def get_current_memory(self):
+        """Son ölçülen bellek kullanımını MB cinsinden döndürür"""
+        return self.metrics["memory_usage"].last()
+        
+    def is_over_memory_budget(self):
+        """Bellek kullanımının bütçeyi aşıp aşmadığını döndürür"""
+        memory_usage = self.get_current_memory()
+        return memory_usage is not None and memory_usage > self.memory_budget_mb
+        
     def get_performance_report(self):
         """Performans raporu oluşturur"""
         report = {
             "uptime": time.time() - self.start_time,
-            "memory_usage": self.metrics["memory_usage"][-1]["value"] if self.metrics["memory_usage"] else 0,
-            "cpu_usage": self.metrics["cpu_usage"][-1]["value"] if self.metrics["cpu_usage"] else 0,
+            "memory_usage": self.metrics["memory_usage"].last() or 0,
+            "peak_memory_usage": self.metrics["memory_usage"].maximum or 0,
+            "cpu_usage": self.metrics["cpu_usage"].last() or 0,
+            "average_cpu_usage": self.metrics["cpu_usage"].mean(),
+            "thread_count": int(self.metrics["thread_count"].last() or 0),
+            "open_files": int(self.metrics["open_files"].last() or 0),
+            "io_read_rate": (self.metrics["io_read_bytes"].last() or 0) / self.sample_interval,
+            "io_write_rate": (self.metrics["io_write_bytes"].last() or 0) / self.sample_interval,
             "usage_stats": self.metrics["usage_stats"],
-            "error_count": len(self.metrics["errors"]),
-            "average_response_time": sum(r["duration"] for r in self.metrics["response_times"]) / len(self.metrics["response_times"]) if self.metrics["response_times"] else 0
+            "error_count": self.metrics["error_count"],
+            "average_response_time": self.metrics["response_times"].mean(),
+            "latencies": {name: histogram.summary() for name, histogram in self.histograms.items()},
+            "self_times": dict(self.self_times),
+            "input_latency": [
+                (size, language, self.input_latency[size, language].summary())
+                for size, language in sorted(self.input_latency, key=self._input_sort_key)
+            ],
+            "stall_count": self.stall_count,
+            "worst_stalls": sorted(self.worst_stalls, reverse=True),
+            "stall_attribution": sorted(
+                ((operation, count, total) for operation, (count, total) in self.stall_attribution.items()),
+                key=lambda item: item[2], reverse=True
+            )
         }
         return report
+        
+    def _input_sort_key(self, key):
+        """Tuş gecikmesi satırlarını boyut kovası, ardından dil sırasına dizer"""
+        labels = [label for _, label in self.INPUT_SIZE_BUCKETS]
+        size, language = key
+        return (labels.index(size) if size in labels else len(labels), language)
+        
+    def get_history_report(self):
+        """Kayıtlı metrik dosyalarından önceki oturumların özetini döndürür"""
+        history = self.metrics_log.load_history()
+        history["latencies"] = {name: histogram.summary() for name, histogram in history.pop("histograms").items()}
+        return history
+
+class _Span:
+    """Tek bir ölçüm aralığı: girişte işlemi açar, çıkışta süresini kaydeder"""
+    __slots__ = ("monitor", "name")
+    
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        
+    def __enter__(self):
+        self.monitor.enter_operation(self.name)
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.monitor.record_response_time(self.name, self.monitor.exit_operation())
+        return False
+
+class Perf:
+    """Sıcak yollar için adlandırılmış ölçüm aralıkları (perf.span / @perf.timed)
+    
+    Aralıklar PerformanceMonitor'ün işlem yığınını kullanır; böylece iç içe
+    aralıklarda alt işlemlerin süresi üst işlemin kendi süresinden düşülür ve
+    takılma ilişkilendirmesi aynı ağaçtan beslenir. İzleyici bağlı değilken
+    span paylaşılan boş bir bağlam döndürür, @timed ise yalnızca bir öznitelik
+    kontrolü yapar.
+    """
+    def __init__(self):
+        self.monitor = None
+        self.enabled = False
+        self._null = contextlib.nullcontext()
+        
+    def attach(self, monitor):
+        """Ölçümleri verilen izleyiciye yönlendirir; None ölçümü kapatır"""
+        self.monitor = monitor
+        self.enabled = monitor is not None
+        
+    def span(self, name):
+        """with perf.span("ad"): bloğunun süresini ölçer"""
+        if not self.enabled:
+            return self._null
+        return _Span(self.monitor, name)
+        
+    def timed(self, name=None):
+        """Fonksiyonun her çağrısını verilen adla (varsayılan: fonksiyon adı) ölçer"""
+        def decorator(func):
+            span_name = name or func.__name__
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                monitor = self.monitor
+                monitor.enter_operation(span_name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    monitor.record_response_time(span_name, monitor.exit_operation())
+            return wrapper
+        return decorator
+
+# Modül genelindeki ölçüm noktası; TextEditor kendi izleyicisini bağlar
+perf = Perf()
+
+class SamplingProfiler:
+    """Bir iş parçacığının yığınını arka plandan sys._current_frames ile örnekler
+    
+    Hedef iş parçacığına izleme kancası kurulmaz; örnekleyici her interval
+    saniyede bir uyanıp yığını okur. Aynı yığınlar sayılarak katlanmış
+    (collapsed) biçimde tutulur: kökten yaprağa "a;b;c" -> örnek sayısı.
+    """
+    def __init__(self, thread_id=None, interval=0.005):
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.interval = interval
+        self.stacks = {}
+        self.samples = 0
+        self.elapsed = 0.0
+        self.thread = None
+        self.stop_event = threading.Event()
+        
+    @property
+    def running(self):
+        """Örnekleyicinin çalışıp çalışmadığı"""
+        return self.thread is not None and self.thread.is_alive()
+        
+    def start(self, duration):
+        """duration saniye boyunca örneklemeye başlar"""
+        if self.running:
+            return
+        self.stacks = {}
+        self.samples = 0
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, args=(duration,), name="perf-profiler")
+        self.thread.daemon = True
+        self.thread.start()
+        
+    def stop(self):
+        """Örneklemeyi süresi dolmadan bitirir"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+            
+    def _run(self, duration):
+        """Süre dolana ya da durdurulana kadar yığın örnekler"""
+        started = time.perf_counter()
+        deadline = started + duration
+        while not self.stop_event.wait(self.interval) and time.perf_counter() < deadline:
+            self._sample()
+        self.elapsed = time.perf_counter() - started
+        
+    def _sample(self):
+        """Hedef iş parçacığının o anki yığınını sayar"""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        stack = ";".join(reversed(names))
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+        
+    def collapsed(self):
+        """flamegraph.pl / speedscope ile açılabilen katlanmış yığın satırları"""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        
+    def write_collapsed(self, path):
+        """Katlanmış yığınları dosyaya yazar"""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(self.collapsed()) + "\n")
+            
+    def top_functions(self, limit=20):
+        """Kendi (yaprak) ve toplam (yığında görünen) örnek sayısına göre en pahalı fonksiyonlar"""
+        own = {}
+        total = {}
+        for stack, count in self.stacks.items():
+            names = stack.split(";")
+            own[names[-1]] = own.get(names[-1], 0) + count
+            for name in set(names):  # Özyinelemeli çağrılar bir kez sayılır
+                total[name] = total.get(name, 0) + count
+        ranked = heapq.nlargest(limit, total, key=lambda name: (own.get(name, 0), total[name]))
+        return [(name, own.get(name, 0), total[name]) for name in ranked]
+
+def compile_search_pattern(query, regex=False, nocase=True):
+    """Arama ifadesini editördeki arama kurallarıyla derler"""
+    flags = re.MULTILINE
+    if nocase:
+        flags |= re.IGNORECASE
+    return re.compile(query if regex else re.escape(query), flags)
+
+class MultiTabSearcher:
+    """Sekme anlık görüntülerinde arayüz iş parçacığı dışında arama yapar"""
+    MAX_LISTED_MATCHES = 1000  # Sekme başına listelenecek en fazla eşleşme
+    
+    def __init__(self, max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tab-search")
+        # tab_id -> (içerik sürümü, arama anahtarı, sonuç)
+        self.cache = {}
+        
+    def get_cached(self, tab_id, version, key):
+        """Sekmenin bu sürümü için önbellekteki sonucu döndürür"""
+        entry = self.cache.get(tab_id)
+        if entry and entry[0] == version and entry[1] == key:
+            return entry[2]
+        return None
+        
+    def store(self, tab_id, version, key, result):
+        """Sekme sonucunu içerik sürümüyle birlikte önbelleğe alır"""
+        self.cache[tab_id] = (version, key, result)
+        
+    def forget(self, tab_id):
+        """Kapatılan sekmenin önbelleğini siler"""
+        self.cache.pop(tab_id, None)
+        
+    def submit(self, snapshots, key):
+        """Anlık görüntüleri eşzamanlı tarar, tab_id -> Future sözlüğü döndürür"""
+        pattern = compile_search_pattern(*key)
+        return {
+            tab_id: self.executor.submit(self.scan, pattern, content)
+            for tab_id, content in snapshots.items()
+        }
+        
+    @classmethod
+    def scan(cls, pattern, content):
+        """Metindeki eşleşmeleri satır/sütun bilgisiyle bulur"""
+        count = 0
+        matches = []
+        line = 1
+        last_pos = 0
+        line_start = 0
+        for match in pattern.finditer(content):
+            start, end = match.span()
+            if start == end:
+                continue
+            count += 1
+            if len(matches) >= cls.MAX_LISTED_MATCHES:
+                continue
+            # Satır numarasını bir önceki eşleşmeden itibaren say
+            newlines = content.count("\n", last_pos, start)
+            if newlines:
+                line += newlines
+                line_start = content.rfind("\n", last_pos, start) + 1
+            last_pos = start
+            line_end = content.find("\n", start)
+            if line_end == -1:
+                line_end = len(content)
+            matches.append((line, start - line_start, end - start, content[line_start:line_end][:200]))
+        return {"count": count, "matches": matches}
+
+class TabHibernator:
+    """Etkin olmayan sekmeleri LRU sırasına göre uyku moduna alma politikası"""
+    def __init__(self, performance_monitor, max_live_tabs=20):
+        self.performance_monitor = performance_monitor
+        self.max_live_tabs = max_live_tabs
+        self.live_tabs = OrderedDict()  # Canlı widget'ı olan sekmeler, en eskiden en yeniye
+        
+    def touch(self, tab_id):
+        """Sekmeyi en son kullanılan olarak işaretler"""
+        self.live_tabs[tab_id] = True
+        self.live_tabs.move_to_end(tab_id)
+        
+    def forget(self, tab_id):
+        """Uyku moduna alınan veya kapatılan sekmeyi listeden çıkarır"""
+        self.live_tabs.pop(tab_id, None)
+        
+    def select_victims(self, current_tab):
+        """Uyku moduna alınması gereken sekmeleri döndürür"""
+        candidates = [tab_id for tab_id in self.live_tabs if tab_id != current_tab]
+        excess = len(self.live_tabs) - self.max_live_tabs
+        
+        # Bellek bütçesi aşıldıysa en az kullanılan sekmeyi de uyut
+        if excess <= 0 and self.performance_monitor.is_over_memory_budget():
+            excess = 1
+        return candidates[:max(0, excess)]
+
+class TabRegistry:
+    """Sekme kimliklerini notebook çerçeveleri ve sekme sırasıyla eşleştirir"""
+    def __init__(self):
+        self.by_frame = {}   # Çerçeve yolu -> tab_id
+        self.frames = {}     # tab_id -> çerçeve yolu
+        self.order = []      # Notebook sırasıyla tab_id listesi
+        self.positions = {}  # tab_id -> sıradaki indeks
+        
+    def __len__(self):
+        return len(self.order)
+        
+    def __iter__(self):
+        return iter(self.order)
+        
+    def add(self, tab_id, frame, index=None):
+        """Yeni sekmeyi kaydeder (varsayılan olarak sona ekler)"""
+        self.by_frame[str(frame)] = tab_id
+        self.frames[tab_id] = str(frame)
+        if index is None or index >= len(self.order):
+            self.positions[tab_id] = len(self.order)
+            self.order.append(tab_id)
+        else:
+            self.order.insert(index, tab_id)
+            self._reindex(index)
+            
+    def remove(self, tab_id):
+        """Kapatılan sekmenin kaydını siler"""
+        index = self.positions.pop(tab_id, None)
+        if index is None:
+            return
+        del self.order[index]
+        del self.by_frame[self.frames.pop(tab_id)]
+        self._reindex(index)
+        
+    def move(self, tab_id, index):
+        """Sürüklenen sekmeyi yeni konumuna taşır"""
+        old_index = self.positions.get(tab_id)
+        if old_index is None or old_index == index:
+            return
+        del self.order[old_index]
+        self.order.insert(index, tab_id)
+        self._reindex(min(old_index, index))
+        
+    def sync_order(self, frame_paths):
+        """Sırayı notebook'taki çerçeve listesinden yeniden oluşturur"""
+        self.order = [self.by_frame[str(frame)] for frame in frame_paths if str(frame) in self.by_frame]
+        self._reindex(0)
+        
+    def tab_id_for_frame(self, frame):
+        """Çerçeveye karşılık gelen tab_id'yi döndürür"""
+        return self.by_frame.get(str(frame)) if frame else None
+        
+    def tab_id_at(self, index):
+        """Sıradaki indekse karşılık gelen tab_id'yi döndürür"""
+        if 0 <= index < len(self.order):
+            return self.order[index]
+        return None
+        
+    def index_of(self, tab_id):
+        """Sekmenin notebook'taki sırasını döndürür"""
+        return self.positions.get(tab_id)
+        
+    def _reindex(self, start):
+        """Belirtilen indeksten itibaren sıra tablosunu günceller"""
+        for index in range(start, len(self.order)):
+            self.positions[self.order[index]] = index
+
+class _Piece:
+    """Parça tablosu ağacının düğümü; alt ağaç uzunluğu ve satır sonu sayısıyla zenginleştirilmiş
+    
+    Düğümler oluşturulduktan sonra değiştirilmez; düzenlemeler yalnızca yol
+    üzerindeki düğümleri kopyalar, bu yüzden eski kökler anlık görüntü olarak kalır.
+    """
+    __slots__ = ("buffer", "start", "length", "newlines", "priority", "left", "right", "size", "lines")
+    
+    def __init__(self, buffer, start, length, newlines, priority, left=None, right=None):
+        self.buffer = buffer      # Tampon indeksi
+        self.start = start        # Tampondaki başlangıç
+        self.length = length      # Parçanın karakter sayısı
+        self.newlines = newlines  # Parçadaki satır sonu sayısı
+        self.priority = priority  # Treap yığın önceliği
+        self.left = left
+        self.right = right
+        self.size = length + (left.size if left else 0) + (right.size if right else 0)
+        self.lines = newlines + (left.lines if left else 0) + (right.lines if right else 0)
+        
+    def with_children(self, left, right):
+        """Aynı parçayı yeni alt ağaçlarla döndürür"""
+        return _Piece(self.buffer, self.start, self.length, self.newlines, self.priority, left, right)
+
+class PieceTable:
+    """Değişmez parça tablosu: özgün metin ve eklenen metin tamponları üzerinde treap
+    
+    Ekleme ve silme O(log n) düğüm kopyalar, metni kopyalamaz. Karakter
+    konumu ile (satır, sütun) arasındaki dönüşümler ağaçtaki satır sonu
+    sayıları ve tamponların satır sonu konumları üzerinden O(log n) sürer.
+    """
+    ADD_CHUNK = 1 << 16  # Eklenen metin tamponunun büyütülebileceği en fazla boyut
+    
+    def __init__(self, root, buffers, newline_offsets, rng):
+        self.root = root
+        self.buffers = buffers                  # Yalnızca sona eklenen metin tamponları
+        self.newline_offsets = newline_offsets  # Her tampondaki satır sonu konumları (array('q'))
+        self.rng = rng
+        
+    @classmethod
+    def from_text(cls, text):
+        """Tek parçalı yeni bir tablo oluşturur"""
+        rng = random.Random(len(text))
+        table = cls(None, [], [], rng)
+        if text:
+            buffer = table._add_buffer(text)
+            table.root = _Piece(buffer, 0, len(text), len(table.newline_offsets[buffer]), rng.random())
+        return table
+        
+    def __len__(self):
+        return self.root.size if self.root else 0
+        
+    def line_count(self):
+        """Satır sayısı (son satır sonundan sonraki boş satır dahil)"""
+        return (self.root.lines if self.root else 0) + 1
+        
+    def text(self):
+        """Tablonun tam içeriği"""
+        return self.slice(0, len(self))
+        
+    def slice(self, start, end):
+        """[start, end) aralığındaki metin"""
+        start = max(start, 0)
+        end = min(end, len(self))
+        parts = []
+        if start < end:
+            self._collect(self.root, start, end, parts)
+        return "".join(parts)
+        
+    def insert(self, offset, text):
+        """Metin eklenmiş yeni bir tablo döndürür"""
+        if not text:
+            return self
+        offset = min(max(offset, 0), len(self))
+        left, right = self._split(self.root, offset)
+        buffers, newline_offsets = self.buffers, self.newline_offsets
+        
+        # Yazma sırasında son eklenen parçayı uzatarak parça sayısını küçük tut
+        last = len(buffers) - 1
+        if left is not None and len(buffers[last]) + len(text) <= self.ADD_CHUNK:
+            tail = left
+            while tail.right is not None:
+                tail = tail.right
+            if tail.buffer == last and tail.start + tail.length == len(buffers[last]):
+                start = len(buffers[last])
+                self._extend_buffer(last, text)
+                rest, _ = self._split(left, left.size - tail.length)
+                piece = _Piece(last, tail.start, tail.length + len(text),
+                               tail.newlines + self._count_newlines(last, start, start + len(text)),
+                               tail.priority)
+                return PieceTable(self._merge(self._merge(rest, piece), right), buffers, newline_offsets, self.rng)
+                
+        buffer = self._add_buffer(text)
+        piece = _Piece(buffer, 0, len(text), len(newline_offsets[buffer]), self.rng.random())
+        return PieceTable(self._merge(self._merge(left, piece), right), buffers, newline_offsets, self.rng)
+        
+    def delete(self, start, end):
+        """[start, end) aralığı silinmiş yeni bir tablo döndürür"""
+        start = min(max(start, 0), len(self))
+        end = min(max(end, start), len(self))
+        if start == end:
+            return self
+        left, rest = self._split(self.root, start)
+        _, right = self._split(rest, end - start)
+        return PieceTable(self._merge(left, right), self.buffers, self.newline_offsets, self.rng)
+        
+    def line_start(self, line):
+        """Satırın (1'den başlar) başladığı karakter konumu"""
+        if line <= 1:
+            return 0
+        if line > self.line_count():
+            return len(self)
+        return self._newline_offset(line - 1) + 1
+        
+    def offset_to_position(self, offset):
+        """Karakter konumunu (satır, sütun) çiftine çevirir; satırlar 1'den başlar"""
+        offset = min(max(offset, 0), len(self))
+        line = self._newlines_before(offset) + 1
+        return line, offset - self.line_start(line)
+        
+    def position_to_offset(self, line, column):
+        """(satır, sütun) çiftini karakter konumuna çevirir; taşan değerler sınırlanır"""
+        if line < 1:
+            return 0
+        if line > self.line_count():
+            return len(self)
+        line_end = self.line_start(line + 1) - 1 if line < self.line_count() else len(self)
+        return min(self.line_start(line) + max(column, 0), line_end)
+        
+    def piece_count(self):
+        """Ağaçtaki parça sayısı"""
+        count, stack = 0, [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(child for child in (node.left, node.right) if child)
+        return count
+        
+    def _add_buffer(self, text):
+        """Metni yeni bir tampon olarak ekler ve indeksini döndürür"""
+        self.buffers.append(text)
+        self.newline_offsets.append(array("q", (match.start() for match in re.finditer("\n", text))))
+        return len(self.buffers) - 1
+        
+    def _extend_buffer(self, buffer, text):
+        """Tamponun sonuna ekler; önceki içerik ve konumlar değişmediği için eski tablolar geçerli kalır"""
+        base = len(self.buffers[buffer])
+        self.newline_offsets[buffer].extend(base + match.start() for match in re.finditer("\n", text))
+        self.buffers[buffer] += text
+        
+    def _count_newlines(self, buffer, start, end):
+        """Tamponun [start, end) aralığındaki satır sonu sayısı"""
+        offsets = self.newline_offsets[buffer]
+        return bisect.bisect_left(offsets, end) - bisect.bisect_left(offsets, start)
+        
+    def _collect(self, node, start, end, parts):
+        """Ağacın [start, end) aralığına düşen metin parçalarını sırayla toplar"""
+        while node is not None:
+            left_size = node.left.size if node.left else 0
+            if start < left_size:
+                self._collect(node.left, start, min(end, left_size), parts)
+            piece_end = left_size + node.length
+            if start < piece_end and end > left_size:
+                lo = max(start, left_size) - left_size
+                hi = min(end, piece_end) - left_size
+                parts.append(self.buffers[node.buffer][node.start + lo:node.start + hi])
+            if end <= piece_end:
+                return
+            start, end = max(start - piece_end, 0), end - piece_end
+            node = node.right
+            
+    def _newlines_before(self, offset):
+        """[0, offset) aralığındaki satır sonu sayısı"""
+        node, count = self.root, 0
+        while node is not None:
+            left = node.left
+            left_size = left.size if left else 0
+            if offset <= left_size:
+                node = left
+                continue
+            count += left.lines if left else 0
+            offset -= left_size
+            if offset <= node.length:
+                return count + self._count_newlines(node.buffer, node.start, node.start + offset)
+            count += node.newlines
+            offset -= node.length
+            node = node.right
+        return count
+        
+    def _newline_offset(self, k):
+        """k'inci (1'den başlar) satır sonunun mutlak konumu"""
+        node, base = self.root, 0
+        while node is not None:
+            left = node.left
+            left_lines = left.lines if left else 0
+            if k <= left_lines:
+                node = left
+                continue
+            k -= left_lines
+            base += left.size if left else 0
+            if k <= node.newlines:
+                offsets = self.newline_offsets[node.buffer]
+                pos = offsets[bisect.bisect_left(offsets, node.start) + k - 1]
+                return base + pos - node.start
+            k -= node.newlines
+            base += node.length
+            node = node.right
+        return len(self)
+        
+    def _split(self, node, offset):
+        """Ağacı ilk offset karakter ve geri kalanı olarak ikiye böler (düğümleri kopyalayarak)"""
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if offset <= left_size:
+            if offset == 0 and node.left is None:
+                return None, node
+            left, right = self._split(node.left, offset)
+            return left, node.with_children(right, node.right)
+        offset -= left_size
+        if offset >= node.length:
+            if offset == node.length and node.right is None:
+                return node, None
+            left, right = self._split(node.right, offset - node.length)
+            return node.with_children(node.left, left), right
+        # Bölme noktası parçanın içinde: iki parçaya ayır
+        buffer, start = node.buffer, node.start
+        return (_Piece(buffer, start, offset, self._count_newlines(buffer, start, start + offset), node.priority, node.left),
+                _Piece(buffer, start + offset, node.length - offset,
+                       self._count_newlines(buffer, start + offset, start + node.length), node.priority, None, node.right))
+        
+    @staticmethod
+    def _merge(left, right):
+        """Sıralı iki ağacı birleştirir"""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            return left.with_children(left.left, PieceTable._merge(left.right, right))
+        return right.with_children(PieceTable._merge(left, right.left), right.right)
+
+class LineIndex:
+    """Satır başlangıç konumlarını array('q') içinde tutan, düzenlemelerle güncellenen indeks
+    
+    Bir düzenlemeden sonraki satırların kayması hemen uygulanmaz: kaymanın
+    başladığı satır ve miktarı bekletilir, sonraki düzenleme aynı bölgedeyse
+    (ör. yazma) yalnızca miktar değişir. Böylece bir düzenleme en kötü
+    durumda düzenlemeden sonraki satır sayısıyla orantılı sürer.
+    
+    Sütunlar Tk birimleriyle verilir ve döndürülür: Tcl 8.6 BMP dışındaki
+    bir karakteri (ör. emoji) iki birim sayar, Python bir karakter. Bu
+    karakterlerin konumları ayrıca tutulur; içermeyen satırlarda dönüşüm
+    ek maliyetsizdir.
+    """
+    COLUMN_STRINGS = tuple(str(column) for column in range(1024))  # Toplu çevrimde str() yerine
+    ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+    ASTRAL_WIDTH = 2  # BMP dışı bir karakterin Tk sütun birimi (editör Tcl'e sorup ayarlar)
+    
+    def __init__(self, text=""):
+        self.starts = array("q", [0])
+        self.starts.extend(match.end() for match in re.finditer("\n", text))
+        self.astral = array("q", self._astral_offsets(text))  # BMP dışı karakterlerin konumları
+        self.length = len(text)
+        self._shift_from = len(self.starts)  # Bu indeksten itibaren başlangıçlara _shift eklenmemiş
+        self._shift = 0
+        
+    def line_count(self):
+        """Satır sayısı"""
+        return len(self.starts)
+        
+    def line_start(self, line):
+        """Satırın (1'den başlar) başladığı karakter konumu"""
+        index = min(max(line, 1), len(self.starts)) - 1
+        start = self.starts[index]
+        return start + self._shift if index >= self._shift_from else start
+        
+    def offset(self, line, column):
+        """(satır, sütun) çiftini karakter konumuna çevirir; Tk gibi taşan değerleri sınırlar"""
+        if line < 1:
+            return 0
+        if line > len(self.starts):
+            return self.length
+        line_start = self.line_start(line)
+        line_end = self.line_start(line + 1) - 1 if line < len(self.starts) else self.length
+        column = max(column, 0)
+        extra = self.ASTRAL_WIDTH - 1
+        if extra and self.astral:
+            # Sütunun içinden geçtiği BMP dışı karakterler birer karakter sayılır
+            position = line_start
+            for astral in self.astral[bisect.bisect_left(self.astral, line_start):bisect.bisect_left(self.astral, line_end)]:
+                if column <= astral - position:
+                    break
+                column -= astral - position + 1 + extra
+                position = astral + 1
+                if column <= 0:
+                    return position
+            return min(position + column, line_end)
+        return min(line_start + column, line_end)
+        
+    def position(self, offset):
+        """Karakter konumunu (satır, Tk sütunu) çiftine çevirir; satırlar 1'den başlar"""
+        offset = min(max(offset, 0), self.length)
+        line = self._line_of(offset) + 1
+        line_start = self.line_start(line)
+        return line, offset - line_start + self._extra_units(line_start, offset)
+        
+    def to_index(self, offset):
+        """Karakter konumunu Tk 'satır.sütun' indeksine çevirir"""
+        line, column = self.position(offset)
+        return f"{line}.{column}"
+        
+    def to_indices(self, offsets):
+        """Karakter konumu listesini toplu olarak Tk indekslerine çevirir
+        
+        Sıralı girdide (belirteçler) ardışık konumlar çoğunlukla aynı satırda
+        kaldığı için ikili arama yalnızca satır değiştiğinde ve yalnızca
+        geçerli satırın ilerisinde yapılır; sıralı olmayan girdi de doğru
+        çevrilir.
+        """
+        self._flush(len(self.starts))
+        if self.astral and self.ASTRAL_WIDTH > 1:
+            return [self.to_index(offset) for offset in offsets]
+        starts = self.starts
+        count = len(starts)
+        bisect_right = bisect.bisect_right
+        columns = self.COLUMN_STRINGS
+        column_count = len(columns)
+        indices = []
+        append = indices.append
+        line = 0
+        prefix, line_start, next_start = "1.", 0, starts[1] if count > 1 else sys.maxsize
+        for offset in offsets:
+            if not line_start <= offset < next_start:
+                if offset >= line_start:
+                    line = bisect_right(starts, offset, line) - 1
+                else:
+                    line = bisect_right(starts, offset, 0, line) - 1
+                prefix = f"{line + 1}."
+                line_start = starts[line]
+                next_start = starts[line + 1] if line + 1 < count else sys.maxsize
+            column = offset - line_start
+            append(prefix + (columns[column] if column < column_count else str(column)))
+        return indices
+        
+    def apply_edit(self, start, end, text):
+        """[start, end) aralığının text ile değiştirilmesini indekse uygular"""
+        start = min(max(start, 0), self.length)
+        end = min(max(end, start), self.length)
+        first = self._line_of(start)
+        last = self._line_of(end)
+        delta = len(text) - (end - start)
+        self._flush(last + 1)
+        
+        starts = self.starts
+        if delta:
+            if self._shift_from >= len(starts):
+                # Bekleyen kayma yok: düzenlemeden sonrasını beklet
+                self._shift_from, self._shift = last + 1, delta
+            elif self._shift_from - (last + 1) <= len(starts) - self._shift_from:
+                # Düzenleme ile bekleyen bölge arasını kaydır, bekleyen miktarı artır
+                lo, hi = last + 1, self._shift_from
+                starts[lo:hi] = array("q", [value + delta for value in starts[lo:hi]])
+                self._shift += delta
+            else:
+                # Bekleyen bölge daha küçük: onu uygula, kaymayı buradan beklet
+                self._flush(len(starts))
+                self._shift_from, self._shift = last + 1, delta
+                
+        # Silinen satır başlarını eklenen metnin satır başlarıyla değiştir
+        inserted = array("q", (start + match.end() for match in re.finditer("\n", text)))
+        if last > first or inserted:
+            starts[first + 1:last + 1] = inserted
+            self._shift_from += len(inserted) - (last - first)
+        self.length += delta
+        
+        # BMP dışı karakter konumları (genellikle boş; kayma hemen uygulanır)
+        astral = self.astral
+        if astral or not text.isascii():
+            lo = bisect.bisect_left(astral, start)
+            hi = bisect.bisect_left(astral, end)
+            added = array("q", (start + offset for offset in self._astral_offsets(text)))
+            astral[lo:hi] = added
+            tail = lo + len(added)
+            if delta and tail < len(astral):
+                astral[tail:] = array("q", [value + delta for value in astral[tail:]])
+                
+    def _astral_offsets(self, text):
+        """Metindeki BMP dışı karakterlerin konumları"""
+        if text.isascii():
+            return []
+        return [match.start() for match in self.ASTRAL.finditer(text)]
+        
+    def _extra_units(self, start, end):
+        """[start, end) aralığındaki BMP dışı karakterlerin Tk'de kapladığı fazladan birim"""
+        extra = self.ASTRAL_WIDTH - 1
+        if not extra or not self.astral:
+            return 0
+        return extra * (bisect.bisect_left(self.astral, end) - bisect.bisect_left(self.astral, start))
+        
+    def _line_of(self, offset):
+        """Konumu içeren satırın 0 tabanlı indeksi"""
+        starts, pivot = self.starts, self._shift_from
+        if pivot >= len(starts) or offset < starts[pivot] + self._shift:
+            return bisect.bisect_right(starts, offset, 0, pivot) - 1
+        return bisect.bisect_right(starts, offset - self._shift, pivot) - 1
+        
+    def _flush(self, upto):
+        """Bekleyen kaymayı upto indeksine kadar olan başlangıçlara uygular"""
+        lo = self._shift_from
+        if upto > lo:
+            shift, starts = self._shift, self.starts
+            starts[lo:upto] = array("q", [value + shift for value in starts[lo:upto]])
+            self._shift_from = upto
+        if self._shift_from >= len(self.starts):
+            self._shift_from, self._shift = len(self.starts), 0
+
+class Document:
+    """Tk'den bağımsız metin belgesi: içerik, satır indeksi, sürüm ve kayıt durumu
+    
+    Sekmeler metin widget'ındaki her düzenlemeyi belgeye de uygular; böylece
+    vurgulama, arama ve kaydetme ekran olmadan belge üzerinde çalışabilir.
+    İçerik bir PieceTable'da tutulur. Uyku modundaki sekmelerde içerik
+    sıkıştırılmış olarak, oturumdan gelen ve henüz okunmamış sekmelerde hiç
+    tutulmaz (loaded False).
+    """
+    def __init__(self, text="", file_path=None, encoding="utf-8"):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.version = 0        # Her düzenlemede artar
+        self.saved_version = 0  # Diske yazılan (veya diskten okunan) sürüm
+        self._table = PieceTable.from_text(text) if text is not None else None
+        self._compressed = None
+        self._text = text       # Son birleştirilen içerik (düzenlemede geçersiz olur)
+        self._line_index = None # Tk indeks dönüşümleri için, ilk kullanımda oluşturulur
+        
+    def __len__(self):
+        return len(self.table)
+        
+    @property
+    def loaded(self):
+        """İçeriğin bellekte (düz veya sıkıştırılmış) olup olmadığı"""
+        return self._table is not None or self._compressed is not None
+        
+    @property
+    def dirty(self):
+        """Son kayıttan beri düzenleme yapılıp yapılmadığı"""
+        return self.version != self.saved_version
+        
+    @property
+    def table(self):
+        """Belgenin parça tablosu (gerekirse sıkıştırılmış içerikten açılır)"""
+        if self._table is None:
+            text = ""
+            if self._compressed is not None:
+                text = zlib.decompress(self._compressed).decode("utf-8", "surrogatepass")
+                self._compressed = None
+            self._table = PieceTable.from_text(text)
+            self._text = text
+        return self._table
+        
+    @property
+    def text(self):
+        """Belgenin tam içeriği"""
+        if self._text is None:
+            self._text = self.table.text()
+        return self._text
+        
+    @property
+    def line_index(self):
+        """Düzenlemelerle güncel tutulan satır başlangıç indeksi"""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.text)
+        return self._line_index
+        
+    def snapshot(self):
+        """Arka plan işçileri için değişmez anlık görüntü; sonraki düzenlemelerden etkilenmez"""
+        return self.table
+        
+    def set_text(self, text):
+        """İçeriğin tamamını değiştirir"""
+        self._table = PieceTable.from_text(text)
+        self._compressed = None
+        self._line_index = None
+        self._changed(text)
+        
+    def insert(self, offset, text):
+        """Metni verilen karakter konumuna ekler"""
+        if text:
+            self._table = self.table.insert(offset, text)
+            if self._line_index is not None:
+                self._line_index.apply_edit(offset, offset, text)
+            self._changed()
+        
+    def delete(self, start, end):
+        """[start, end) aralığındaki karakterleri siler"""
+        table = self.table.delete(start, end)
+        if table is not self._table:
+            self._table = table
+            if self._line_index is not None:
+                self._line_index.apply_edit(start, end, "")
+            self._changed()
+        
+    def replace(self, start, end, text):
+        """[start, end) aralığını verilen metinle değiştirir"""
+        table = self.table.delete(start, end)
+        if text:
+            table = table.insert(min(max(start, 0), len(table)), text)
+        if table is not self._table:
+            self._table = table
+            if self._line_index is not None:
+                self._line_index.apply_edit(start, end, text)
+            self._changed()
+        
+    def mark_saved(self):
+        """Geçerli sürümü diskteki sürüm olarak işaretler"""
+        self.saved_version = self.version
+        
+    def compress(self):
+        """Uyku modu için içeriği sıkıştırıp parça tablosunu serbest bırakır"""
+        if self._table is not None:
+            self._compressed = zlib.compress(self.text.encode("utf-8", "surrogatepass"), 1)
+            self._table = None
+            self._text = None
+            self._line_index = None
+            
+    def line_count(self):
+        """Belgedeki satır sayısı"""
+        return self.table.line_count()
+        
+    def offset_to_position(self, offset):
+        """Karakter konumunu (satır, sütun) çiftine çevirir; satırlar 1'den başlar"""
+        return self.table.offset_to_position(offset)
+        
+    def position_to_offset(self, line, column):
+        """(satır, sütun) çiftini karakter konumuna çevirir; taşan değerler sınırlanır"""
+        return self.table.position_to_offset(line, column)
+        
+    def line_text(self, line):
+        """Verilen satırın satır sonu olmadan içeriği"""
+        table = self.table
+        return table.slice(table.position_to_offset(line, 0), table.position_to_offset(line, sys.maxsize))
+        
+    def _changed(self, text=None):
+        """Sürümü artırır ve birleştirilmiş içerik önbelleğini geçersiz kılar"""
+        self.version += 1
+        self._text = text
+
+def max_match_length(query, regex=False):
+    """Aramanın eşleşebileceği en uzun metnin karakter sayısı; sınırsızsa None"""
+    if not regex:
+        return len(query)
+    try:
+        from re import _parser as sre_parse  # Python 3.11+
+    except ImportError:
+        import sre_parse
+    try:
+        width = sre_parse.parse(query).getwidth()[1]
+    except Exception:
+        return None
+    return None if width >= sre_parse.MAXREPEAT else width
+
+def stream_replace_file(file_path, query, replacement, regex=False, nocase=True,
+                        encoding="utf-8", chunk_size=1024 * 1024, overlap=4096,
+                        output_path=None, progress=None):
+    """Dosyayı belleğe almadan parça parça okuyarak eşleşmeleri değiştirir
+    
+    Tamponun son `overlap` karakterine uzanan bir eşleşme yazılmaz; tampon
+    eşleşme bu bölgenin gerisinde kalana kadar sonraki parçalarla büyütülür.
+    En uzun eşleşmesi bilinen ifadelerde overlap en az bu uzunluğa çıkarılır,
+    böylece sonuç dosyanın tamamında değiştirmeyle aynıdır. Sınırsız
+    ifadelerde (ör. a+b) parça sonunda henüz eşleşmeyen, overlap'tan uzun bir
+    eşleşme bölünebilir; çağıranlar max_match_length ile bunu denetlemelidir.
+    Çıktı geçici bir dosyaya yazılır ve başarıyla bitince hedefin yerine taşınır.
+    """
+    pattern = compile_search_pattern(query, regex, nocase)
+    max_length = max_match_length(query, regex)
+    if max_length is not None:
+        overlap = max(overlap, max_length + 1)
+    if regex and "\\" in replacement:
+        expand = lambda match: match.expand(replacement)
+    else:
+        expand = lambda match: replacement
+        
+    output_path = output_path or file_path
+    total_bytes = os.path.getsize(file_path)
+    context = min(overlap, 256)  # Geriye bakan ifadeler için tutulan bağlam
+    start_time = time.perf_counter()
+    replacements = 0
+    bytes_read = 0
+    
+    decoder = codecs.getincrementaldecoder(encoding)()
+    encoder = codecs.getincrementalencoder(encoding)()
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output_path)),
+        prefix=f".{os.path.basename(output_path)}.",
+        suffix=".tmp"
+    )
+    try:
+        with open(file_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            pending = ""
+            pos = 0  # pending içinde aramanın devam edeceği konum
+            while True:
+                chunk = src.read(chunk_size)
+                bytes_read += len(chunk)
+                eof = not chunk
+                pending += decoder.decode(chunk, final=eof)
+                
+                # Son `overlap` karakterdeki eşleşmeler bir sonraki parçaya taşabilir
+                limit = len(pending) if eof else max(pos, len(pending) - overlap)
+                parts = []
+                last = pos
+                safe = limit
+                for match in pattern.finditer(pending, pos):
+                    if not eof and match.end() >= limit:
+                        safe = match.start()
+                        break
+                    parts.append(pending[last:match.start()])
+                    parts.append(expand(match))
+                    last = match.end()
+                    replacements += 1
+                    
+                if eof:
+                    parts.append(pending[last:])
+                    dst.write(encoder.encode("".join(parts), final=True))
+                    break
+                    
+                safe = max(safe, last)
+                parts.append(pending[last:safe])
+                dst.write(encoder.encode("".join(parts)))
+                
+                # Yazılan kısmı at, bağlam için son birkaç karakteri tut
+                keep_from = max(0, safe - context)
+                pending = pending[keep_from:]
+                pos = safe - keep_from
+                
+                if progress:
+                    progress(bytes_read, total_bytes)
+                    
+        if os.path.exists(output_path):
+            shutil.copymode(output_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+        
+    if progress:
+        progress(bytes_read, total_bytes)
+        
+    seconds = time.perf_counter() - start_time
+    return {
+        "replacements": replacements,
+        "bytes": bytes_read,
+        "seconds": seconds,
+        "bytes_per_second": bytes_read / seconds if seconds > 0 else 0
+    }
+
+def batch_replace_main(argv=None):
+    """Komut satırından büyük dosyalarda akışlı değiştirme yapar"""
+    parser = argparse.ArgumentParser(
+        prog="editor.py --replace",
+        description="Dosyayı editörde açmadan, parça parça okuyarak eşleşmeleri değiştirir."
+    )
+    parser.add_argument("query", help="Aranacak metin veya düzenli ifade")
+    parser.add_argument("replacement", help="Yerine yazılacak metin")
+    parser.add_argument("file", help="İşlenecek dosya")
+    parser.add_argument("--regex", action="store_true", help="Aramayı düzenli ifade olarak yorumla")
+    parser.add_argument("--case-sensitive", action="store_true", help="Büyük/küçük harf duyarlı ara")
+    parser.add_argument("--encoding", default="utf-8", help="Dosya kodlaması (varsayılan: utf-8)")
+    parser.add_argument("--chunk-size", type=int, default=1024 * 1024, help="Okuma parçası boyutu (bayt)")
+    parser.add_argument("--overlap", type=int, default=4096, help="Parça sınırında bekletilen karakter sayısı (sınırsız ifadelerde en uzun eşleşme)")
+    parser.add_argument("--output", help="Sonucu başka bir dosyaya yaz")
+    args = parser.parse_args(argv)
+    
+    if args.regex and max_match_length(args.query, regex=True) is None:
+        print(
+            f"Uyarı: ifade sınırsız uzunlukta eşleşebilir; {args.overlap} karakterden uzun "
+            f"eşleşmeler parça sınırında bölünebilir (gerekirse --overlap değerini artırın).",
+            file=sys.stderr
+        )
+        
+    try:
+        result = stream_replace_file(
+            args.file,
+            args.query,
+            args.replacement,
+            regex=args.regex,
+            nocase=not args.case_sensitive,
+            encoding=args.encoding,
+            chunk_size=args.chunk_size,
+            overlap=args.overlap,
+            output_path=args.output
+        )
+    except (OSError, re.error, UnicodeError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+        
+    print(
+        f"{result['replacements']} değişiklik, "
+        f"{result['bytes'] / 1024 / 1024:.1f} MB, "
+        f"{result['seconds']:.2f} saniye "
+        f"({result['bytes_per_second'] / 1024 / 1024:.1f} MB/s)"
+    )
+    return 0
+
+class RegexLexer:
+    """Kurallarını tek bir alternasyonda birleştirip metni tek geçişte tarar"""
+    def __init__(self, rules, flags=re.MULTILINE):
+        # rules: (etiket, düzenli ifade) çiftleri, öncelik sırasıyla;
+        # etiketi None olan kurallar metni yalnızca tüketir
+        self.tags = [tag for tag, _ in rules]
+        self.pattern = re.compile(
+            "|".join(f"(?P<t{i}>{pattern})" for i, (_, pattern) in enumerate(rules)),
+            flags
+        )
+        
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        tags = self.tags
+        tokens = []
+        for match in self.pattern.finditer(text):
+            start, end = match.span()
+            tag = tags[int(match.lastgroup[1:])]
+            if start != end and tag is not None:
+                tokens.append((start, end, tag))
+        return tokens
+
+class Language:
+    """Kayıtlı bir dilin algılama kuralları ve vurgulayıcısı"""
+    def __init__(self, name, lexer=None, extensions=(), shebangs=(), sniffer=None):
+        self.name = name
+        self.lexer = lexer              # Saf belirteç üreticisi (tokenize(text) metodu olan nesne)
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.shebangs = tuple(shebangs)
+        self.sniffer = sniffer          # Metin önekini alıp bool döndüren fonksiyon
+
+class LanguageRegistry:
+    """Dilleri uzantı, shebang ve içerik sezgileriyle eşleştirir"""
+    SNIFF_LIMIT = 4096  # Algılamada incelenecek en fazla karakter
+    
+    def __init__(self):
+        self.languages = {}
+        self.by_extension = {}
+        self.sniff_order = []
+        
+    def register(self, language):
+        """Dili ve uzantılarını kaydeder"""
+        self.languages[language.name] = language
+        for ext in language.extensions:
+            self.by_extension[ext] = language.name
+        if language.shebangs or language.sniffer:
+            self.sniff_order.append(language)
+        return language
+        
+    def get(self, name):
+        """Ada göre kayıtlı dili döndürür"""
+        return self.languages.get(name)
+        
+    def detect(self, file_path=None, prefix=""):
+        """Dosya yolundan ve metin önekinden dili bulur, bulunamazsa boş metin döndürür"""
+        if file_path:
+            name = self.by_extension.get(os.path.splitext(file_path)[1].lower())
+            if name:
+                return name
+                
+        prefix = prefix[:self.SNIFF_LIMIT]
+        if prefix.startswith("#!"):
+            first_line = prefix.split("\n", 1)[0]
+            for language in self.sniff_order:
+                if any(re.search(pattern, first_line) for pattern in language.shebangs):
+                    return language.name
+                    
+        for language in self.sniff_order:
+            if language.sniffer and language.sniffer(prefix):
+                return language.name
+        return ""
+
+def offsets_to_indices(text, offsets):
+    """Mutlak karakter konumlarını Tk 'satır.sütun' indekslerine çevirir"""
+    return LineIndex(text).to_indices(offsets)
+
+def group_tokens_by_tag(text, tokens, line_index=None):
+    """Belirteçleri etiket başına Tk indeks listelerine gruplar
+    
+    line_index verilirse (ör. belgenin güncel indeksi) metin yeniden taranmaz.
+    """
+    offsets = []
+    for start, end, _ in tokens:
+        offsets.append(start)
+        offsets.append(end)
+    if line_index is None:
+        line_index = LineIndex(text)
+    indices = line_index.to_indices(offsets)
+    ranges = {}
+    for i, (_, _, tag) in enumerate(tokens):
+        ranges.setdefault(tag, []).extend(indices[2 * i:2 * i + 2])
+    return ranges
+
+class PythonLexer:
+    """Python kodunu standart tokenize modülüyle tek geçişte belirteçlere ayırır"""
+    BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_"))
+    # Yalnızca match/case deyimlerinde anahtar kelime olan adlar
+    SOFT_KEYWORDS = frozenset(("match", "case"))
+    # Yumuşak anahtar kelimeden hemen sonra gelince onu sıradan bir ad yapan işleçler
+    NAME_FOLLOWERS = frozenset(("=", ".", ",", ")", "]", "}", ":", ";")) | frozenset(
+        op + "=" for op in ("+", "-", "*", "/", "//", "%", "**", "@", "&", "|", "^", ">>", "<<", ":")
+    )
+    
+    # Tokenize hatasından sonra hatalı satır için kullanılan basit kurallar
+    fallback = RegexLexer([
+        ("comment", r"#.*$"),
+        ("string", r"[rRbBuUfF]{0,2}(?:\"\"\"[\s\S]*?(?:\"\"\"|\Z)|'''[\s\S]*?(?:'''|\Z)|\"(?:[^\"\\\n]|\\.)*\"?|'(?:[^'\\\n]|\\.)*'?)"),
+        ("keyword", r"\b(?:" + "|".join(keyword.kwlist) + r")\b"),
+        ("number", r"\b\d[\d_]*(?:\.[\d_]*)?(?:[eE][-+]?\d+)?j?\b")
+    ])
+    
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        lines = text.splitlines(keepends=True)
+        line_starts = [0]
+        for line in lines:
+            line_starts.append(line_starts[-1] + len(line))
+            
+        tokens = []
+        first_line = 0
+        while first_line < len(lines):
+            failed_line, unterminated_string = self._tokenize_lines(lines, first_line, line_starts, tokens)
+            if failed_line is None:
+                break
+                
+            # Hatalı satırdan üretilmiş belirteçleri at
+            start = line_starts[failed_line]
+            while tokens and tokens[-1][0] >= start:
+                tokens.pop()
+                
+            # Kapanmamış dize belgenin sonuna kadar sürer; aksi halde yalnızca
+            # hatalı satırı basit kurallarla vurgula ve sonraki satırdan devam et
+            end = len(text) if unterminated_string else line_starts[failed_line + 1]
+            for token_start, token_end, tag in self.fallback.tokenize(text[start:end]):
+                tokens.append((start + token_start, start + token_end, tag))
+            if unterminated_string:
+                break
+            first_line = failed_line + 1
+        return tokens
+        
+    def _tokenize_lines(self, lines, first_line, line_starts, tokens):
+        """Satırları first_line'dan itibaren belirteçlere ayırır
+        
+        Hata olursa (hatalı satır, kapanmamış dize mi) döndürür.
+        """
+        iterator = iter(lines[first_line:])
+        keywords = keyword.kwlist
+        builtin_names = self.BUILTINS
+        expect = None       # "def"/"class" sonrası beklenen ad etiketi
+        in_decorator = False
+        line_begins = True  # Mantıksal satırın başında mıyız
+        soft = None         # Satır ":" ile biterse eklenecek match/case belirteçleri
+        soft_word = None    # Bekleyen yumuşak anahtar kelime
+        after_soft = False  # Önceki belirteç yumuşak anahtar kelime mi
+        last_op = None      # Mantıksal satırdaki son işleç
+        string_until = -1   # Kapanmamış tek satırlık dizenin bittiği konum
+        previous = None     # Önceki belirteç (tür, metin, başlangıç, bitiş)
+        try:
+            for tok_type, tok_string, (srow, scol), (erow, ecol), _ in tokenize.generate_tokens(lambda: next(iterator, "")):
+                row = first_line + srow - 1
+                if tok_type in (tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT):
+                    if tok_type == tokenize.NEWLINE:
+                        # match/case yalnızca ":" ile biten deyimlerde anahtar kelimedir
+                        if soft and last_op == ":":
+                            for token in soft:
+                                bisect.insort(tokens, token)
+                        soft = None
+                        last_op = None
+                    line_begins = True
+                    in_decorator = False
+                    previous = None
+                    continue
+                if tok_type == tokenize.ENDMARKER:
+                    break
+                    
+                start = line_starts[row] + scol
+                end = line_starts[first_line + erow - 1] + ecol
+                if start < string_until:
+                    continue  # Kapanmamış dizenin içi
+                if after_soft and tok_type == tokenize.OP and tok_string in self.NAME_FOLLOWERS:
+                    soft = None  # Atama, öznitelik erişimi vb.: sıradan bir ad
+                after_soft = False
+                last_op = tok_string if tok_type == tokenize.OP else None
+                tag = None
+                if tok_type == tokenize.NAME:
+                    if in_decorator:
+                        tag = "decorator"
+                    elif line_begins and tok_string in self.SOFT_KEYWORDS:
+                        soft = [(start, end, "keyword")]
+                        soft_word = tok_string
+                        after_soft = True
+                    elif tok_string == "_" and soft and soft_word == "case":
+                        soft.append((start, end, "keyword"))  # case desenlerindeki joker
+                    elif expect:
+                        tag = expect
+                        expect = None
+                    elif tok_string in keywords:
+                        tag = "keyword"
+                        if tok_string == "def":
+                            expect = "function"
+                        elif tok_string == "class":
+                            expect = "class"
+                    elif tok_string in builtin_names:
+                        tag = "builtin"
+                elif tok_type == tokenize.STRING:
+                    tag = "string"
+                elif tok_type == tokenize.COMMENT:
+                    tag = "comment"
+                elif tok_type == tokenize.NUMBER:
+                    tag = "number"
+                elif tok_type == tokenize.ERRORTOKEN and tok_string in ("'", '"'):
+                    # Kapanmamış tek satırlık dize: önekle birlikte satır sonuna kadar
+                    if (previous and previous[0] == tokenize.NAME and previous[3] == start
+                            and previous[1].lower() in ("r", "b", "u", "f", "br", "rb", "fr", "rf")):
+                        start = previous[2]
+                        if tokens and tokens[-1][0] == start:
+                            tokens.pop()
+                    line = lines[first_line + srow - 1]
+                    end = string_until = line_starts[row] + len(line.rstrip("\r\n"))
+                    tag = "string"
+                elif tok_type == tokenize.OP:
+                    if tok_string == "@" and line_begins:
+                        in_decorator = True
+                        tag = "decorator"
+                    elif in_decorator and tok_string == ".":
+                        tag = "decorator"
+                    else:
+                        in_decorator = False
+                line_begins = False
+                previous = (tok_type, tok_string, start, end)
+                if tok_type != tokenize.NAME:
+                    expect = None
+                
+                if tag:
+                    # Bitişik dekoratör parçalarını tek belirteçte birleştir
+                    if tag == "decorator" and tokens and tokens[-1][2] == "decorator" and tokens[-1][1] == start:
+                        tokens[-1] = (tokens[-1][0], end, tag)
+                    else:
+                        tokens.append((start, end, tag))
+        except tokenize.TokenError as e:
+            # Kapanmamış çok satırlı dize veya parantez: hatanın başladığı satır
+            row = first_line + e.args[1][0] - 1
+            return min(max(row, first_line), len(lines) - 1), "string" in e.args[0]
+        except SyntaxError as e:
+            row = first_line + (e.lineno or 1) - 1
+            return min(max(row, first_line), len(lines) - 1), False
+        return None, False
+
+JS_KEYWORDS = (
+    "break", "case", "catch", "continue", "debugger", "default", "delete", "do", "else",
+    "finally", "for", "function", "if", "in", "instanceof", "new", "return", "switch",
+    "this", "throw", "try", "typeof", "var", "void", "while", "with", "const", "let",
+    "class", "extends", "export", "import", "super", "static", "async", "await", "yield",
+    "of", "true", "false", "null", "undefined"
+)
+
+JS_BUILTINS = (
+    "console", "document", "window", "Math", "Date", "Array", "Object", "String",
+    "Number", "Boolean", "Function", "RegExp", "JSON", "Promise", "Set", "Map",
+    "Error", "TypeError", "ReferenceError", "SyntaxError", "eval", "parseInt",
+    "parseFloat", "isNaN", "isFinite", "decodeURI", "encodeURI", "decodeURIComponent",
+    "encodeURIComponent"
+)
+
+def build_javascript_lexer():
+    """JavaScript için tek geçişli düzenli ifade lexer'ı oluşturur"""
+    return RegexLexer([
+        ("comment", r"//.*$|/\*[\s\S]*?(?:\*/|\Z)"),
+        ("string", r"`(?:[^`\\]|\\[\s\S])*`?|\"(?:[^\"\\\n]|\\.)*\"?|'(?:[^'\\\n]|\\.)*'?"),
+        ("class", r"(?<=\bclass )[A-Za-z_$][\w$]*|(?<=\bnew )[A-Z][\w$]*"),
+        ("function", r"(?<=\bfunction )[A-Za-z_$][\w$]*"),
+        ("keyword", r"\b(?:" + "|".join(JS_KEYWORDS) + r")\b"),
+        ("builtin", r"\b(?:" + "|".join(JS_BUILTINS) + r")\b"),
+        ("function", r"\b[A-Za-z_$][\w$]*(?=\s*\()"),
+        ("number", r"(?<![\w$.])(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|\d[\d_]*(?:\.[\d_]*)?(?:[eE][-+]?\d+)?n?|\.\d[\d_]*)(?![\w$])")
+    ])
+
+class CssLexer:
+    """Satır satır devam ettirilebilen CSS lexer'ı
+    
+    Durum (blok yığını, kip, yorum içinde mi) her satır sonunda döndürülür;
+    böylece değişen satırdan itibaren, durum eskisiyle yeniden örtüşene
+    kadar yeniden taranabilir.
+    """
+    INITIAL_STATE = ((), "prelude", False)
+    
+    # İçinde kural barındıran at-kuralları; diğerleri (@font-face, @page) bildirim bloğu açar
+    NESTING_AT_RULES = frozenset((
+        "media", "supports", "document", "-moz-document", "layer", "container", "scope",
+        "starting-style", "keyframes", "-webkit-keyframes", "-moz-keyframes"
+    ))
+    
+    STRING = r"\"(?:[^\"\\\n]|\\.)*\"?|'(?:[^'\\\n]|\\.)*'?"
+    PRELUDE = re.compile(rf"(?P<comment>/\*)|(?P<string>{STRING})|(?P<at>@[\w-]+)|(?P<punct>[{{}};])|(?P<text>[^/\"'@{{}};]+|[/@])")
+    DECLARATION = re.compile(
+        rf"(?P<comment>/\*)|(?P<string>{STRING}|url\([^)\n]*\)?)|(?P<punct>[{{}};:])"
+        r"|(?P<keyword>!\s*important\b)|(?P<number>#[0-9a-fA-F]{3,8}\b|[-+]?(?:\d+\.?\d*|\.\d+)(?:%|[a-zA-Z]+)?)"
+        r"|(?P<function>[-\w]+(?=\())|(?P<word>-?-?[\w-]+)|(?P<other>\s+|.)"
+    )
+    
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        tokens = []
+        state = self.INITIAL_STATE
+        offset = 0
+        for line in text.split("\n"):
+            line_tokens, state = self.tokenize_line(line, state)
+            for start, end, tag in line_tokens:
+                tokens.append((offset + start, offset + end, tag))
+            offset += len(line) + 1
+        return tokens
+        
+    def tokenize_line(self, line, state):
+        """Tek satırı verilen durumdan başlayarak tarar, (belirteçler, yeni durum) döndürür"""
+        stack, mode, in_comment = state
+        tokens = []
+        pos = 0
+        n = len(line)
+        while pos < n:
+            if in_comment:
+                end = line.find("*/", pos)
+                if end == -1:
+                    tokens.append((pos, n, "comment"))
+                    return tokens, (stack, mode, True)
+                tokens.append((pos, end + 2, "comment"))
+                pos = end + 2
+                in_comment = False
+                continue
+                
+            pattern = self.DECLARATION if mode in ("property", "value") else self.PRELUDE
+            match = pattern.match(line, pos)
+            kind = match.lastgroup
+            start, pos = match.span()
+            
+            if kind == "comment":
+                in_comment = True
+                pos = start
+                continue
+            if kind == "punct":
+                char = match.group()
+                if char == "{":
+                    if mode == "nesting_at":
+                        stack += ("at",)
+                        mode = "prelude"
+                    else:
+                        stack += ("rule",)
+                        mode = "property"
+                elif char == "}":
+                    stack = stack[:-1]
+                    mode = "property" if stack and stack[-1] == "rule" else "prelude"
+                elif char == ";":
+                    if mode == "value":
+                        mode = "property"
+                    elif mode in ("nesting_at", "at"):
+                        mode = "prelude"  # @import, @charset gibi deyimler
+                elif char == ":" and mode == "property":
+                    mode = "value"
+                continue
+                
+            if kind == "at":
+                tokens.append((start, pos, "keyword"))
+                mode = "nesting_at" if match.group()[1:].lower() in self.NESTING_AT_RULES else "at"
+            elif kind == "string":
+                tokens.append((start, pos, "string"))
+            elif kind == "text":
+                if mode == "prelude":
+                    # Baştaki/sondaki boşlukları seçiciye dahil etme
+                    text = match.group()
+                    stripped = text.strip()
+                    if stripped:
+                        left = start + len(text) - len(text.lstrip())
+                        tokens.append((left, left + len(stripped), "selector"))
+            elif kind == "word":
+                tokens.append((start, pos, "property" if mode == "property" else "value"))
+            elif kind in ("keyword", "number", "function"):
+                tokens.append((start, pos, kind))
+        return tokens, (stack, mode, in_comment)
+
+def lex_lines(lexer, lines, first_line, state, stop_states=None, stop_after=0):
+    """Satır satır lexer'ı first_line'dan başlatır
+    
+    stop_states verilirse, stop_after satırından sonra bir satır başı durumu
+    eski durumla aynı olduğunda durur. (satır belirteçleri, yeni durumlar)
+    listelerini döndürür; durumlar her satırın sonundaki durumdur.
+    """
+    line_tokens = []
+    states = []
+    for line_no in range(first_line, len(lines)):
+        tokens, state = lexer.tokenize_line(lines[line_no], state)
+        line_tokens.append(tokens)
+        states.append(state)
+        if stop_states is not None and line_no >= stop_after:
+            old = stop_states(line_no + 1)
+            if old is not None and old == state:
+                break
+    return line_tokens, states
+
+class MarkupLexer:
+    """HTML/XML için tek geçişli durum makinesi
+    
+    Etiketleri, özellikleri, tırnaklı değerleri, yorumları, CDATA, DOCTYPE ve
+    işleme talimatlarını tanır. Gömülü bölümler (ör. <script>, <style>)
+    kayıt defterindeki ilgili dilin lexer'ına devredilir.
+    """
+    TAG_NAME = re.compile(r"</?[A-Za-z_][\w:.\-]*")
+    ATTRIBUTE = re.compile(r"[^\s\"'<>/=]+")
+    VALUE = re.compile(r"\s*=\s*(\"[^\"]*\"?|'[^']*'?|[^\s\"'<>`=]+)?")
+    SPACE = re.compile(r"\s*")
+    
+    # (başlangıç, bitiş, etiket) özel bölümler
+    SECTIONS = (
+        ("<!--", "-->", "comment"),
+        ("<![CDATA[", "]]>", "cdata"),
+        ("<?", "?>", "doctype"),
+        ("<!", ">", "doctype")
+    )
+    
+    def __init__(self, registry=None, embedded=None):
+        self.registry = registry
+        # Etiket adı -> içeriği vurgulayacak dilin adı
+        self.embedded = embedded or {}
+        self.embedded_ends = {
+            name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in self.embedded
+        }
+        
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        tokens = []
+        append = tokens.append
+        n = len(text)
+        pos = 0
+        while True:
+            lt = text.find("<", pos)
+            if lt == -1:
+                break
+                
+            for opener, closer, tag in self.SECTIONS:
+                if text.startswith(opener, lt):
+                    end = text.find(closer, lt + len(opener))
+                    end = n if end == -1 else end + len(closer)
+                    append((lt, end, tag))
+                    pos = end
+                    break
+            else:
+                pos = self._tokenize_tag(text, lt, tokens)
+        return tokens
+        
+    def _tokenize_tag(self, text, lt, tokens):
+        """Bir etiketi özellikleriyle birlikte işler, etiketten sonraki konumu döndürür"""
+        match = self.TAG_NAME.match(text, lt)
+        if not match:
+            return lt + 1  # Metin içindeki tek başına '<'
+            
+        append = tokens.append
+        append((lt, match.end(), "tag"))
+        name = match.group()[1:].lower()
+        closing = name.startswith("/")
+        pos = match.end()
+        n = len(text)
+        
+        while pos < n:
+            pos = self.SPACE.match(text, pos).end()
+            if pos >= n:
+                return n
+            char = text[pos]
+            if char == ">":
+                append((pos, pos + 1, "tag"))
+                pos += 1
+                break
+            if text.startswith("/>", pos):
+                append((pos, pos + 2, "tag"))
+                return pos + 2  # Kendi kendini kapatan etiketin içeriği yok
+            if char == "<":
+                return pos  # Kapanmamış etiket, yeni etiketten devam et
+                
+            attribute = self.ATTRIBUTE.match(text, pos)
+            if not attribute:
+                pos += 1  # Beklenmeyen karakter ('/', tırnak vb.)
+                continue
+            append((attribute.start(), attribute.end(), "attribute"))
+            pos = attribute.end()
+            
+            value = self.VALUE.match(text, pos)
+            if value:
+                if value.group(1):
+                    append((value.start(1), value.end(1), "string"))
+                pos = value.end()
+                
+        if not closing and name in self.embedded:
+            return self._tokenize_embedded(text, pos, name, tokens)
+        return pos
+        
+    def _tokenize_embedded(self, text, pos, name, tokens):
+        """<script>/<style> içeriğini ilgili dilin lexer'ına devreder"""
+        close = self.embedded_ends[name].search(text, pos)
+        end = close.start() if close else len(text)
+        
+        language = self.registry.get(self.embedded[name]) if self.registry else None
+        if language is not None and language.lexer is not None:
+            for start, stop, tag in language.lexer.tokenize(text[pos:end]):
+                tokens.append((pos + start, pos + stop, tag))
+        return end
+
+class JsonScanResult:
+    """JSON taramasının sonucu: belirteçler, ilk hata ve yapısal indeks
+    
+    Yapısal indeks her nesne/dizi için başlangıç ve bitiş konumunu, üst
+    düğümü ve üst düğümdeki anahtarını/sırasını paralel listelerde tutar;
+    katlama ve konum yolu (breadcrumb) bu listelerden hesaplanır.
+    """
+    def __init__(self):
+        self.tokens = []
+        self.error = None    # (konum, mesaj) veya None
+        self.starts = []     # Düğüm başlangıçları (artan sırada)
+        self.ends = []       # Düğüm bitişleri (kapanmamışsa belge sonu)
+        self.parents = []    # Üst düğümün indeksi, kök için -1
+        self.labels = []     # Üst düğümdeki anahtar veya [sıra]
+        
+    def path_at(self, offset):
+        """Konumu içeren iç içe düğümlerin etiket yolunu döndürür"""
+        node = bisect.bisect_right(self.starts, offset) - 1
+        while node >= 0 and self.ends[node] < offset:
+            node = self.parents[node]
+        path = []
+        while node >= 0:
+            path.append(self.labels[node])
+            node = self.parents[node]
+        path.reverse()
+        return path
+        
+    def fold_ranges(self):
+        """Katlanabilir (başlangıç, bitiş) aralıklarını döndürür"""
+        return list(zip(self.starts, self.ends))
+        
+    def convert_offsets(self, data):
+        """Bayt konumlarını karakter konumlarına çevirir (ASCII dışı UTF-8 veri için)"""
+        if data.isascii():
+            return
+        # Bütün konumlar ASCII karakterlerin üzerinde olduğundan parça parça çözülebilir
+        offsets = sorted({offset for token in self.tokens for offset in token[:2]}
+                         | set(self.starts) | set(self.ends)
+                         | ({self.error[0]} if self.error else set()))
+        mapping = {}
+        chars = 0
+        previous = 0
+        for offset in offsets:
+            chars += len(data[previous:offset].decode("utf-8", "replace"))
+            mapping[offset] = chars
+            previous = offset
+        self.tokens = [(mapping[start], mapping[end], tag) for start, end, tag in self.tokens]
+        self.starts = [mapping[offset] for offset in self.starts]
+        self.ends = [mapping[offset] for offset in self.ends]
+        if self.error:
+            self.error = (mapping[self.error[0]], self.error[1])
+
+class JsonLexer:
+    """JSON'u tek geçişte belirteçlere ayırır, doğrular ve yapısal indeks çıkarır
+    
+    Hem str hem de dosyadan okunmuş ham bayt verisi üzerinde çalışır; bu
+    sayede büyük dosyalar arayüz iş parçacığı dışında taranabilir.
+    """
+    WORKER_THRESHOLD = 1024 * 1024       # Bu boyutun üstü arka planda taranır (karakter)
+    HIGHLIGHT_LIMIT = 16 * 1024 * 1024   # Bu boyutun üstünde yalnızca doğrulama ve indeks
+    
+    # Anahtarlar, ardından ':' gelen dizelerdir; boş "key" grubu bunu işaretler
+    STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+    TOKEN_PATTERN = (
+        r'[ \t\r\n]*(?:'
+        r'(?P<punct>[{}\[\]:,])'
+        r'|(?P<string>' + STRING + r')(?:(?=[ \t\r\n]*:)(?P<key>))?'
+        r'|(?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)'
+        r'|(?P<boolean>true|false)'
+        r'|(?P<null>null)'
+        r'|(?P<invalid>"[^"\n]*|[^ \t\r\n{}\[\]:,"]+))'
+    )
+    STR_TOKEN = re.compile(TOKEN_PATTERN)
+    BYTES_TOKEN = re.compile(TOKEN_PATTERN.encode("ascii"))
+    
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        return self.scan(text).tokens
+        
+    def scan(self, data, with_tokens=True):
+        """str veya bytes veriyi tarar ve JsonScanResult döndürür"""
+        result = JsonScanResult()
+        is_bytes = isinstance(data, (bytes, bytearray))
+        pattern = self.BYTES_TOKEN if is_bytes else self.STR_TOKEN
+        add_token = result.tokens.append if with_tokens else None
+        starts, ends, parents, labels = result.starts, result.ends, result.parents, result.labels
+        size = len(data)
+        
+        # Açık düğümler: [düğüm indeksi, nesne mi, son anahtar, eleman sırası]
+        stack = []
+        expect = "value"  # value, value_or_end, key, key_or_end, colon, comma, done
+        error = None
+        
+        matches = pattern.finditer(data)
+        for match in matches:
+            kind = match.lastgroup
+            if kind == "punct":
+                start, end = match.span(kind)
+                char = data[start:end] if not is_bytes else data[start:end].decode("ascii")
+                if char == ",":
+                    if expect != "comma" or not stack:
+                        error = (start, "Beklenmeyen ','")
+                        break
+                    top = stack[-1]
+                    top[3] += 1
+                    expect = "key" if top[1] else "value"
+                elif char == ":":
+                    if expect != "colon":
+                        error = (start, "Beklenmeyen ':'")
+                        break
+                    expect = "value"
+                elif char == "{" or char == "[":
+                    if expect != "value" and expect != "value_or_end":
+                        error = (start, "Beklenmeyen '%s'" % char)
+                        break
+                    if stack:
+                        top = stack[-1]
+                        parents.append(top[0])
+                        labels.append(top[2] if top[1] else "[%d]" % top[3])
+                    else:
+                        parents.append(-1)
+                        labels.append("$")
+                    starts.append(start)
+                    ends.append(size)
+                    is_object = char == "{"
+                    stack.append([len(starts) - 1, is_object, None, 0])
+                    expect = "key_or_end" if is_object else "value_or_end"
+                else:
+                    if (not stack or stack[-1][1] != (char == "}")
+                            or expect not in ("comma", "key_or_end", "value_or_end")):
+                        error = (start, "Beklenmeyen '%s'" % char)
+                        break
+                    ends[stack.pop()[0]] = end
+                    expect = "comma" if stack else "done"
+                continue
+                
+            if kind is None:
+                continue  # Belge sonundaki boşluk
+            start, end = match.span("string" if kind == "key" else kind)
+            if kind == "invalid":
+                error = (start, "Geçersiz değer")
+                break
+            if add_token:
+                add_token((start, end, kind))
+                
+            if expect == "done":
+                error = (start, "Belge sonundan sonra fazladan içerik")
+                break
+            if kind == "key" or (kind == "string" and (expect == "key" or expect == "key_or_end")):
+                if expect != "key" and expect != "key_or_end":
+                    error = (start, "Beklenmeyen anahtar")
+                    break
+                stack[-1][2] = data[start + 1:end - 1]
+                expect = "colon"
+            elif expect != "value" and expect != "value_or_end":
+                error = (start, "Beklenmeyen değer")
+                break
+            else:
+                expect = "comma" if stack else "done"
+        else:
+            if stack:
+                error = (size, "Kapanmamış '%s'" % ("{" if stack[-1][1] else "["))
+            elif expect != "done":
+                error = (size, "Boş belge")
+        result.error = error
+        
+        # İlk hatadan sonra yalnızca vurgulama için belirteçleri topla
+        if error is not None and add_token:
+            for match in matches:
+                kind = match.lastgroup
+                if kind is not None and kind != "punct" and kind != "invalid":
+                    start, end = match.span("string" if kind == "key" else kind)
+                    add_token((start, end, kind))
+                    
+        if is_bytes:
+            result.labels = [
+                label.decode("utf-8", "replace") if isinstance(label, (bytes, bytearray)) else label
+                for label in labels
+            ]
+            result.convert_offsets(data)
+        return result
+
+def analyze_structured_source(lexer, content=None, file_path=None):
+    """Metni veya dosyayı tarar; (sonuç, etiket -> Tk indeksleri) döndürür
+    
+    Tk'ye dokunmadığı için arka plan işçisinde çalışabilir. Dosya verildiğinde
+    ham bayt üzerinde taranır ve konumlar karakter konumlarına çevrilir.
+    """
+    if file_path is not None:
+        with open(file_path, "rb") as file:
+            data = file.read()
+        if data.startswith(codecs.BOM_UTF8):
+            data = data[len(codecs.BOM_UTF8):]
+        with_tokens = len(data) <= JsonLexer.HIGHLIGHT_LIMIT
+        result = lexer.scan(data, with_tokens=with_tokens)
+        # Belirteçlerin satır/sütun karşılıkları için metin yalnızca vurgulanacaksa çözülür
+        content = data.decode("utf-8", "replace") if with_tokens else ""
+    else:
+        result = lexer.scan(content, with_tokens=len(content) <= JsonLexer.HIGHLIGHT_LIMIT)
+    return result, group_tokens_by_tag(content, result.tokens)
+
+class MarkdownLexer:
+    """Markdown'u önce bloklara ayırıp satır içi biçimleri yalnızca metin bloklarında tarar
+    
+    Blok geçişi satır satır ilerler (çitli kod, başlık, liste, alıntı,
+    paragraf); bilinen dil etiketli çitli kod blokları kayıt defterindeki
+    lexer'a devredilir.
+    """
+    FENCE = re.compile(r" {0,3}(`{3,}|~{3,})[ \t]*([^\s`]*)")
+    HEADING = re.compile(r" {0,3}#{1,6}(?:[ \t]|$)")
+    SETEXT = re.compile(r" {0,3}(?:=+|-+)[ \t]*$")
+    BREAK = re.compile(r" {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+    QUOTE = re.compile(r" {0,3}>[ \t]?")
+    LIST = re.compile(r" {0,3}(?:[-*+]|\d{1,9}[.)])(?:[ \t]+|$)")
+    
+    INLINE = RegexLexer([
+        (None, r"\\[\\`*_{}\[\]()#+\-.!<>|~]"),  # Kaçış dizileri yalnızca tüketilir
+        ("code", r"(?P<ticks>`+)(?!`)[\s\S]*?[^`](?P=ticks)(?!`)"),
+        ("link", r"<(?:https?|ftp|mailto):[^\s>]+>|!?\[[^\]\n]*\](?:\([^)\s]*(?:[ \t]+\"[^\"\n]*\")?\)|\[[^\]\n]*\])"),
+        ("bold", r"\*\*(?=\S)[\s\S]*?\S\*\*|(?<!\w)__(?=\S)[\s\S]*?\S__(?!\w)"),
+        ("italic", r"\*(?=[^\s*])(?:[^*\n]*[^\s*\\])?\*|(?<!\w)_(?=[^\s_])(?:[^_\n]*[^\s_\\])?_(?!\w)")
+    ])
+    
+    # Dil etiketi -> kayıt defterindeki dil adı (uzantı dışındaki takma adlar)
+    FENCE_ALIASES = {"py": "python", "python3": "python", "js": "javascript", "node": "javascript",
+                     "bash": "shell", "sh": "shell", "zsh": "shell", "console": "shell", "yml": "yaml"}
+    
+    def __init__(self, registry=None):
+        self.registry = registry
+        
+    def fence_language(self, info):
+        """Çit bilgi dizesinden kayıtlı dili bulur"""
+        if not self.registry or not info:
+            return None
+        name = info.lower().lstrip(".{").rstrip("}")
+        name = self.FENCE_ALIASES.get(name, name)
+        language = self.registry.get(name)
+        if language is None:
+            language = self.registry.get(self.registry.by_extension.get("." + name, ""))
+        return language
+        
+    def tokenize(self, text):
+        """Metni (başlangıç, bitiş, etiket) belirteçlerine ayırır"""
+        tokens = []
+        append = tokens.append
+        paragraph = None   # Satır içi taranacak açık bloğun [başlangıç, bitiş] konumları
+        fence = None       # Açık çitli kod bloğu: (çit, içerik başlangıcı, dil)
+        offset = 0
+        
+        def close_paragraph():
+            if paragraph is not None:
+                start, end = paragraph
+                for token_start, token_end, tag in self.INLINE.tokenize(text[start:end]):
+                    append((start + token_start, start + token_end, tag))
+                    
+        for line in text.split("\n"):
+            line_start = offset
+            line_end = offset + len(line)
+            offset = line_end + 1
+            
+            if fence is not None:
+                marker, content_start, language = fence
+                stripped = line.strip()
+                if stripped.startswith(marker) and stripped == marker[0] * len(stripped):
+                    self._tokenize_code(text, content_start, line_start, language, tokens)
+                    append((line_start, line_end, "code"))
+                    fence = None
+                continue
+                
+            match = self.FENCE.match(line)
+            if match and not (match.group(1)[0] == "`" and "`" in line[match.end():]):
+                close_paragraph()
+                paragraph = None
+                append((line_start, line_end, "code"))
+                fence = (match.group(1), offset, self.fence_language(match.group(2)))
+                continue
+                
+            if not line.strip():
+                close_paragraph()
+                paragraph = None
+                continue
+                
+            if self.HEADING.match(line):
+                close_paragraph()
+                paragraph = None
+                append((line_start, line_end, "heading"))
+                continue
+                
+            if paragraph is not None and self.SETEXT.match(line):
+                # Üstteki paragraf başlık olur
+                append((paragraph[0], line_end, "heading"))
+                paragraph = None
+                continue
+                
+            if self.BREAK.match(line):
+                close_paragraph()
+                paragraph = None
+                append((line_start, line_end, "comment"))
+                continue
+                
+            quote = self.QUOTE.match(line)
+            if quote:
+                close_paragraph()
+                append((line_start, line_end, "quote"))
+                paragraph = [line_start + quote.end(), line_end]
+                continue
+                
+            item = self.LIST.match(line)
+            if item:
+                close_paragraph()
+                append((line_start, line_start + item.end(), "list"))
+                paragraph = [line_start + item.end(), line_end]
+                continue
+                
+            # Paragraf veya devam satırı
+            if paragraph is None:
+                paragraph = [line_start, line_end]
+            else:
+                paragraph[1] = line_end
+                
+        if fence is not None:
+            # Kapanmamış çit belge sonuna kadar sürer
+            self._tokenize_code(text, fence[1], len(text), fence[2], tokens)
+        else:
+            close_paragraph()
+        return tokens
+        
+    @staticmethod
+    def _tokenize_code(text, start, end, language, tokens):
+        """Çitli kod içeriğini dilin lexer'ına devreder, yoksa düz kod olarak işaretler"""
+        if start >= end:
+            return
+        if language is not None and language.lexer is not None:
+            for token_start, token_end, tag in language.lexer.tokenize(text[start:end]):
+                tokens.append((start + token_start, start + token_end, tag))
+        else:
+            tokens.append((start, end, "code"))
+
+def apply_tag_ranges(text_widget, ranges, batch=20000):
+    """Etiket -> indeks listesi eşlemesini etiket başına toplu tag_add ile uygular
+    
+    batch, tek Tcl komutuna verilecek en fazla indeks sayısıdır.
+    """
+    calls = 0
+    for tag, indices in ranges.items():
+        for i in range(0, len(indices), batch):
+            text_widget.tag_add(tag, *indices[i:i + batch])
+            calls += 1
+    return calls
+
+def _sniff_json(prefix):
+    stripped = prefix.lstrip()
+    return stripped[:1] in ("{", "[") and re.match(r'[{\[]\s*("|\{|\[|\]|\}|-?\d|true|false|null)', stripped) is not None
+
+def build_language_registry():
+    """Editörün bildiği dilleri içeren kayıt defterini oluşturur"""
+    registry = LanguageRegistry()
+    
+    registry.register(Language(
+        "python", lexer=PythonLexer(),
+        extensions=(".py", ".pyw", ".pyi"), shebangs=(r"python[\d.]*\b",),
+        sniffer=lambda prefix: re.search(r"^(from\s+[\w.]+\s+import\s|import\s+\w+\s*$|def\s+\w+\(.*\):|class\s+\w+.*:\s*$)", prefix, re.MULTILINE) is not None
+    ))
+    registry.register(Language(
+        "html", lexer=MarkupLexer(registry, {"script": "javascript", "style": "css"}),
+        extensions=(".html", ".htm", ".xhtml"),
+        sniffer=lambda prefix: re.match(r"\s*(<!DOCTYPE\s+html|<html)", prefix, re.IGNORECASE) is not None
+    ))
+    registry.register(Language(
+        "xml", lexer=MarkupLexer(registry),
+        extensions=(".xml", ".svg", ".xsd", ".xsl", ".plist"),
+        sniffer=lambda prefix: prefix.lstrip().startswith("<?xml")
+    ))
+    registry.register(Language("css", lexer=CssLexer(), extensions=(".css",)))
+    registry.register(Language(
+        "javascript", lexer=build_javascript_lexer(),
+        extensions=(".js", ".mjs", ".cjs"), shebangs=(r"\bnode\b",)
+    ))
+    registry.register(Language("json", lexer=JsonLexer(), extensions=(".json", ".geojson"), sniffer=_sniff_json))
+    registry.register(Language(
+        "markdown", lexer=MarkdownLexer(registry),
+        extensions=(".md", ".markdown")
+    ))
+    
+    registry.register(Language(
+        "yaml",
+        lexer=RegexLexer([
+            ("comment", r"(?:^|(?<=\s))#.*$"),
+            ("keyword", r"^(?:---|\.\.\.)\s*$"),
+            ("operator", r"^[ \t]*-(?=[ \t])"),
+            ("key", r"^[ \t]*[\w.\-\"' ]+?(?=:(?:[ \t]|$))|(?<=-[ \t])[\w.\-\"'][\w.\-\"' ]*?(?=:(?:[ \t]|$))"),
+            ("string", r"\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\n]|'')*'"),
+            ("variable", r"[&*][\w\-]+"),
+            ("boolean", r"\b(?:true|false|yes|no|on|off|True|False)\b"),
+            ("null", r"\b(?:null|Null|NULL)\b|~"),
+            ("number", r"(?<![\w.])[-+]?(?:0x[0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?![\w.])")
+        ]),
+        extensions=(".yaml", ".yml"),
+        sniffer=lambda prefix: prefix.startswith("---\n") or prefix.startswith("%YAML")
+    ))
+    registry.register(Language(
+        "toml",
+        lexer=RegexLexer([
+            ("comment", r"#.*$"),
+            ("class", r"^[ \t]*\[\[?[^\]\n]+\]\]?"),
+            ("key", r"^[ \t]*[\w.\-\"']+(?=[ \t]*=)"),
+            ("string", r"\"\"\"[\s\S]*?\"\"\"|'''[\s\S]*?'''|\"(?:[^\"\\\n]|\\.)*\"|'[^'\n]*'"),
+            ("boolean", r"\b(?:true|false)\b"),
+            ("number", r"\b\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[-+]\d{2}:\d{2})?)?|(?<![\w.])[-+]?(?:0x[0-9a-fA-F_]+|0o[0-7_]+|0b[01_]+|\d[\d_]*(?:\.[\d_]+)?(?:[eE][-+]?\d+)?|inf|nan)(?![\w.])")
+        ]),
+        extensions=(".toml",)
+    ))
+    registry.register(Language(
+        "ini",
+        lexer=RegexLexer([
+            ("comment", r"^[ \t]*[;#].*$"),
+            ("class", r"^[ \t]*\[[^\]\n]+\]"),
+            ("key", r"^[ \t]*[^=:\s\[;#][^=:\n]*?(?=[ \t]*[=:])"),
+            ("string", r"\"[^\"\n]*\""),
+            ("number", r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])")
+        ]),
+        extensions=(".ini", ".cfg", ".conf", ".properties", ".editorconfig"),
+        sniffer=lambda prefix: re.match(r"(?:\s*[;#].*\n)*\s*\[[\w .\-:\"]+\]\s*\n\s*[\w.\-]+\s*[=:]", prefix) is not None
+    ))
+    registry.register(Language(
+        "sql",
+        lexer=RegexLexer([
+            ("comment", r"--.*$|/\*[\s\S]*?\*/"),
+            ("string", r"'(?:[^']|'')*'"),
+            ("variable", r"\"[^\"\n]*\"|`[^`\n]*`|[:@$]\w+"),
+            ("keyword", r"(?i:\b(?:select|from|where|insert|into|values|update|set|delete|create|alter|drop|table|index|view|"
+                        r"primary|foreign|key|references|constraint|unique|not|null|and|or|in|is|like|between|exists|"
+                        r"join|inner|left|right|outer|full|cross|on|as|group|by|order|having|limit|offset|union|all|"
+                        r"distinct|case|when|then|else|end|begin|commit|rollback|transaction|default|with|returning|"
+                        r"asc|desc|if)\b)"),
+            ("builtin", r"(?i:\b(?:count|sum|avg|min|max|coalesce|cast|now|lower|upper|length|substr|"
+                        r"integer|int|bigint|smallint|text|varchar|char|boolean|real|float|double|numeric|decimal|date|"
+                        r"timestamp|blob)\b)"),
+            ("number", r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])"),
+            ("operator", r"<>|!=|<=|>=|\|\||[=<>+\-*/%]")
+        ]),
+        extensions=(".sql",),
+        sniffer=lambda prefix: re.match(r"(?:\s*--.*\n)*\s*(?:SELECT\s+[\s\S]*?\bFROM\b|CREATE\s+(?:TABLE|INDEX|VIEW)\b|INSERT\s+INTO\b)", prefix, re.IGNORECASE) is not None
+    ))
+    registry.register(Language(
+        "shell",
+        lexer=RegexLexer([
+            ("comment", r"(?:^|(?<=[\s;]))#.*$"),
+            ("string", r"\"(?:[^\"\\]|\\.)*\"|'[^']*'"),
+            ("variable", r"\$(?:\{[^}\n]*\}|\w+|[@*#?$!\d])"),
+            ("keyword", r"\b(?:if|then|else|elif|fi|for|while|until|do|done|case|esac|in|function|select|return|"
+                        r"break|continue|local|export|readonly|declare|source|exit|trap|shift)\b"),
+            ("builtin", r"\b(?:echo|printf|read|cd|pwd|test|set|unset|eval|exec|true|false|alias|type|"
+                        r"getopts|wait|kill|let)\b"),
+            ("function", r"^[ \t]*[\w\-]+(?=[ \t]*\(\)[ \t]*\{?)"),
+            ("number", r"(?<![\w.\-])\d+(?![\w.])"),
+            ("operator", r"&&|\|\||[|&;<>]")
+        ]),
+        extensions=(".sh", ".bash", ".zsh", ".ksh"), shebangs=(r"\b(?:ba|z|k|da)?sh\b",)
+    ))
+    registry.register(Language(
+        "log",
+        lexer=RegexLexer([
+            ("number", r"^\[?\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[-+]\d{2}:?\d{2})?\]?"),
+            ("error", r"\b(?:FATAL|CRITICAL|ERROR|Traceback)\b.*$"),
+            ("warning", r"\b(?:WARN|WARNING)\b"),
+            ("keyword", r"\b(?:INFO|NOTICE)\b"),
+            ("comment", r"\b(?:DEBUG|TRACE)\b"),
+            ("string", r"\"(?:[^\"\\\n]|\\.)*\"")
+        ]),
+        extensions=(".log",),
+        sniffer=lambda prefix: len(re.findall(r"^\[?\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}", prefix, re.MULTILINE)) >= 2
+    ))
+    return registry
 
 class TextEditor:  
+    # Tuş gecikmesi ölçülmeyen değiştirici tuşlar
+    MODIFIER_KEYS = frozenset((
+        "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R",
+        "Meta_L", "Meta_R", "Super_L", "Super_R", "Caps_Lock", "Num_Lock", "ISO_Level3_Shift"
+    ))
+    
     def __init__(self, root):  
         # Ana pencere ayarları
         self.root = root  
@@ -150,9 +2548,12 @@ class TextEditor:
         
         # Sekme yönetimi için değişkenler
         self.tabs = {}  # Açık sekmeler
+        self.tab_registry = TabRegistry()  # Çerçeve/sıra -> tab_id eşlemeleri
+        self.language_registry = build_language_registry()  # Vurgulanabilir diller
         self.current_tab = None  # Aktif sekme
         self.tab_counter = 0  # Sekme sayacı
         self.last_directory = None  # Son kullanılan dizin
+        self.session_file = 'editor_session.json'  # Açık sekmelerin kaydedildiği oturum dosyası
         
         # Notebook widget'ı oluşturma
         self.notebook = ttk.Notebook(self.root)
@@ -170,8 +2571,8 @@ class TextEditor:
         # Tema ve sözdizimi vurgulama ayarları
         self.syntax_highlighting = True  # Sözdizimi vurgulama aktif
         
-        # Sözdizimi vurgulama renkleri
-        self.syntax_colors = {
+        # Sözdizimi vurgulama renkleri (tema başına)
+        light_syntax_colors = {
             "keywords": "#0000FF",      # Anahtar kelimeler - Mavi
             "strings": "#008000",       # Metin dizileri - Yeşil
             "comments": "#808080",      # Yorumlar - Gri
@@ -200,6 +2601,94 @@ class TextEditor:
             "lists": "#000000",         # Listeler - Siyah
             "quotes": "#008000"         # Alıntılar - Yeşil
         }
+        self.syntax_palettes = {
+            "Açık": light_syntax_colors,
+            "Koyu": self.make_syntax_palette(
+                fg="#d4d4d4", keyword="#569cd6", string="#ce9178", comment="#6a9955",
+                function="#dcdcaa", number="#b5cea8", type_="#4ec9b0", builtin="#4ec9b0",
+                attribute="#9cdcfe", heading="#569cd6", link="#3794ff"
+            ),
+            "Sepya": self.make_syntax_palette(
+                fg="#5b4636", keyword="#8b2f00", string="#3f6b2a", comment="#9a8a74",
+                function="#6b3d7a", number="#a0522d", type_="#2f4f7f", builtin="#2e6b6b",
+                attribute="#7a5c2e", heading="#8b2f00", link="#2f4f7f"
+            ),
+            "Monokai": self.make_syntax_palette(
+                fg="#f8f8f2", keyword="#f92672", string="#e6db74", comment="#75715e",
+                function="#a6e22e", number="#ae81ff", type_="#66d9ef", builtin="#66d9ef",
+                attribute="#a6e22e", heading="#f92672", link="#66d9ef"
+            ),
+            "Dracula": self.make_syntax_palette(
+                fg="#f8f8f2", keyword="#ff79c6", string="#f1fa8c", comment="#6272a4",
+                function="#50fa7b", number="#bd93f9", type_="#8be9fd", builtin="#8be9fd",
+                attribute="#50fa7b", heading="#bd93f9", link="#8be9fd"
+            ),
+            "Solarized Dark": self.make_syntax_palette(
+                fg="#839496", keyword="#859900", string="#2aa198", comment="#586e75",
+                function="#268bd2", number="#d33682", type_="#b58900", builtin="#cb4b16",
+                attribute="#b58900", heading="#cb4b16", link="#268bd2"
+            ),
+            "Nord": self.make_syntax_palette(
+                fg="#eceff4", keyword="#81a1c1", string="#a3be8c", comment="#616e88",
+                function="#88c0d0", number="#b48ead", type_="#8fbcbb", builtin="#8fbcbb",
+                attribute="#8fbcbb", heading="#88c0d0", link="#5e81ac"
+            ),
+            "GitHub": self.make_syntax_palette(
+                fg="#24292e", keyword="#d73a49", string="#032f62", comment="#6a737d",
+                function="#6f42c1", number="#005cc5", type_="#6f42c1", builtin="#005cc5",
+                attribute="#6f42c1", heading="#005cc5", link="#032f62"
+            ),
+            "One Dark": self.make_syntax_palette(
+                fg="#abb2bf", keyword="#c678dd", string="#98c379", comment="#5c6370",
+                function="#61afef", number="#d19a66", type_="#e5c07b", builtin="#56b6c2",
+                attribute="#d19a66", heading="#e06c75", link="#61afef"
+            ),
+            "Tokyo Night": self.make_syntax_palette(
+                fg="#a9b1d6", keyword="#bb9af7", string="#9ece6a", comment="#565f89",
+                function="#7aa2f7", number="#ff9e64", type_="#2ac3de", builtin="#7dcfff",
+                attribute="#73daca", heading="#7aa2f7", link="#7dcfff"
+            )
+        }
+        self.syntax_colors = self.syntax_palettes["Açık"]  # Mevcut temanın paleti
+        
+        # Vurgulama etiketi -> palet rengi eşlemesi
+        self.syntax_tag_colors = {
+            "keyword": "keywords",
+            "string": "strings",
+            "comment": "comments",
+            "function": "functions",
+            "number": "numbers",
+            "class": "classes",
+            "decorator": "decorators",
+            "builtin": "builtins",
+            "operator": "operators",
+            "variable": "variables",
+            "tag": "keywords",
+            "attribute": "attributes",
+            "selector": "keywords",
+            "property": "properties",
+            "value": "strings",
+            "key": "keywords",
+            "boolean": "keywords",
+            "null": "keywords",
+            "cdata": "strings",
+            "doctype": "keywords",
+            "heading": "headings",
+            "bold": "bold",
+            "italic": "italic",
+            "code": "code",
+            "link": "links",
+            "list": "lists",
+            "quote": "quotes",
+            "method": "functions",
+            "library": "classes",
+            "constant": "numbers",
+            "parameter": "parameters",
+            "type": "types",
+            "error": "errors",
+            "warning": "warnings",
+            "docstring": "docstrings"
+        }
         
         # Tema renkleri
         self.theme_colors = {
@@ -365,9 +2854,30 @@ class TextEditor:
             }
         }
         
+        # Tema başına derlenmiş etiket stil tablosu
+        self.syntax_styles = {
+            name: self.compile_syntax_styles(name) for name in self.theme_colors
+        }
+        
+        # Tk sütunlarında BMP dışı karakterlerin kaç birim sayıldığı (Tcl 8.6: 2, Tcl 9: 1)
+        LineIndex.ASTRAL_WIDTH = int(self.root.tk.call("string", "length", "\U0001F600"))
+        
         # Performans izleyici
         self.performance_monitor = PerformanceMonitor(self)
+        perf.attach(self.performance_monitor)
         self.performance_monitor.start_monitoring()
+        self.performance_monitor.start_lag_detector(self.root)
+        
+        # Tuş → ekran gecikmesi etiketinin son güncellenme zamanı
+        self._latency_label_updated = 0.0
+        
+        # Etkin olmayan sekmelerin uyku politikası
+        self.tab_hibernator = TabHibernator(self.performance_monitor)
+        
+        # Yardım > Performans menüsünden başlatılan örnekleyici profilleyici
+        self.profiler = None
+        self.last_profile = None  # Son profilin özeti (rapor penceresinde gösterilir)
+        self.text_font = None  # Yazı tipi penceresinde seçilen yazı tipi
         
         # Menü oluşturma  
         self.create_menu()  
@@ -383,47 +2893,90 @@ class TextEditor:
         self.search_text = None
         self.replace_text = None
         
+        # Tüm sekmelerde arama
+        self.tab_searcher = MultiTabSearcher()
+        self.search_all_window = None
+        self.search_all_request = None  # En son başlatılan aramanın anahtarı
+        
+        # Büyük belgelerin (ör. JSON) arka planda taranması
+        self.analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+        
         # İlk temayı uygula
         self.apply_theme(self.current_theme.get())
         
-        # İlk sekmeyi oluştur
-        self.new_tab()
+        # Önceki oturumu geri yükle, yoksa ilk sekmeyi oluştur
+        if not self.restore_session():
+            self.new_tab()
         
         # Sekme sürükle-bırak için değişkenler
         self.drag_data = {"x": 0, "y": 0, "item": None}
         self.notebook.bind("<ButtonPress-1>", self.on_tab_press)
         self.notebook.bind("<ButtonRelease-1>", self.on_tab_release)
         self.notebook.bind("<B1-Motion>", self.on_tab_motion)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        
+        # Bellek bütçesini düzenli olarak kontrol et
+        self.root.after(30000, self.check_memory_budget)
+        
+    @staticmethod
+    def make_syntax_palette(fg, keyword, string, comment, function, number, type_, builtin,
+                            attribute, heading, link):
+        """Temel renklerden tam bir sözdizimi paleti oluşturur"""
+        return {
+            "keywords": keyword,
+            "strings": string,
+            "comments": comment,
+            "functions": function,
+            "numbers": number,
+            "classes": type_,
+            "decorators": function,
+            "builtins": builtin,
+            "operators": fg,
+            "variables": fg,
+            "parameters": fg,
+            "types": type_,
+            "errors": "#f44747",
+            "warnings": "#ffa500",
+            "docstrings": string,
+            "tags": keyword,
+            "attributes": attribute,
+            "selectors": keyword,
+            "properties": attribute,
+            "values": string,
+            "headings": heading,
+            "links": link,
+            "bold": fg,
+            "italic": fg,
+            "code": string,
+            "lists": fg,
+            "quotes": comment
+        }
+
+    def compile_syntax_styles(self, theme_name):
+        """Temanın paletini etiket -> Tk seçenekleri tablosuna derler"""
+        palette = self.syntax_palettes[theme_name]
+        styles = {
+            tag: {"foreground": palette[color_key]}
+            for tag, color_key in self.syntax_tag_colors.items()
+        }
+        styles["current_line"] = {"background": self.theme_colors[theme_name]["current_line_bg"]}
+        return styles
+        
+    def configure_syntax_tags(self, text_widget, theme_name):
+        """Metin alanının etiketlerini temanın stil tablosuyla yapılandırır"""
+        for tag, options in self.syntax_styles[theme_name].items():
+            text_widget.tag_configure(tag, **options)
+
+    @perf.timed("tab_new")
+    def new_tab(self, file_path=None, lazy_state=None, encoding="utf-8"):
+        """Yeni bir sekme oluşturur
         
-    def new_tab(self, file_path=None):
-        """Yeni bir sekme oluşturur"""
+        lazy_state verilirse metin alanı oluşturulmaz; sekme ilk seçildiğinde
+        ensure_tab_loaded ile dosyadan okunur.
+        """
         # Sekme çerçevesi
         frame = ttk.Frame(self.notebook)
         
-        # Metin alanı ve kaydırma çubukları
-        text_frame = tk.Frame(frame)
-        text_frame.pack(expand=True, fill="both")
-        
-        # Dikey kaydırma çubuğu
-        scrollbar_y = tk.Scrollbar(text_frame)
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Yatay kaydırma çubuğu
-        scrollbar_x = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
-        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Metin widget'ı
-        text = tk.Text(text_frame,
-                      yscrollcommand=scrollbar_y.set,
-                      xscrollcommand=scrollbar_x.set,
-                      wrap=tk.NONE,
-                      undo=True)
-        text.pack(expand=True, fill="both")
-        
-        # Kaydırma çubuklarını metin widget'ı ile eşleştirme
-        scrollbar_y.config(command=text.yview)
-        scrollbar_x.config(command=text.xview)
-        
         # Sekme ID'si
         tab_id = f"tab_{self.tab_counter}"
         self.tab_counter += 1
@@ -465,6 +3018,96 @@ class TextEditor:
         title_label.bind("<Leave>", on_leave)
         title_label.bind("<Button-1>", on_click)
         
+        # Sekmeyi notebook'a ekle
+        self.notebook.add(frame, text="")  # Boş başlık
+        self.tab_registry.add(tab_id, frame)
+        
+        # Sekme bilgilerini kaydet
+        self.tabs[tab_id] = {
+            "file_path": file_path,
+            "text_widget": None,
+            "saved": True if file_path else False,
+            "close_button": title_label,
+            "close_frame": tab_header,
+            "inner_close_button": None,
+            "inner_close_frame": None,
+            "frame": frame,
+            "header": tab_header,
+            "title_label": title_label,
+            # İçerik, sürüm ve kayıt durumu; tembel sekmeler ilk seçimde okunur
+            "document": Document(None if lazy_state is not None else "", file_path, encoding),
+            "hibernated": lazy_state,  # Uyku modundaki sekmenin sıkıştırılmış durumu
+            "encoding": encoding,
+            "theme": None,  # Sekmeye en son uygulanan tema
+            "language": None,  # Algılanan dil (None: henüz algılanmadı, "": düz metin)
+            "lex_cache": None,  # Satır bazlı lexer'lar için satırlar ve satır sonu durumları
+            "highlighted_version": None,  # En son vurgulanan içerik sürümü
+            "dirty_lines": None,  # Son vurgulamadan beri düzenlenen (ilk satır, sonrasındaki satır sayısı)
+            "structure": None,  # (içerik sürümü, JsonScanResult) yapısal indeks
+            "rescan_job": None  # Yazma durduğunda yapılacak yeniden taramanın after kimliği
+        }
+        
+        # Sekme başlığını güncelle
+        if file_path:
+            self.update_tab_title(tab_id)
+            
+        # Tembel sekmeler yalnızca sekme şeridinde yer alır
+        if lazy_state is not None:
+            return tab_id
+        
+        # Metin alanını oluştur
+        self._create_text_area(tab_id)
+        
+        # Sekmeyi seç
+        self.notebook.select(frame)
+        self.current_tab = tab_id
+        self.tab_hibernator.touch(tab_id)
+        
+        # Tema uygula
+        self.apply_theme_to_tab(tab_id)
+        
+        # Başlık frame'ini notebook'a ekle
+        self.notebook.tab(frame, text="")  # Boş başlık
+        self.notebook.tab(frame, text=tab_title)  # Başlık metni
+        
+        return tab_id
+
+    def _create_text_area(self, tab_id, content=""):
+        """Sekmenin metin alanını, kaydırma çubuklarını ve iç kapatma butonunu oluşturur
+        
+        content, belgede zaten bulunan metindir; düzenleme izleyicisi
+        kurulmadan önce eklenir ki belgeye ikinci kez uygulanmasın.
+        """
+        tab_info = self.tabs[tab_id]
+        
+        # Metin alanı ve kaydırma çubukları
+        text_frame = tk.Frame(tab_info["frame"])
+        text_frame.pack(expand=True, fill="both")
+        
+        # Dikey kaydırma çubuğu
+        scrollbar_y = tk.Scrollbar(text_frame)
+        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Yatay kaydırma çubuğu
+        scrollbar_x = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
+        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Metin widget'ı
+        text = tk.Text(text_frame,
+                      yscrollcommand=scrollbar_y.set,
+                      xscrollcommand=scrollbar_x.set,
+                      wrap=tk.NONE,
+                      undo=True)
+        text.pack(expand=True, fill="both")
+        
+        # Seçilen yazı tipini uygula
+        if self.text_font is not None:
+            text.configure(font=self.text_font)
+        
+        # Kaydırma çubuklarını metin widget'ı ile eşleştirme
+        scrollbar_y.config(command=text.yview)
+        scrollbar_x.config(command=text.xview)
+        
         # Sekme içi kapatma butonu
         inner_close_frame = tk.Frame(text, width=20, height=20)
         inner_close_frame.place(relx=1.0, rely=0.0, anchor="ne", x=-5, y=5)
@@ -510,26 +3153,10 @@ class TextEditor:
             
         text.configure(yscrollcommand=on_text_scroll)
         
-        # Sekmeyi notebook'a ekle
-        self.notebook.add(frame, text="")  # Boş başlık
-        
-        # Sekme bilgilerini kaydet
-        self.tabs[tab_id] = {
-            "file_path": file_path,
-            "text_widget": text,
-            "saved": True if file_path else False,
-            "close_button": title_label,
-            "close_frame": tab_header,
-            "inner_close_button": inner_close_button,
-            "inner_close_frame": inner_close_frame,
-            "frame": frame,
-            "header": tab_header,
-            "title_label": title_label
-        }
-        
-        # Sekme başlığını güncelle
-        if file_path:
-            self.update_tab_title(tab_id)
+        tab_info["text_frame"] = text_frame
+        tab_info["text_widget"] = text
+        tab_info["inner_close_button"] = inner_close_button
+        tab_info["inner_close_frame"] = inner_close_frame
         
         # Etiketleri yapılandır
         text.tag_configure("current_line", background="#e9e9ff")
@@ -538,25 +3165,101 @@ class TextEditor:
         text.tag_lower("current_line")
         
         # Olay bağlantıları
-        text.bind("<KeyRelease>", self.on_key_release)
+        # Tuşa bağlı güncellemeler KeyPress'ten planlanır; böylece gecikme ölçümüne dahil olur
+        text.bind("<KeyPress>", lambda e: self.begin_input_latency(tab_id, e))
         text.bind("<ButtonRelease>", self.on_button_release)
         text.bind("<MouseWheel>", self.on_scroll)
         text.bind("<Button-4>", self.on_scroll)
         text.bind("<Button-5>", self.on_scroll)
         text.bind("<Button-2>", lambda e: self.close_tab(tab_id))  # Orta tekerlek tıklaması
-        
-        # Sekmeyi seç
-        self.notebook.select(frame)
-        self.current_tab = tab_id
-        
-        # Tema uygula
-        self.apply_theme_to_tab(tab_id)
-        
-        # Başlık frame'ini notebook'a ekle
-        self.notebook.tab(frame, text="")  # Boş başlık
-        self.notebook.tab(frame, text=tab_title)  # Başlık metni
-        
-        return tab_id
+        if content:
+            text.insert("1.0", content)
+        self.install_edit_tracker(tab_id, text)
+        
+        return text
+        
+    def install_edit_tracker(self, tab_id, text_widget):
+        """Metin widget'ının Tcl komutunu sarmalayarak düzenlemeleri belgeye uygular
+        
+        Düzenlenen satırlar da kaydedilir: aynı içerikle yapılan değişiklikler
+        (ör. aynı metni yapıştırma) etiketleri sildiği için yalnızca içerik
+        karşılaştırması yetmez. 'satır.sütun' indeksleri Tcl'e sorulmadan
+        belgenin satır indeksiyle çözülür.
+        """
+        tk_call = text_widget.tk.call
+        widget_path = str(text_widget)
+        original = widget_path + "_orig"
+        tk_call("rename", widget_path, original)
+        numeric_index = re.compile(r"(\d+)\.(\d+)$")
+        
+        def offset_of(line_index, index):
+            match = numeric_index.match(str(index))
+            if match is None:
+                match = numeric_index.match(str(tk_call(original, "index", index)))
+            return line_index.offset(int(match.group(1)), int(match.group(2)))
+        
+        def proxy(*args):
+            if args[:2] in (("edit", "undo"), ("edit", "redo")):
+                # Geri alma düzenlemeleri widget komutundan geçmez; belgeyi eşitle
+                result = tk_call((original,) + args)
+                self.sync_document(tab_id)
+                return result
+            tab_info = self.tabs.get(tab_id)
+            if not args or args[0] not in ("insert", "delete", "replace") or tab_info is None:
+                return tk_call((original,) + args)
+            line_index = tab_info["document"].line_index
+            try:
+                start = offset_of(line_index, args[1])
+                if args[0] == "insert":
+                    end = start
+                elif len(args) > 2:
+                    end = offset_of(line_index, args[2])
+                else:
+                    end = start + 1
+            except tk.TclError:
+                return tk_call((original,) + args)  # Geçersiz indeks: hatayı Tk üretsin
+            start_line = line_index.position(start)[0]
+            result = tk_call((original,) + args)
+            
+            # Eklenen metnin bittiği satır ve sonrasında kalan satır sayısı
+            if args[0] == "insert":
+                inserted = "".join(str(chars) for chars in args[2::2])
+            elif args[0] == "replace":
+                inserted = "".join(str(chars) for chars in args[3::2])
+            else:
+                inserted = ""
+            
+            document = tab_info["document"]
+            if args[0] == "delete" and len(args) > 3:
+                # Birden çok aralık silindi: belgeyi widget'tan yeniden oku
+                self.sync_document(tab_id)
+            else:
+                document.replace(start, end, inserted)
+            
+            end_line = start_line + inserted.count("\n")
+            lines_after = max(0, document.line_index.line_count() - end_line)
+            
+            dirty = tab_info["dirty_lines"]
+            if dirty is None:
+                tab_info["dirty_lines"] = (start_line, lines_after)
+            else:
+                tab_info["dirty_lines"] = (min(dirty[0], start_line), min(dirty[1], lines_after))
+            return result
+            
+        text_widget.tk.createcommand(widget_path, proxy)
+        # Widget yok edildiğinde tkinter vekil komutu ve kapanışını da silsin
+        if text_widget._tclCommands is None:
+            text_widget._tclCommands = []
+        text_widget._tclCommands.append(widget_path)
+        
+    def sync_document(self, tab_id):
+        """Belgeyi metin widget'ının içeriğiyle yeniden eşitler"""
+        tab_info = self.tabs.get(tab_id)
+        if tab_info is None or tab_info["text_widget"] is None:
+            return
+        content = tab_info["text_widget"].get("1.0", "end-1c")
+        if content != tab_info["document"].text:
+            tab_info["document"].set_text(content)
 
     def update_tab_title(self, tab_id):
         """Sekme başlığını günceller"""
@@ -618,27 +3321,20 @@ class TextEditor:
                 self.drag_data["item"] = target
                 
                 # Tab sıralamasını güncelle
-                self.update_tab_order()
+                tab_id = self.tab_registry.tab_id_for_frame(current_tab)
+                if tab_id:
+                    self.tab_registry.move(tab_id, target)
         except tk.TclError:
             # Mouse tab alanı dışındaysa işlemi iptal et
             pass
 
     def update_tab_order(self):
         """Sekme sıralamasını günceller"""
-        # Notebook'taki tüm sekmeleri al
-        tabs = self.notebook.tabs()
-        
-        # Yeni sıralamayı oluştur
-        new_tabs = {}
-        for tab in tabs:
-            # Her sekme için tab_id'yi bul
-            for tab_id, tab_info in self.tabs.items():
-                if tab_info["frame"] == tab:
-                    new_tabs[tab_id] = tab_info
-                    break
+        # Kayıt defterini notebook'taki sıraya göre güncelle
+        self.tab_registry.sync_order(self.notebook.tabs())
         
         # Sekmeleri yeni sıralamaya göre güncelle
-        self.tabs = new_tabs
+        self.tabs = {tab_id: self.tabs[tab_id] for tab_id in self.tab_registry.order}
 
     def on_tab_release(self, event):
         """Sekme sürükleme sonu"""
@@ -651,8 +3347,10 @@ class TextEditor:
         if index >= 0:
             tab_id = self.get_tab_id_by_index(index)
             if tab_id:
-                text_widget = self.tabs[tab_id]["text_widget"]
-                content = text_widget.get("1.0", "1.100")
+                content = self.get_tab_content(tab_id)
+                if content is None:
+                    return
+                content = content.split("\n", 1)[0][:100]
                 
                 # Önizleme penceresi
                 preview = tk.Toplevel(self.root)
@@ -669,43 +3367,162 @@ class TextEditor:
 
     def get_tab_id_by_index(self, index):
         """Sekme indeksine göre tab_id döndürür"""
-        if index < 0:
-            return None
+        return self.tab_registry.tab_id_at(index)
+
+    def get_current_tab(self):
+        """Mevcut sekmeyi döndürür"""
+        return self.tab_registry.tab_id_for_frame(self.notebook.select())
+        
+    def get_current_text_widget(self):
+        """Mevcut metin widget'ını döndürür"""
+        tab_id = self.get_current_tab()
+        if tab_id:
+            return self.ensure_tab_loaded(tab_id)
+        return None
+
+    @perf.timed("tab_switch")
+    def on_tab_changed(self, event=None):
+        """Seçilen sekme değiştiğinde uyku modundaki sekmeyi geri yükler"""
+        tab_id = self.get_current_tab()
+        if not tab_id:
+            return
             
-        # Notebook'taki tüm sekmeleri al
-        tabs = self.notebook.tabs()
-        if index >= len(tabs):
+        self.current_tab = tab_id
+        if self.ensure_tab_loaded(tab_id) is None:
+            return
+        self.tab_hibernator.touch(tab_id)
+        self.enforce_hibernation_policy()
+        
+    def select_tab(self, tab_id):
+        """Sekmeyi seçer ve metin widget'ını döndürür"""
+        self.notebook.select(self.tabs[tab_id]["frame"])
+        self.current_tab = tab_id
+        text_widget = self.ensure_tab_loaded(tab_id)
+        if text_widget is not None:
+            self.tab_hibernator.touch(tab_id)
+        return text_widget
+        
+    @perf.timed("tab_load")
+    def ensure_tab_loaded(self, tab_id):
+        """Uyku modundaki sekmenin metin alanını yeniden oluşturur"""
+        tab_info = self.tabs.get(tab_id)
+        if not tab_info:
             return None
             
-        # İstenen sekmenin frame'ini al
-        tab_frame = tabs[index]
-        if not tab_frame:
+        state = tab_info["hibernated"]
+        if state is None:
+            # Arka plandayken değişen temayı seçimde uygula
+            if tab_info["theme"] != self.current_theme.get():
+                self.apply_theme_to_tab(tab_id)
+            return tab_info["text_widget"]
+            
+        content = self.get_tab_content(tab_id)
+        if content is None:
             return None
+        tab_info["hibernated"] = None
+        text_widget = self._create_text_area(tab_id, content)
+        
+        # Geri yükleme bir düzenleme sayılmaz
+        text_widget.edit_reset()
+        text_widget.edit_modified(False)
+        
+        # İmleç ve kaydırma konumunu geri yükle
+        text_widget.mark_set(tk.INSERT, state["cursor"])
+        text_widget.yview_moveto(state["yview"])
+        text_widget.xview_moveto(state["xview"])
+        
+        self.apply_theme_to_tab(tab_id)
+        if self.syntax_highlighting:
+            self.apply_syntax_highlighting_to_tab(tab_id)
+        return text_widget
+        
+    @perf.timed("tab_hibernate")
+    def hibernate_tab(self, tab_id):
+        """Sekmenin durumunu sıkıştırarak saklar ve metin widget'ını yok eder"""
+        tab_info = self.tabs.get(tab_id)
+        if not tab_info or tab_info["hibernated"] is not None:
+            return
             
-        # Frame'e karşılık gelen tab_id'yi bul
-        for tab_id, tab_info in self.tabs.items():
-            if tab_info["frame"] == tab_frame:
-                return tab_id
-        return None
-
-    def get_current_tab(self):
-        """Mevcut sekmeyi döndürür"""
-        current = self.notebook.select()
-        if not current:
+        text_widget = tab_info["text_widget"]
+        tab_info["document"].compress()
+        tab_info["hibernated"] = {
+            "cursor": text_widget.index(tk.INSERT),
+            "yview": text_widget.yview()[0],
+            "xview": text_widget.xview()[0],
+            "saved": tab_info["saved"]
+        }
+        
+        # Geri alma yığını ve etiketlerle birlikte widget'ı serbest bırak
+        tab_info["text_frame"].destroy()
+        tab_info["text_frame"] = None
+        tab_info["text_widget"] = None
+        tab_info["inner_close_button"] = None
+        tab_info["inner_close_frame"] = None
+        tab_info["lex_cache"] = None
+        self.tab_hibernator.forget(tab_id)
+        
+    def enforce_hibernation_policy(self):
+        """Canlı sekme sınırı veya bellek bütçesi aşıldıysa eski sekmeleri uyutur"""
+        for tab_id in self.tab_hibernator.select_victims(self.current_tab):
+            self.hibernate_tab(tab_id)
+            
+    def check_memory_budget(self):
+        """Bellek bütçesini düzenli aralıklarla kontrol eder"""
+        try:
+            self.enforce_hibernation_policy()
+        except Exception as e:
+            self.performance_monitor.record_error("Sekme Uyku Hatası", str(e))
+        self.root.after(30000, self.check_memory_budget)
+        
+    def get_tab_content(self, tab_id):
+        """Sekmenin içeriğini (uyku modunda olsa bile) döndürür, okunamayan sekme için None"""
+        document = self.tabs[tab_id]["document"]
+        if not document.loaded:
+            # Oturumdan gelen sekme henüz diskten okunmadı
+            return self._read_pending_tab(tab_id)
+        return document.text
+        
+    def _read_pending_tab(self, tab_id):
+        """Tembel sekmenin dosyasını okuyup sıkıştırılmış olarak belgeye yükler
+        
+        Dosya okunamazsa hata gösterilir, sekme kapatılır ve None döner.
+        """
+        tab_info = self.tabs[tab_id]
+        file_path = tab_info["file_path"]
+        try:
+            with open(file_path, 'r', encoding=tab_info["encoding"]) as file:
+                content = file.read()
+        except Exception as e:
+            # Okunamayan dosya boş ve kayıtlı bir tampon olarak gösterilmez;
+            # kaydetme asıl dosyanın üzerine yazardı. Sekme değişiklik
+            # içermediğinden doğrudan kapatılır, hata ölçüm dışında gösterilir.
+            self.performance_monitor.record_error("Oturum Dosyası Okuma Hatası", str(e))
+            self.close_tab(tab_id)
+            message = f"Dosya açılamadı:\n{file_path}\n\n{str(e)}"
+            self.root.after_idle(lambda: messagebox.showerror("Hata", message))
             return None
             
-        # Frame'e karşılık gelen tab_id'yi bul
-        for tab_id, tab_info in self.tabs.items():
-            if tab_info["frame"] == current:
-                return tab_id
-        return None
+        document = tab_info["document"]
+        document.set_text(content)
+        document.mark_saved()
+        if os.path.exists(file_path):
+            self.start_file_watching(tab_id, file_path)
+        self.performance_monitor.update_usage_stats("files_opened")
+        return content
         
-    def get_current_text_widget(self):
-        """Mevcut metin widget'ını döndürür"""
-        tab_id = self.get_current_tab()
-        if tab_id:
-            return self.tabs[tab_id]["text_widget"]
-        return None
+    def set_tab_content(self, tab_id, content):
+        """Sekmenin içeriğini (uyku modunda olsa bile) değiştirir"""
+        tab_info = self.tabs[tab_id]
+        if tab_info["hibernated"] is not None:
+            document = tab_info["document"]
+            if not document.loaded and self._read_pending_tab(tab_id) is None:
+                return
+            document.set_text(content)
+            document.compress()
+            return
+        text_widget = tab_info["text_widget"]
+        text_widget.delete(1.0, tk.END)
+        text_widget.insert(1.0, content)
 
     def close_tab(self, tab_id=None):
         """Belirtilen sekmeyi kapatır"""
@@ -715,10 +3532,14 @@ class TextEditor:
         if not tab_id or tab_id not in self.tabs:
             return
             
-        # Değişiklikleri kontrol et
+        # Değişiklikleri kontrol et (kaydetme sorusu ölçüme dahil edilmez)
         if not self.check_tab_changes(tab_id):
             return
-            
+        self._remove_tab(tab_id)
+        
+    @perf.timed("tab_close")
+    def _remove_tab(self, tab_id):
+        """Sekmeyi ve widget'larını kaldırır"""
         # Sekme bilgilerini al
         tab_info = self.tabs[tab_id]
         frame = tab_info["frame"]
@@ -734,6 +3555,9 @@ class TextEditor:
         
         # Sekme bilgilerini sil
         del self.tabs[tab_id]
+        self.tab_registry.remove(tab_id)
+        self.tab_searcher.forget(tab_id)
+        self.tab_hibernator.forget(tab_id)
         
         # Eğer hiç sekme kalmadıysa yeni sekme oluştur
         if not self.tabs:
@@ -749,11 +3573,10 @@ class TextEditor:
                 return True
                 
             tab_info = self.tabs[tab_id]
-            text_widget = tab_info["text_widget"]
             file_path = tab_info["file_path"]
             
             # Eğer dosya yoksa ve içerik boşsa, doğrudan kapat
-            if not file_path and not text_widget.get("1.0", "end-1c").strip():
+            if not file_path and not self.get_tab_content(tab_id).strip():
                 return True
         
             if not tab_info["saved"]:
@@ -919,66 +3742,70 @@ class TextEditor:
                 return False
                 
             tab_info = self.tabs[tab_id]
-            text_widget = tab_info["text_widget"]
             file_path = tab_info["file_path"]
             
             if file_path:
-                try:
-                    content = text_widget.get(1.0, tk.END)
+                # Diyalog gerektirmeyen kaydetme yolu ölçülür
+                with perf.span("save_file"):
+                    try:
+                        content = self.get_tab_content(tab_id)
+                        if content is None:
+                            return False
                     
-                    # Dosya yazma izni kontrolü
-                    if os.path.exists(file_path) and not os.access(file_path, os.W_OK):
-                        messagebox.showerror(
-                            "Hata",
-                            f"Dosya yazma izni yok:\n{file_path}"
-                        )
-                        return False
+                        # Dosya yazma izni kontrolü
+                        if os.path.exists(file_path) and not os.access(file_path, os.W_OK):
+                            messagebox.showerror(
+                                "Hata",
+                                f"Dosya yazma izni yok:\n{file_path}"
+                            )
+                            return False
                     
-                    # Yedek dosya oluştur
-                    backup_path = file_path + ".bak"
-                    if os.path.exists(file_path):
-                        try:
-                            shutil.copy2(file_path, backup_path)
-                        except Exception as e:
-                            self.performance_monitor.record_error("BackupCreate", str(e))
+                        # Yedek dosya oluştur
+                        backup_path = file_path + ".bak"
+                        if os.path.exists(file_path):
+                            try:
+                                shutil.copy2(file_path, backup_path)
+                            except Exception as e:
+                                self.performance_monitor.record_error("BackupCreate", str(e))
                     
-                    # Dosyayı kaydet
-                    with open(file_path, 'w', encoding='utf-8') as file:
-                        file.write(content)
+                        # Dosyayı kaydet
+                        with open(file_path, 'w', encoding=tab_info["encoding"]) as file:
+                            file.write(content)
                     
-                    # Yedek dosyayı sil
-                    if os.path.exists(backup_path):
-                        try:
-                            os.remove(backup_path)
-                        except Exception as e:
-                            self.performance_monitor.record_error("BackupDelete", str(e))
+                        # Yedek dosyayı sil
+                        if os.path.exists(backup_path):
+                            try:
+                                os.remove(backup_path)
+                            except Exception as e:
+                                self.performance_monitor.record_error("BackupDelete", str(e))
                     
-                    tab_info["saved"] = True
-                    self.update_tab_title(tab_id)
+                        tab_info["saved"] = True
+                        tab_info["document"].mark_saved()
+                        self.update_tab_title(tab_id)
                     
-                    # Dosya izleme zaman damgasını güncelle
-                    if hasattr(self, 'last_mtime'):
-                        self.last_mtime[tab_id] = os.path.getmtime(file_path)
+                        # Dosya izleme zaman damgasını güncelle
+                        if hasattr(self, 'last_mtime'):
+                            self.last_mtime[tab_id] = os.path.getmtime(file_path)
                     
-                    # Durum çubuğunu güncelle
-                    file_size = os.path.getsize(file_path)
-                    file_modified = os.path.getmtime(file_path)
-                    file_info = (
-                        f"Dosya: {os.path.basename(file_path)}\n"
-                        f"Boyut: {self.format_file_size(file_size)}\n"
-                        f"Son Değişiklik: {self.format_date(file_modified)}\n"
-                        f"Kodlama: utf-8"
-                    )
-                    self.status_bar.config(text=file_info)
+                        # Durum çubuğunu güncelle
+                        file_size = os.path.getsize(file_path)
+                        file_modified = os.path.getmtime(file_path)
+                        file_info = (
+                            f"Dosya: {os.path.basename(file_path)}\n"
+                            f"Boyut: {self.format_file_size(file_size)}\n"
+                            f"Son Değişiklik: {self.format_date(file_modified)}\n"
+                            f"Kodlama: {tab_info['encoding']}"
+                        )
+                        self.status_bar.config(text=file_info)
                     
-                    # Performans izleme
-                    self.performance_monitor.update_usage_stats("files_saved")
+                        # Performans izleme
+                        self.performance_monitor.update_usage_stats("files_saved")
                     
-                    return True
-                except Exception as e:
-                    self.performance_monitor.record_error("SaveFile", str(e))
-                    messagebox.showerror("Hata", f"Dosya kaydedilirken hata oluştu:\n{str(e)}")
-                    return False
+                        return True
+                    except Exception as e:
+                        self.performance_monitor.record_error("SaveFile", str(e))
+                        messagebox.showerror("Hata", f"Dosya kaydedilirken hata oluştu:\n{str(e)}")
+                        return False
             else:
                 return self.save_tab_as(tab_id)
                 
@@ -1044,17 +3871,21 @@ class TextEditor:
                     )
                     return False
                 
-                tab_info["file_path"] = file_path
-                tab_info["saved"] = True
-                self.update_tab_title(tab_id)
-                
-                # Dosya izleme başlat
-                self.start_file_watching(tab_id, file_path)
-                
-                # Performans izleme
-                self.performance_monitor.update_usage_stats("files_saved_as")
-                
-                return self.save_tab(tab_id)
+                # Diyalog süresi hariç yalnızca yeni yola geçiş ve kaydetme ölçülür
+                with perf.span("save_as"):
+                    tab_info["file_path"] = file_path
+                    tab_info["document"].file_path = file_path
+                    tab_info["saved"] = True
+                    tab_info["language"] = None  # Yeni uzantıya göre dili yeniden algıla
+                    self.update_tab_title(tab_id)
+                    
+                    # Dosya izleme başlat
+                    self.start_file_watching(tab_id, file_path)
+                    
+                    # Performans izleme
+                    self.performance_monitor.update_usage_stats("files_saved_as")
+                    
+                    return self.save_tab(tab_id)
                 
             return False
             
@@ -1063,6 +3894,7 @@ class TextEditor:
             print(f"Farklı kaydetme hatası: {str(e)}")
             return False
         
+    @perf.timed("open_file")
     def open_file_in_tab(self, file_path):
         """Dosyayı yeni bir sekmede açar"""
         try:
@@ -1073,6 +3905,7 @@ class TextEditor:
             text_widget = self.tabs[tab_id]["text_widget"]
             text_widget.insert(1.0, content)
             self.tabs[tab_id]["saved"] = True
+            self.tabs[tab_id]["document"].mark_saved()
             
             # Sözdizimi vurgulaması uygula
             if self.syntax_highlighting:
@@ -1083,14 +3916,22 @@ class TextEditor:
             messagebox.showerror("Hata", f"Dosya açılırken hata oluştu:\n{str(e)}")
             return False
             
+    @perf.timed("theme_tab")
     def apply_theme_to_tab(self, tab_id):
-        """Seçili sekmeye tema uygular"""
+        """Seçili sekmeye tema uygular
+        
+        Vurgulama etiketleri yalnızca renk taşıdığından metin yeniden
+        taranmaz; etiketler temanın stil tablosuyla bir kez yapılandırılır.
+        """
         if tab_id not in self.tabs:
             return
             
         tab_info = self.tabs[tab_id]
         text_widget = tab_info["text_widget"]
-        theme = self.theme_colors[self.current_theme.get()]
+        if text_widget is None:
+            return  # Uyku modundaki sekmeye tema geri yüklenirken uygulanır
+        theme_name = self.current_theme.get()
+        theme = self.theme_colors[theme_name]
         
         text_widget.config(
             bg=theme["bg"],
@@ -1098,609 +3939,219 @@ class TextEditor:
             insertbackground=theme["insertbackground"],
             selectbackground=theme["selectbackground"]
         )
-        
-        # Sözdizimi vurgulaması uygula
-        if self.syntax_highlighting:
-            self.apply_syntax_highlighting_to_tab(tab_id)
+        self.configure_syntax_tags(text_widget, theme_name)
+        tab_info["theme"] = theme_name
             
-    def apply_syntax_highlighting_to_tab(self, tab_id):
-        """Seçili sekmeye sözdizimi vurgulama uygular"""
+    @perf.timed("highlighting")
+    def apply_syntax_highlighting_to_tab(self, tab_id, incremental=False):
+        """Seçili sekmeye sözdizimi vurgulama uygular
+        
+        incremental=True yalnızca satır bazlı devam ettirilebilen lexer'larda
+        değişen satırları yeniden tarar; diğer diller tuş vuruşunda yeniden
+        vurgulanmaz.
+        """
         if tab_id not in self.tabs:
             return
             
         tab_info = self.tabs[tab_id]
         text_widget = tab_info["text_widget"]
-        file_path = tab_info["file_path"]
-        
-        if not file_path:
+        if text_widget is None:
             return
             
-        file_ext = os.path.splitext(file_path)[1].lower()
+        language = self.detect_tab_language(tab_id)
+        tab_info["highlighted_version"] = tab_info["document"].version
+        if incremental:
+            if language is not None and hasattr(language.lexer, "tokenize_line"):
+                self.apply_incremental_highlighting(tab_id, text_widget, language.lexer)
+            elif language is not None and hasattr(language.lexer, "scan"):
+                self.schedule_structure_rescan(tab_id)
+            return
         
         # Önce tüm sözdizimi etiketlerini temizle
-        for tag in ["keyword", "string", "comment", "number", "operator", "method", "class", "library",
-                   "decorator", "variable", "constant", "function", "parameter", "type", "builtin",
-                   "error", "warning", "docstring", "tag", "attribute", "selector", "property", "value",
-                   "heading", "link", "bold", "italic", "code", "list", "quote"]:
+        tab_info["lex_cache"] = None
+        for tag in self.syntax_tag_colors:
             text_widget.tag_remove(tag, "1.0", tk.END)
-            
-        # Dosya türüne göre sözdizimi vurgulaması uygula
-        if file_ext == ".py":
-            self.highlight_python_syntax(text_widget, "1.0", tk.END)
-        elif file_ext in [".html", ".htm"]:
-            self.highlight_html_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".css":
-            self.highlight_css_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".js":
-            self.highlight_javascript_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".json":
-            self.highlight_json_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".xml":
-            self.highlight_xml_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".md":
-            self.highlight_markdown_syntax(text_widget, "1.0", tk.END)
-        elif file_ext == ".txt":
-            # Metin dosyaları için sözdizimi vurgulaması yok
-            pass
-
-    def highlight_html_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """HTML sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("tag", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("attribute", foreground=self.syntax_colors["attributes"])
-        text_widget.tag_configure("string", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("comment", foreground=self.syntax_colors["comments"])
-        
-        # HTML etiketlerini vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'<[^>]+>', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            tag_end = text_widget.search(r'>', pos, end_pos)
-            if not tag_end:
-                break
-                
-            tag_text = text_widget.get(pos, tag_end)
-            
-            # Yorum etiketlerini kontrol et
-            if tag_text.startswith('<!--'):
-                comment_end = text_widget.search('-->', pos, end_pos)
-                if comment_end:
-                    text_widget.tag_add("comment", pos, f"{comment_end}+3c")
-                    pos = f"{comment_end}+3c"
-                    continue
-            
-            # Etiket adını vurgula
-            tag_name_end = text_widget.search(r'[\s>]', pos, end_pos, regexp=True)
-            if tag_name_end:
-                text_widget.tag_add("tag", pos, tag_name_end)
-                
-                # Özellikleri vurgula
-                attr_pos = tag_name_end
-                while True:
-                    attr_pos = text_widget.search(r'\s+[a-zA-Z-]+=', attr_pos, tag_end, regexp=True)
-                    if not attr_pos:
-                        break
-                        
-                    attr_name_end = text_widget.search(r'=', attr_pos, tag_end)
-                    if attr_name_end:
-                        text_widget.tag_add("attribute", attr_pos, attr_name_end)
-                        
-                        # Değeri vurgula
-                        value_start = text_widget.search(r'["\']', attr_name_end, tag_end)
-                        if value_start:
-                            value_end = text_widget.search(r'["\']', f"{value_start}+1c", tag_end)
-                            if value_end:
-                                # Değer içindeki özel karakterleri kontrol et
-                                value_text = text_widget.get(value_start, f"{value_end}+1c")
-                                if any(c in value_text for c in ['&', '<', '>']):
-                                    text_widget.tag_add("string", value_start, f"{value_end}+1c")
-                                else:
-                                    text_widget.tag_add("string", value_start, f"{value_end}+1c")
-                                attr_pos = f"{value_end}+1c"
-                                continue
-                    
-                    attr_pos = text_widget.index(f"{attr_pos}+1c")
-            
-            pos = f"{tag_end}+1c"
-
-    def highlight_css_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """CSS sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("selector", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("property", foreground=self.syntax_colors["properties"])
-        text_widget.tag_configure("value", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("comment", foreground=self.syntax_colors["comments"])
-        
-        # Yorumları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'/\*', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            comment_end = text_widget.search(r'\*/', pos, end_pos, regexp=True)
-            if comment_end:
-                text_widget.tag_add("comment", pos, f"{comment_end}+2c")
-                pos = f"{comment_end}+2c"
-            else:
-                pos = text_widget.index(f"{pos}+2c")
-        
-        # Seçicileri ve özellikleri vurgula
-        pos = start_pos
-        while True:
-            # Seçiciyi bul
-            pos = text_widget.search(r'[^{]+{', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            selector_end = text_widget.search(r'{', pos, end_pos)
-            if selector_end:
-                text_widget.tag_add("selector", pos, selector_end)
-                
-                # Özellikleri bul
-                prop_pos = selector_end
-                while True:
-                    prop_pos = text_widget.search(r'[a-zA-Z-]+:', prop_pos, end_pos, regexp=True)
-                    if not prop_pos:
-                        break
-                        
-                    prop_name_end = text_widget.search(r':', prop_pos, end_pos)
-                    if prop_name_end:
-                        text_widget.tag_add("property", prop_pos, prop_name_end)
-                        
-                        # Değeri bul
-                        value_start = prop_name_end
-                        value_end = text_widget.search(r';', value_start, end_pos)
-                        if value_end:
-                            value_text = text_widget.get(value_start, value_end)
-                            # Renk değerlerini kontrol et
-                            if re.match(r'^#[0-9a-fA-F]{3,6}$', value_text.strip()) or \
-                               re.match(r'^rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)$', value_text.strip()) or \
-                               re.match(r'^rgba\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*,\s*[\d.]+\s*\)$', value_text.strip()):
-                                text_widget.tag_add("value", value_start, value_end)
-                            else:
-                                text_widget.tag_add("value", value_start, value_end)
-                            prop_pos = f"{value_end}+1c"
-                        else:
-                            break
-                    else:
-                        break
-                
-                # Kapanış parantezini bul
-                block_end = text_widget.search(r'}', selector_end, end_pos)
-                if block_end:
-                    pos = f"{block_end}+1c"
-                else:
-                    break
-            else:
-                break
-
-    def highlight_javascript_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """JavaScript sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("keyword", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("string", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("comment", foreground=self.syntax_colors["comments"])
-        text_widget.tag_configure("function", foreground=self.syntax_colors["functions"])
-        text_widget.tag_configure("number", foreground=self.syntax_colors["numbers"])
-        text_widget.tag_configure("class", foreground=self.syntax_colors["classes"])
-        text_widget.tag_configure("builtin", foreground=self.syntax_colors["builtins"])
-        text_widget.tag_configure("operator", foreground=self.syntax_colors["operators"])
-        text_widget.tag_configure("variable", foreground=self.syntax_colors["variables"])
-        
-        # JavaScript anahtar kelimeleri
-        keywords = [
-            "break", "case", "catch", "continue", "debugger", "default", "delete", "do", "else",
-            "finally", "for", "function", "if", "in", "instanceof", "new", "return", "switch",
-            "this", "throw", "try", "typeof", "var", "void", "while", "with", "const", "let",
-            "class", "extends", "export", "import", "super", "static", "async", "await"
-        ]
-        
-        # Yerleşik fonksiyonlar
-        builtins = [
-            "console", "document", "window", "Math", "Date", "Array", "Object", "String",
-            "Number", "Boolean", "Function", "RegExp", "JSON", "Promise", "Set", "Map",
-            "Error", "TypeError", "ReferenceError", "SyntaxError", "eval", "parseInt",
-            "parseFloat", "isNaN", "isFinite", "decodeURI", "encodeURI", "decodeURIComponent",
-            "encodeURIComponent"
-        ]
-        
-        # Yorumları vurgula
-        pos = start_pos
-        while True:
-            # Tek satırlık yorumlar
-            pos = text_widget.search(r'//', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("comment", pos, line_end)
-            pos = line_end
-            
-            # Çok satırlı yorumlar
-            pos = text_widget.search(r'/\*', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            comment_end = text_widget.search(r'\*/', pos, end_pos, regexp=True)
-            if comment_end:
-                text_widget.tag_add("comment", pos, f"{comment_end}+2c")
-                pos = f"{comment_end}+2c"
-            else:
-                pos = text_widget.index(f"{pos}+2c")
-        
-        # Anahtar kelimeleri vurgula
-        for keyword in keywords:
-            pos = start_pos
-            while True:
-                pos = text_widget.search(r'\b' + keyword + r'\b', pos, end_pos, regexp=True)
-                if not pos:
-                    break
-                    
-                text_widget.tag_add("keyword", pos, f"{pos}+{len(keyword)}c")
-                pos = text_widget.index(f"{pos}+{len(keyword)}c")
-        
-        # Yerleşik fonksiyonları vurgula
-        for builtin in builtins:
-            pos = start_pos
-            while True:
-                pos = text_widget.search(r'\b' + builtin + r'\b', pos, end_pos, regexp=True)
-                if not pos:
-                    break
-                    
-                text_widget.tag_add("builtin", pos, f"{pos}+{len(builtin)}c")
-                pos = text_widget.index(f"{pos}+{len(builtin)}c")
-        
-        # Sayıları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\b\d+(\.\d+)?\b', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            number_end = text_widget.search(r'\b', pos, end_pos, regexp=True)
-            if number_end:
-                text_widget.tag_add("number", pos, number_end)
-                pos = number_end
-            else:
-                pos = text_widget.index(f"{pos}+1c")
         
-        # Stringleri vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'["\']', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            quote = text_widget.get(pos)
-            string_end = text_widget.search(quote, f"{pos}+1c", end_pos)
-            if string_end:
-                text_widget.tag_add("string", pos, f"{string_end}+1c")
-                pos = f"{string_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
+        if language is None:
+            return  # Düz metin
+        
+        if hasattr(language.lexer, "tokenize_line"):
+            self.apply_incremental_highlighting(tab_id, text_widget, language.lexer)
+        elif hasattr(language.lexer, "scan"):
+            self.apply_structured_highlighting(tab_id, text_widget, language.lexer)
+        elif language.lexer is not None:
+            document = tab_info["document"]
+            content = document.text
+            self.apply_tokens(text_widget, content, language.lexer.tokenize(content), document.line_index)
+            
+    @perf.timed("highlight_incremental")
+    def apply_incremental_highlighting(self, tab_id, text_widget, lexer):
+        """Değişen satırları, lexer durumu önceki taramayla örtüşene kadar yeniden vurgular"""
+        tab_info = self.tabs[tab_id]
+        lines = tab_info["document"].text.split("\n")
+        cache = tab_info["lex_cache"]
         
-        # Fonksiyonları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\b(function|const|let|var)\s+([a-zA-Z_]\w*)', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            func_name_start = text_widget.search(r'[a-zA-Z_]\w*', f"{pos}+8c", end_pos)
-            if func_name_start:
-                func_name_end = text_widget.search(r'[(\s]', func_name_start, end_pos)
-                if func_name_end:
-                    text_widget.tag_add("function", func_name_start, func_name_end)
-                    pos = func_name_end
-                else:
-                    pos = text_widget.index(f"{pos}+1c")
-            else:
-                pos = text_widget.index(f"{pos}+1c")
+        dirty = tab_info["dirty_lines"]
+        tab_info["dirty_lines"] = None
         
-        # Sınıfları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\bclass\s+([a-zA-Z_]\w*)', pos, end_pos, regexp=True)
-            if not pos:
-                break
+        if cache is None or cache["lexer"] is not lexer:
+            # Önbellek yok: tüm belgeyi tara
+            first, old_states, delta = 0, [], 0
+            stop_states, stop_after = None, 0
+        else:
+            old_lines, old_states = cache["lines"], cache["states"]
+            
+            # Baştan ve sondan değişmeyen satırları atla
+            limit = min(len(old_lines), len(lines))
+            first = 0
+            while first < limit and old_lines[first] == lines[first]:
+                first += 1
+            suffix = 0
+            while suffix < limit - first and old_lines[-1 - suffix] == lines[-1 - suffix]:
+                suffix += 1
+            changed_end = len(lines) - suffix
+            
+            # Aynı içerikle üzerine yazılan satırların etiketleri de silinmiştir
+            if dirty is not None:
+                first = min(first, dirty[0] - 1)
+                changed_end = max(changed_end, len(lines) - dirty[1])
+            first = max(0, min(first, len(lines) - 1))
+            delta = len(lines) - len(old_lines)
+            
+            def stop_states(line_no):
+                """Yeni numaralamadaki satırın başındaki eski durum"""
+                old_index = line_no - 1 - delta
+                if line_no >= changed_end and 0 <= old_index < len(old_states):
+                    return old_states[old_index]
+                return None
+            stop_after = max(first, changed_end - 1)
+            
+        state = old_states[first - 1] if first > 0 else lexer.INITIAL_STATE
+        line_tokens, new_states = lex_lines(lexer, lines, first, state, stop_states, stop_after)
+        last = first + len(line_tokens)
+        
+        # Yalnızca yeniden taranan satırların etiketlerini yenile
+        range_end = f"{last + 1}.0" if last < len(lines) else tk.END
+        for tag in self.syntax_tag_colors:
+            text_widget.tag_remove(tag, f"{first + 1}.0", range_end)
+        ranges = {}
+        for line_no, tokens in enumerate(line_tokens, first + 1):
+            for start, end, tag in tokens:
+                ranges.setdefault(tag, []).extend((f"{line_no}.{start}", f"{line_no}.{end}"))
+        apply_tag_ranges(text_widget, ranges)
                 
-            class_name_start = text_widget.search(r'[a-zA-Z_]\w*', f"{pos}+6c", end_pos)
-            if class_name_start:
-                class_name_end = text_widget.search(r'[{\s]', class_name_start, end_pos)
-                if class_name_end:
-                    text_widget.tag_add("class", class_name_start, class_name_end)
-                    pos = class_name_end
-                else:
-                    pos = text_widget.index(f"{pos}+1c")
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Operatörleri vurgula
-        operators = ['+', '-', '*', '/', '%', '=', '==', '===', '!=', '!==', '>', '<', '>=', '<=', '&&', '||', '!', '?', ':', '+=', '-=', '*=', '/=', '%=', '++', '--']
-        for operator in operators:
-            pos = start_pos
-            while True:
-                # Özel karakterler içeren operatörler için regex kullanma
-                if any(c in operator for c in ['*', '+', '?', '.', '^', '$', '|', '(', ')', '[', ']', '{', '}']):
-                    pos = text_widget.search(re.escape(operator), pos, end_pos)
-                else:
-                    pos = text_widget.search(operator, pos, end_pos)
-                if not pos:
-                    break
-                    
-                text_widget.tag_add("operator", pos, f"{pos}+{len(operator)}c")
-                pos = text_widget.index(f"{pos}+{len(operator)}c")
-
-    def highlight_json_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """JSON sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("key", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("string", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("number", foreground=self.syntax_colors["numbers"])
-        text_widget.tag_configure("boolean", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("null", foreground=self.syntax_colors["keywords"])
-        
-        # JSON anahtar kelimeleri
-        keywords = ["true", "false", "null"]
-        
-        # Anahtar kelimeleri vurgula
-        for keyword in keywords:
-            pos = start_pos
-            while True:
-                pos = text_widget.search(r'\b' + keyword + r'\b', pos, end_pos, regexp=True)
-                if not pos:
-                    break
-                    
-                text_widget.tag_add("boolean" if keyword in ["true", "false"] else "null", 
-                                  pos, f"{pos}+{len(keyword)}c")
-                pos = text_widget.index(f"{pos}+{len(keyword)}c")
+        tail = old_states[last - delta:] if last < len(lines) else []
+        tab_info["lex_cache"] = {
+            "lexer": lexer,
+            "lines": lines,
+            "states": old_states[:first] + new_states + tail
+        }
         
-        # Sayıları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\b\d+(\.\d+)?([eE][+-]?\d+)?\b', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            number_end = text_widget.search(r'\b', pos, end_pos, regexp=True)
-            if number_end:
-                text_widget.tag_add("number", pos, number_end)
-                pos = number_end
-            else:
-                pos = text_widget.index(f"{pos}+1c")
+    @perf.timed("highlight_structured")
+    def apply_structured_highlighting(self, tab_id, text_widget, lexer):
+        """Belgeyi tarar, vurgular ve yapısal indeksini saklar
         
-        # Stringleri vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'["\']', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            quote = text_widget.get(pos)
-            string_end = text_widget.search(quote, f"{pos}+1c", end_pos)
-            if string_end:
-                text_widget.tag_add("string", pos, f"{string_end}+1c")
-                pos = f"{string_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
+        Büyük belgeler arka plan işçisinde taranır; kaydedilmiş UTF-8
+        dosyalar widget'tan kopyalanmadan diskten ham bayt olarak okunur.
+        """
+        tab_info = self.tabs[tab_id]
+        version = tab_info["document"].version
+        file_path = tab_info["file_path"]
         
-        # Anahtarları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'["\']\s*:', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            key_start = text_widget.search(r'["\']', pos, end_pos, backwards=True)
-            if key_start:
-                text_widget.tag_add("key", key_start, pos)
-                pos = text_widget.index(f"{pos}+1c")
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-
-    def highlight_xml_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """XML sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("tag", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("attribute", foreground=self.syntax_colors["attributes"])
-        text_widget.tag_configure("string", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("comment", foreground=self.syntax_colors["comments"])
-        text_widget.tag_configure("cdata", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("doctype", foreground=self.syntax_colors["keywords"])
-        
-        # XML etiketlerini vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'<[^>]+>', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            tag_end = text_widget.search(r'>', pos, end_pos)
-            if not tag_end:
-                break
-                
-            tag_text = text_widget.get(pos, tag_end)
-            
-            # Yorum etiketlerini kontrol et
-            if tag_text.startswith('<!--'):
-                comment_end = text_widget.search('-->', pos, end_pos)
-                if comment_end:
-                    text_widget.tag_add("comment", pos, f"{comment_end}+3c")
-                    pos = f"{comment_end}+3c"
-                    continue
-            
-            # CDATA bölümlerini kontrol et
-            if tag_text.startswith('<![CDATA['):
-                cdata_end = text_widget.search(']]>', pos, end_pos)
-                if cdata_end:
-                    text_widget.tag_add("cdata", pos, f"{cdata_end}+3c")
-                    pos = f"{cdata_end}+3c"
-                    continue
+        # Diskteki bayt yalnızca belge son kayıttan beri düzenlenmediyse içerikle aynıdır
+        if (file_path and not tab_info["document"].dirty and os.path.exists(file_path)
+                and tab_info["encoding"].replace("-", "").lower() in ("utf8", "utf8sig")
+                and os.path.getsize(file_path) > JsonLexer.WORKER_THRESHOLD):
+            future = self.analysis_executor.submit(analyze_structured_source, lexer, file_path=file_path)
+        else:
+            content = tab_info["document"].text
+            if len(content) <= JsonLexer.WORKER_THRESHOLD:
+                self.finish_structured_highlighting(tab_id, version, analyze_structured_source(lexer, content=content))
+                return
+            future = self.analysis_executor.submit(analyze_structured_source, lexer, content=content)
             
-            # DOCTYPE tanımlamalarını kontrol et
-            if tag_text.startswith('<!DOCTYPE'):
-                doctype_end = text_widget.search('>', pos, end_pos)
-                if doctype_end:
-                    text_widget.tag_add("doctype", pos, f"{doctype_end}+1c")
-                    pos = f"{doctype_end}+1c"
-                    continue
+        def poll():
+            if not future.done():
+                self.root.after(100, poll)
+                return
+            try:
+                analysis = future.result()
+            except Exception as e:
+                self.performance_monitor.record_error("Yapısal Tarama Hatası", str(e))
+                return
+            self.finish_structured_highlighting(tab_id, version, analysis)
             
-            # Etiket adını vurgula
-            tag_name_end = text_widget.search(r'[\s>]', pos, end_pos, regexp=True)
-            if tag_name_end:
-                text_widget.tag_add("tag", pos, tag_name_end)
-                
-                # Özellikleri vurgula
-                attr_pos = tag_name_end
-                while True:
-                    attr_pos = text_widget.search(r'\s+[a-zA-Z-]+=', attr_pos, tag_end, regexp=True)
-                    if not attr_pos:
-                        break
-                        
-                    attr_name_end = text_widget.search(r'=', attr_pos, tag_end)
-                    if attr_name_end:
-                        text_widget.tag_add("attribute", attr_pos, attr_name_end)
-                        
-                        # Değeri vurgula
-                        value_start = text_widget.search(r'["\']', attr_name_end, tag_end)
-                        if value_start:
-                            value_end = text_widget.search(r'["\']', f"{value_start}+1c", tag_end)
-                            if value_end:
-                                text_widget.tag_add("string", value_start, f"{value_end}+1c")
-                                attr_pos = f"{value_end}+1c"
-                                continue
-                    
-                    attr_pos = text_widget.index(f"{attr_pos}+1c")
-            
-            pos = f"{tag_end}+1c"
-
-    def highlight_markdown_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """Markdown sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("heading", foreground=self.syntax_colors["headings"])
-        text_widget.tag_configure("bold", foreground=self.syntax_colors["bold"])
-        text_widget.tag_configure("italic", foreground=self.syntax_colors["italic"])
-        text_widget.tag_configure("code", foreground=self.syntax_colors["code"])
-        text_widget.tag_configure("link", foreground=self.syntax_colors["links"])
-        text_widget.tag_configure("list", foreground=self.syntax_colors["lists"])
-        text_widget.tag_configure("quote", foreground=self.syntax_colors["quotes"])
-        
-        # Başlıkları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'^#{1,6}\s+', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("heading", pos, line_end)
-            pos = line_end
-        
-        # Kalın metni vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\*\*[^*]+\*\*', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            bold_end = text_widget.search(r'\*\*', f"{pos}+2c", end_pos)
-            if bold_end:
-                text_widget.tag_add("bold", pos, f"{bold_end}+2c")
-                pos = f"{bold_end}+2c"
-            else:
-                pos = text_widget.index(f"{pos}+2c")
-        
-        # İtalik metni vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\*[^*]+\*', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            italic_end = text_widget.search(r'\*', f"{pos}+1c", end_pos)
-            if italic_end:
-                text_widget.tag_add("italic", pos, f"{italic_end}+1c")
-                pos = f"{italic_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Kod bloklarını vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'```', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            code_end = text_widget.search(r'```', f"{pos}+3c", end_pos)
-            if code_end:
-                text_widget.tag_add("code", pos, f"{code_end}+3c")
-                pos = f"{code_end}+3c"
-            else:
-                pos = text_widget.index(f"{pos}+3c")
-        
-        # Satır içi kodları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'`[^`]+`', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            code_end = text_widget.search(r'`', f"{pos}+1c", end_pos)
-            if code_end:
-                text_widget.tag_add("code", pos, f"{code_end}+1c")
-                pos = f"{code_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Bağlantıları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\[[^\]]+\]\([^)]+\)', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            link_end = text_widget.search(r'\)', pos, end_pos)
-            if link_end:
-                text_widget.tag_add("link", pos, f"{link_end}+1c")
-                pos = f"{link_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
+        self.status_bar.config(text="Belge arka planda taranıyor...")
+        self.root.after(100, poll)
         
-        # Listeleri vurgula
-        pos = start_pos
-        while True:
-            # Sıralı listeler
-            pos = text_widget.search(r'^\d+\.\s+', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("list", pos, line_end)
-            pos = line_end
+    @perf.timed("highlight_apply")
+    def finish_structured_highlighting(self, tab_id, version, analysis):
+        """Tarama sonucunu, sekme bu arada değişmediyse uygular"""
+        tab_info = self.tabs.get(tab_id)
+        if tab_info is None or tab_info["document"].version != version or tab_info["text_widget"] is None:
+            return  # Sekme kapandı, uyudu veya içerik değişti
+        if not self.syntax_highlighting:
+            return  # Tarama sürerken vurgulama kapatıldı
             
-            # Sırasız listeler
-            pos = text_widget.search(r'^[-*+]\s+', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("list", pos, line_end)
-            pos = line_end
-        
-        # Alıntıları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'^>\s+.*$', pos, end_pos, regexp=True)
-            if not pos:
-                break
+        result, ranges = analysis
+        text_widget = tab_info["text_widget"]
+        apply_tag_ranges(text_widget, ranges)
+        if result.error:
+            error_index = tab_info["document"].line_index.to_index(result.error[0])
+            text_widget.tag_add("error", error_index, f"{error_index} lineend")
+            
+        result.tokens = []  # Belirteçler etiketlere dönüştü, belleği bırak
+        tab_info["structure"] = (version, result)
+        if tab_id == self.get_current_tab():
+            self.update_status_bar()
+            
+    def schedule_structure_rescan(self, tab_id, delay=500):
+        """Yazma durduktan sonra belgeyi yeniden tarar"""
+        tab_info = self.tabs[tab_id]
+        if tab_info["rescan_job"] is not None:
+            self.root.after_cancel(tab_info["rescan_job"])
+            
+        def rescan():
+            if tab_id in self.tabs:
+                self.tabs[tab_id]["rescan_job"] = None
+                self.apply_syntax_highlighting_to_tab(tab_id)
                 
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("quote", pos, line_end)
-            pos = line_end
+        tab_info["rescan_job"] = self.root.after(delay, rescan)
+        
+    def get_structure_status(self, tab_id, text_widget):
+        """İmlecin yapısal yolunu ve varsa ilk sözdizimi hatasını döndürür"""
+        structure = self.tabs[tab_id]["structure"]
+        if structure is None or structure[0] != self.tabs[tab_id]["document"].version:
+            return ""
+        result = structure[1]
+        line_index = self.tabs[tab_id]["document"].line_index
+        
+        parts = []
+        line, column = text_widget.index(tk.INSERT).split(".")
+        path = result.path_at(line_index.offset(int(line), int(column)))
+        if path:
+            parts.append(" › ".join(str(label) for label in path))
+        if result.error:
+            line, column = line_index.position(result.error[0])
+            parts.append(f"Hata: {result.error[1]} (satır {line}, sütun {column + 1})")
+        return " | ".join(parts)
+        
+    def detect_tab_language(self, tab_id):
+        """Sekmenin dilini algılar ve sonucu sekmede önbelleğe alır"""
+        tab_info = self.tabs[tab_id]
+        if tab_info["language"] is None:
+            prefix = tab_info["text_widget"].get("1.0", f"1.0+{LanguageRegistry.SNIFF_LIMIT}c")
+            name = self.language_registry.detect(tab_info["file_path"], prefix)
+            # Kaydedilmemiş kısa metin büyüdükçe yeniden algılanabilsin
+            if name or tab_info["file_path"] or len(prefix) >= LanguageRegistry.SNIFF_LIMIT:
+                tab_info["language"] = name
+            return self.language_registry.get(name)
+        return self.language_registry.get(tab_info["language"])
+        
+    @perf.timed("highlight_tokens")
+    def apply_tokens(self, text_widget, content, tokens, line_index=None):
+        """Belirteçleri etiket başına toplu tag_add çağrılarıyla uygular"""
+        apply_tag_ranges(text_widget, group_tokens_by_tag(content, tokens, line_index))
 
     def create_menu(self):  
         # Ana menü çubuğu  
@@ -1733,6 +4184,8 @@ class TextEditor:
         edit_menu.add_command(label="Tümünü Seç", command=self.select_all, accelerator="Ctrl+A")  
         edit_menu.add_separator()
         edit_menu.add_command(label="Ara ve Değiştir", command=self.show_search_replace, accelerator="Ctrl+F")
+        edit_menu.add_command(label="Tüm Sekmelerde Ara", command=self.show_search_all_tabs, accelerator="Ctrl+Shift+F")
+        edit_menu.add_command(label="Büyük Dosyada Değiştir...", command=self.show_batch_replace)
         menubar.add_cascade(label="Düzenle", menu=edit_menu)
         
         # Görünüm menüsü  
@@ -1762,6 +4215,7 @@ class TextEditor:
         help_menu.add_separator()
         help_menu.add_command(label="Performans İzleme", command=self.show_performance_guide)
         help_menu.add_command(label="Performans Raporu", command=self.show_performance_report)
+        help_menu.add_command(label="Performans Profili Çıkar...", command=self.start_profiling)
         help_menu.add_separator()
         help_menu.add_command(label="Güncellemeler", command=self.show_updates)  
         help_menu.add_command(label="Hata Bildir", command=self.report_issue)  
@@ -1842,6 +4296,7 @@ class TextEditor:
             "Ctrl+V     : Yapıştır",
             "Ctrl+A     : Tümünü seç",
             "Ctrl+F     : Ara",
+            "Ctrl+Shift+F : Tüm sekmelerde ara",
             "",
             "Genel:",
             "F1         : Yardım",
@@ -2144,7 +4599,6 @@ class TextEditor:
         
     def open_file(self):
         """Dosya açma diyaloğunu gösterir ve seçilen dosyayı açar"""
-        start_time = time.time()
         try:
             # Son açılan dizini al
             initial_dir = os.path.expanduser("~")
@@ -2169,9 +4623,6 @@ class TextEditor:
             )
             
             if file_path:
-                # Performans metriklerini güncelle
-                duration = time.time() - start_time
-                self.performance_monitor.record_response_time("open_file", duration)
                 self.performance_monitor.update_usage_stats("files_opened")
                 
                 # Son açılan dizini güncelle
@@ -2181,62 +4632,71 @@ class TextEditor:
                 for tab_id, tab_info in self.tabs.items():
                     if tab_info["file_path"] == file_path:
                         # Dosya zaten açıksa o sekmeye geç
-                        self.notebook.select(tab_info["frame"])
-                        self.current_tab = tab_id
+                        self.select_tab(tab_id)
                         return True
                 
-                try:
-                    # Dosya kodlamasını tespit et
-                    encodings = ['utf-8', 'cp1254', 'latin1', 'ascii']
-                    content = None
-                    encoding_used = None
-                    
-                    for encoding in encodings:
-                        try:
-                            with open(file_path, 'r', encoding=encoding) as file:
-                                content = file.read()
-                                encoding_used = encoding
-                                break
-                        except UnicodeDecodeError:
-                            continue
+                # Diyalog süresi hariç yalnızca yükleme ölçülür; uyarılar ölçümden sonra gösterilir
+                binary = False
+                error = None
+                with perf.span("open_file"):
+                    try:
+                        # Dosya kodlamasını tespit et
+                        encodings = ['utf-8', 'cp1254', 'latin1', 'ascii']
+                        content = None
+                        encoding_used = None
                     
-                    if content is None:
-                        # Hiçbir kodlama çalışmazsa binary modda oku
-                        with open(file_path, 'rb') as file:
-                            content = file.read()
-                            # Binary içeriği hex formatında göster
-                            content = ' '.join(f'{b:02x}' for b in content)
-                            messagebox.showwarning(
-                                "Uyarı",
-                                "Dosya metin formatında değil. Binary içerik hex formatında gösteriliyor."
-                            )
+                        for encoding in encodings:
+                            try:
+                                with open(file_path, 'r', encoding=encoding) as file:
+                                    content = file.read()
+                                    encoding_used = encoding
+                                    break
+                            except UnicodeDecodeError:
+                                continue
                     
-                    # Yeni sekme oluştur
-                    tab_id = self.new_tab(file_path)
-                    text_widget = self.tabs[tab_id]["text_widget"]
+                        if content is None:
+                            # Hiçbir kodlama çalışmazsa binary modda oku
+                            with open(file_path, 'rb') as file:
+                                content = file.read()
+                                # Binary içeriği hex formatında göster
+                                content = ' '.join(f'{b:02x}' for b in content)
+                                binary = True
                     
-                    # İçeriği ekle
-                    text_widget.insert(1.0, content)
+                        # Yeni sekme oluştur
+                        tab_id = self.new_tab(file_path, encoding=encoding_used or "utf-8")
+                        text_widget = self.tabs[tab_id]["text_widget"]
                     
-                    # Sözdizimi vurgulaması uygula
-                    if self.syntax_highlighting:
-                        syntax_start = time.time()
-                        self.apply_syntax_highlighting_to_tab(tab_id)
-                        syntax_duration = time.time() - syntax_start
-                        self.performance_monitor.update_usage_stats("syntax_highlighting_time", syntax_duration)
+                        # İçeriği ekle
+                        text_widget.insert(1.0, content)
+                        self.tabs[tab_id]["document"].mark_saved()
                     
-                    # Dosya izleme başlat
-                    self.start_file_watching(tab_id, file_path)
+                        # Sözdizimi vurgulaması uygula
+                        if self.syntax_highlighting:
+                            syntax_start = time.perf_counter()
+                            self.apply_syntax_highlighting_to_tab(tab_id)
+                            syntax_duration = time.perf_counter() - syntax_start
+                            self.performance_monitor.update_usage_stats("syntax_highlighting_time", syntax_duration)
                     
-                    return True
+                        # Dosya izleme başlat
+                        self.start_file_watching(tab_id, file_path)
                     
-                except Exception as e:
-                    self.performance_monitor.record_error("Dosya Açma Hatası", str(e))
+                    except Exception as e:
+                        self.performance_monitor.record_error("Dosya Açma Hatası", str(e))
+                        error = e
+                        
+                if error is not None:
                     messagebox.showerror(
                         "Hata",
-                        f"Dosya açılırken hata oluştu:\n{str(e)}"
+                        f"Dosya açılırken hata oluştu:\n{str(error)}"
                     )
                     return False
+                    
+                if binary:
+                    messagebox.showwarning(
+                        "Uyarı",
+                        "Dosya metin formatında değil. Binary içerik hex formatında gösteriliyor."
+                    )
+                return True
             return False
             
         except Exception as e:
@@ -2282,12 +4742,11 @@ class TextEditor:
                     
                     if response:
                         # Dosyayı yeniden yükle
-                        with open(file_path, 'r', encoding='utf-8') as file:
+                        with open(file_path, 'r', encoding=self.tabs[tab_id]["encoding"]) as file:
                             content = file.read()
-                            text_widget = self.tabs[tab_id]["text_widget"]
-                            text_widget.delete(1.0, tk.END)
-                            text_widget.insert(1.0, content)
+                            self.set_tab_content(tab_id, content)
                             self.tabs[tab_id]["saved"] = True
+                            self.tabs[tab_id]["document"].mark_saved()
                             self.update_tab_title(tab_id)
                             
                             # Sözdizimi vurgulamasını yeniden uygula
@@ -2311,16 +4770,10 @@ class TextEditor:
         
     def save_file(self):
         """Mevcut dosyayı kaydeder"""
-        start_time = time.time()
         try:
             tab_id = self.get_current_tab()
             if tab_id:
-                result = self.save_tab(tab_id)
-                if result:
-                    duration = time.time() - start_time
-                    self.performance_monitor.record_response_time("save_file", duration)
-                    self.performance_monitor.update_usage_stats("files_saved")
-                return result
+                return self.save_tab(tab_id)
             return False
         except Exception as e:
             self.performance_monitor.record_error("Dosya Kaydetme Hatası", str(e))
@@ -2335,13 +4788,100 @@ class TextEditor:
         
     def exit_app(self):
         """Uygulamadan çıkar"""
-        # Performans izlemeyi durdur
-        self.performance_monitor.stop_monitoring()
+        # Açık sekmeleri bir sonraki açılış için kaydet
+        self.save_session()
         
-        # Tüm sekmeleri kapat
+        # Tüm sekmeleri kapat; kullanıcı vazgeçerse izleme açık kalır
         if self.close_all_tabs():
+            # Performans izlemeyi durdur
+            if self.profiler is not None:
+                self.profiler.stop()
+            self.performance_monitor.stop_lag_detector()
+            self.performance_monitor.stop_monitoring()
+            
+            # Arka plan aramalarını durdur
+            self.tab_searcher.executor.shutdown(wait=False, cancel_futures=True)
+            self.analysis_executor.shutdown(wait=False, cancel_futures=True)
             self.root.destroy()
         
+    @perf.timed("session_save")
+    def save_session(self):
+        """Açık dosyaları, sıralarını, imleç/kaydırma konumlarını ve kodlamalarını kaydeder"""
+        try:
+            tabs = []
+            active = 0
+            current_tab = self.get_current_tab()
+            for tab_id in self.tab_registry:
+                tab_info = self.tabs[tab_id]
+                if not tab_info["file_path"]:
+                    continue  # Kaydedilmemiş yeni dosyalar oturuma alınmaz
+                    
+                if tab_id == current_tab:
+                    active = len(tabs)
+                    
+                state = tab_info["hibernated"]
+                if state is not None:
+                    cursor, yview, xview = state["cursor"], state["yview"], state["xview"]
+                else:
+                    text_widget = tab_info["text_widget"]
+                    cursor = text_widget.index(tk.INSERT)
+                    yview = text_widget.yview()[0]
+                    xview = text_widget.xview()[0]
+                    
+                tabs.append({
+                    "path": tab_info["file_path"],
+                    "encoding": tab_info["encoding"],
+                    "cursor": cursor,
+                    "yview": yview,
+                    "xview": xview
+                })
+                
+            with open(self.session_file, 'w', encoding='utf-8') as f:
+                json.dump({"version": 1, "active": active, "tabs": tabs}, f)
+        except Exception as e:
+            self.performance_monitor.record_error("Oturum Kaydetme Hatası", str(e))
+            
+    @perf.timed("session_restore")
+    def restore_session(self):
+        """Önceki oturumun sekmelerini geri yükler; yalnızca etkin sekme hemen okunur"""
+        try:
+            with open(self.session_file, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return False
+            
+        restored = []
+        for entry in session.get("tabs", []):
+            file_path = entry.get("path")
+            if not file_path or not os.path.isfile(file_path):
+                continue
+            lazy_state = {
+                "cursor": entry.get("cursor", "1.0"),
+                "yview": entry.get("yview", 0.0),
+                "xview": entry.get("xview", 0.0),
+                "saved": True
+            }
+            restored.append(self.new_tab(file_path, lazy_state, entry.get("encoding", "utf-8")))
+            
+        if not restored:
+            return False
+            
+        # Etkin sekmeyi hemen yükle, diğerlerini boşta kalındıkça oku
+        active = min(max(session.get("active", 0), 0), len(restored) - 1)
+        self.select_tab(restored[active])
+        self.root.after_idle(self._preload_session_tabs)
+        return True
+        
+    def _preload_session_tabs(self):
+        """Boşta kalındığında bir sonraki tembel sekmenin dosyasını okur"""
+        for tab_id, tab_info in self.tabs.items():
+            state = tab_info["hibernated"]
+            if state is not None and not tab_info["document"].loaded:
+                if self._read_pending_tab(tab_id) is not None:
+                    tab_info["document"].compress()
+                self.root.after_idle(self._preload_session_tabs)
+                return
+                
     def undo(self):
         """Son yapılan değişikliği geri alır"""
         text_widget = self.get_current_text_widget()
@@ -2411,8 +4951,10 @@ class TextEditor:
         self.root.bind("<Control-v>", lambda e: self.paste())
         self.root.bind("<Control-a>", lambda e: self.select_all())
         self.root.bind("<Control-f>", lambda e: self.show_search_replace())
+        self.root.bind("<Control-Shift-F>", lambda e: self.show_search_all_tabs())
         self.root.bind("<F1>", lambda e: self.show_quick_start_guide())
         
+    @perf.timed("theme_switch")
     def apply_theme(self, theme_name):
         """Editöre tema uygular"""
         if theme_name not in self.theme_colors:
@@ -2420,6 +4962,7 @@ class TextEditor:
             
         self.current_theme.set(theme_name)
         theme = self.theme_colors[theme_name]
+        self.syntax_colors = self.syntax_palettes[theme_name]
         
         # Ana pencere
         self.root.configure(bg=theme["bg"])
@@ -2448,17 +4991,19 @@ class TextEditor:
         self.status_bar.config(bg=theme["status_bar_bg"], fg=theme["status_bar_fg"])
         self.theme_label.config(text=f"Tema: {self.theme_names[theme_name]}")
         
-        # Tüm sekmeleri güncelle
+        # Görünen sekmeyi hemen güncelle, diğerleri seçildiklerinde güncellenir
+        current_tab = self.get_current_tab()
+        if current_tab:
+            self.apply_theme_to_tab(current_tab)
+        
         for tab_id in self.tabs:
-            self.apply_theme_to_tab(tab_id)
-            
             # Kapatma butonlarını güncelle
             close_button = self.tabs[tab_id]["close_button"]
             close_frame = self.tabs[tab_id]["close_frame"]
             inner_close_button = self.tabs[tab_id]["inner_close_button"]
             inner_close_frame = self.tabs[tab_id]["inner_close_frame"]
             title_label = self.tabs[tab_id]["title_label"]
-            
+        
             # Başlık etiketini güncelle
             if isinstance(title_label, tk.Label):
                 title_label.configure(
@@ -2479,7 +5024,7 @@ class TextEditor:
                 title_label.destroy()
                 self.tabs[tab_id]["title_label"] = new_title_label
                 title_label = new_title_label
-            
+        
             # Kapatma butonu rengini güncelle
             if isinstance(close_button, tk.Label):
                 close_button.configure(
@@ -2498,32 +5043,32 @@ class TextEditor:
                     bg=theme["bg"],
                     highlightbackground=theme["fg"]
                 )
-            
+        
             # Hover efektlerini güncelle
             def on_enter(e, btn=close_button, frame=close_frame):
                 if isinstance(btn, tk.Label):
                     btn.configure(fg="#e74c3c", bg=theme["menu_active_bg"])
                 if isinstance(frame, tk.Frame):
                     frame.configure(bg=theme["menu_active_bg"])
-                
+            
             def on_leave(e, btn=close_button, frame=close_frame):
                 if isinstance(btn, tk.Label):
                     btn.configure(fg=theme["fg"], bg=theme["bg"])
                 if isinstance(frame, tk.Frame):
                     frame.configure(bg=theme["bg"])
-                
+            
             def on_inner_enter(e, btn=inner_close_button, frame=inner_close_frame):
                 if isinstance(btn, tk.Label):
                     btn.configure(fg="#e74c3c", bg=theme["menu_active_bg"])
                 if isinstance(frame, tk.Frame):
                     frame.configure(bg=theme["menu_active_bg"], highlightbackground="#e74c3c")
-                
+            
             def on_inner_leave(e, btn=inner_close_button, frame=inner_close_frame):
                 if isinstance(btn, tk.Label):
                     btn.configure(fg=theme["fg"], bg=theme["bg"])
                 if isinstance(frame, tk.Frame):
                     frame.configure(bg=theme["bg"], highlightbackground=theme["fg"])
-                
+            
             # Olayları yeniden bağla
             if isinstance(close_button, tk.Label):
                 close_button.bind("<Enter>", on_enter)
@@ -2531,7 +5076,7 @@ class TextEditor:
             if isinstance(close_frame, tk.Frame):
                 close_frame.bind("<Enter>", on_enter)
                 close_frame.bind("<Leave>", on_leave)
-            
+        
             if isinstance(inner_close_button, tk.Label):
                 inner_close_button.bind("<Enter>", on_inner_enter)
                 inner_close_button.bind("<Leave>", on_inner_leave)
@@ -2539,6 +5084,7 @@ class TextEditor:
                 inner_close_frame.bind("<Enter>", on_inner_enter)
                 inner_close_frame.bind("<Leave>", on_inner_leave)
             
+    @perf.timed("highlight_toggle")
     def toggle_syntax_highlighting(self):
         """Sözdizimi vurgulamayı açıp kapatır"""
         self.syntax_highlighting = not self.syntax_highlighting
@@ -2548,14 +5094,56 @@ class TextEditor:
             for tab_id in self.tabs:
                 self.apply_syntax_highlighting_to_tab(tab_id)
         else:
-            # Tüm sekmelerden sözdizimi vurgulamasını kaldır
-            for tab_id in self.tabs:
-                text_widget = self.tabs[tab_id]["text_widget"]
-                for tag in ["keyword", "string", "comment", "number", "operator", "method", "class", "library"]:
+            # Tüm sekmelerden sözdizimi vurgulamasını kaldır; yeniden açıldığında tam tarama yapılır
+            for tab_info in self.tabs.values():
+                tab_info["lex_cache"] = None
+                tab_info["highlighted_version"] = None
+                text_widget = tab_info["text_widget"]
+                if text_widget is None:
+                    continue
+                for tag in self.syntax_tag_colors:
                     text_widget.tag_remove(tag, "1.0", tk.END)
                     
-    def on_key_release(self, event):
-        """Tuş bırakma olayını işler"""
+    def begin_input_latency(self, tab_id, event):
+        """Tuş basımının ölçümünü başlatır
+        
+        Tuşun işlenmesi bir zamanlayıcıyla planlanır: zamanlayıcı olayın tüm
+        bağlantıları çalıştıktan sonra (biri "break" döndürse bile) tetiklenir.
+        """
+        if event.keysym not in self.MODIFIER_KEYS:
+            self.root.after(0, self.end_input_latency, tab_id, time.perf_counter_ns())
+            
+    def end_input_latency(self, tab_id, started):
+        """Tuşa bağlı güncellemeleri yapar ve ekran çiziminin ardından gelen ilk boşta anını bekler
+        
+        Vurgulama, parantez ve durum çubuğu güncellemeleri ölçüm içinde çalışır.
+        Text widget'ı değişiklikte çizimi boşta geri çağrısı olarak planlar;
+        bundan sonra planlanan geri çağrı çizim tamamlandıktan sonra çalışır.
+        """
+        self.on_keystroke()
+        self.root.after_idle(self.finish_input_latency, tab_id, started)
+            
+    def finish_input_latency(self, tab_id, started):
+        """Tuş gecikmesini kaydeder ve durum çubuğundaki p95 değerini yeniler"""
+        duration = (time.perf_counter_ns() - started) / 1e9
+        tab_info = self.tabs.get(tab_id)
+        if tab_info is None:
+            return
+        size_bucket = PerformanceMonitor.size_bucket(len(tab_info["document"]))
+        language = tab_info["language"] or "text"
+        histogram = self.performance_monitor.record_input_latency(duration, size_bucket, language)
+        
+        # Etiketi her tuşta değil, en fazla yarım saniyede bir güncelle
+        now = time.perf_counter()
+        if now - self._latency_label_updated >= 0.5:
+            self._latency_label_updated = now
+            self.latency_label.config(
+                text=f"Tuş Gecikmesi p95 ({size_bucket}, {language}): {histogram.percentile(95) * 1000:.1f} ms"
+            )
+            
+    @perf.timed("keystroke")
+    def on_keystroke(self):
+        """Tuşun ardından durum çubuğunu, vurgulamayı ve kayıt durumunu günceller"""
         self.update_status_bar()
         self.highlight_current_line()
         self.matching_brackets()
@@ -2563,27 +5151,17 @@ class TextEditor:
         # Kaydedilmemiş değişiklikleri işaretle
         tab_id = self.get_current_tab()
         if tab_id:
-            # Sadece gerçek değişikliklerde işaretle
-            text_widget = self.tabs[tab_id]["text_widget"]
-            current_content = text_widget.get("1.0", "end-1c")
-            
-            # Eğer dosya varsa, orijinal içerikle karşılaştır
-            if self.tabs[tab_id]["file_path"]:
-                try:
-                    with open(self.tabs[tab_id]["file_path"], 'r', encoding='utf-8') as file:
-                        original_content = file.read()
-                        if current_content != original_content:
-                            self.tabs[tab_id]["saved"] = False
-                            self.update_tab_title(tab_id)
-                except:
-                    self.tabs[tab_id]["saved"] = False
-                    self.update_tab_title(tab_id)
-            else:
-                # Yeni dosya için, içerik boş değilse işaretle
-                if current_content.strip():
-                    self.tabs[tab_id]["saved"] = False
-                    self.update_tab_title(tab_id)
+            # Sadece gerçek değişikliklerde işaretle (belge sürümü diskten okumadan söyler)
+            tab_info = self.tabs[tab_id]
+            if tab_info["document"].dirty and tab_info["saved"]:
+                tab_info["saved"] = False
+                self.update_tab_title(tab_id)
+                
+            # İçerik değiştiyse değişen satırları yeniden vurgula
+            if self.syntax_highlighting and tab_info["document"].version != tab_info["highlighted_version"]:
+                self.apply_syntax_highlighting_to_tab(tab_id, incremental=True)
         
+    @perf.timed("click")
     def on_button_release(self, event):
         """Fare düğmesi bırakma olayını işler"""
         self.update_status_bar()
@@ -2628,6 +5206,7 @@ class TextEditor:
                 text_widget.tag_add("bracket_highlight", f"{pos} -1c", pos)
                 text_widget.tag_add("bracket_highlight", match, f"{match} +1c")
                 
+    @perf.timed("status_bar")
     def update_status_bar(self, event=None):
         """Durum çubuğunu günceller"""
         text_widget = self.get_current_text_widget()
@@ -2647,6 +5226,13 @@ class TextEditor:
             status_text = f"Satır: {line}/{total_lines} | Sütun: {column} | Seçili: {char_count} karakter"
         except tk.TclError:
             status_text = f"Satır: {line}/{total_lines} | Sütun: {column}"
+            
+        # Yapısal belgelerde (JSON) imlecin yolu
+        tab_id = self.get_current_tab()
+        if tab_id:
+            structure_status = self.get_structure_status(tab_id, text_widget)
+            if structure_status:
+                status_text += f" | {structure_status}"
         
         self.status_bar.config(text=status_text)
         
@@ -2801,6 +5387,17 @@ class TextEditor:
             font=("Segoe UI", 9)
         )
         self.theme_label.pack(side=tk.RIGHT, padx=5)
+        
+        # Tuş → ekran gecikmesi etiketi
+        self.latency_label = tk.Label(
+            self.status_bar,
+            text="Tuş Gecikmesi p95: -",
+            bd=1,
+            relief=tk.SUNKEN,
+            anchor=tk.E,
+            font=("Segoe UI", 9)
+        )
+        self.latency_label.pack(side=tk.RIGHT, padx=5)
 
     def show_search_replace(self):
         """Arama ve değiştirme penceresini gösterir"""
@@ -3057,9 +5654,9 @@ class TextEditor:
         if self.search_frame:
             self.search_frame.pack_forget()
             
+    @perf.timed("search_text")
     def search_text_in_current_tab(self):
         """Aktif sekmede metin arar"""
-        start_time = time.time()
         try:
             text_widget = self.get_current_text_widget()
             if not text_widget or not self.search_text.get():
@@ -3091,14 +5688,12 @@ class TextEditor:
                 text_widget.mark_set(tk.SEL_FIRST, first_match)
                 text_widget.mark_set(tk.SEL_LAST, f"{first_match}+{len(self.search_text.get())}c")
             
-            # Performans metriklerini güncelle
-            duration = time.time() - start_time
-            self.performance_monitor.record_response_time("search_text", duration)
             self.performance_monitor.update_usage_stats("search_count")
             
         except Exception as e:
             self.performance_monitor.record_error("Arama Hatası", str(e))
 
+    @perf.timed("replace_text")
     def replace_text_in_current_tab(self):
         """Aktif sekmede metin değiştirir"""
         text_widget = self.get_current_text_widget()
@@ -3117,6 +5712,7 @@ class TextEditor:
                 text_widget.delete(start_pos, end_pos)
                 text_widget.insert(start_pos, self.replace_text.get())
                 
+    @perf.timed("replace_all")
     def replace_all_text_in_current_tab(self):
         """Mevcut sekmede tüm eşleşmeleri değiştirir"""
         text_widget = self.get_current_text_widget()
@@ -3133,6 +5729,336 @@ class TextEditor:
         text_widget.delete("1.0", tk.END)
         text_widget.insert("1.0", new_content)
 
+    def show_batch_replace(self):
+        """Büyük dosyalarda akışlı değiştirme penceresini gösterir"""
+        window = tk.Toplevel(self.root)
+        window.title("Büyük Dosyada Değiştir")
+        window.geometry("520x260")
+        window.transient(self.root)
+        window.resizable(False, False)
+        
+        # Ana çerçeve
+        main_frame = tk.Frame(window, padx=15, pady=15)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        file_var = tk.StringVar()
+        query_var = tk.StringVar(value=self.search_text.get() if self.search_text is not None else "")
+        replace_var = tk.StringVar(value=self.replace_text.get() if self.replace_text is not None else "")
+        regex_var = tk.BooleanVar(value=False)
+        case_var = tk.BooleanVar(value=False)
+        
+        def browse():
+            file_path = filedialog.askopenfilename(
+                parent=window,
+                initialdir=self.last_directory or os.path.expanduser("~"),
+                title="Dosya Seç"
+            )
+            if file_path:
+                file_var.set(file_path)
+                
+        # Giriş alanları
+        for row, (label, variable) in enumerate([("Dosya:", file_var), ("Ara:", query_var), ("Değiştir:", replace_var)]):
+            tk.Label(main_frame, text=label, font=("Segoe UI", 9), width=8, anchor="w").grid(row=row, column=0, sticky="w", pady=2)
+            tk.Entry(main_frame, textvariable=variable, font=("Segoe UI", 9), width=45).grid(row=row, column=1, sticky="we", pady=2)
+        tk.Button(main_frame, text="Gözat", command=browse, font=("Segoe UI", 9), relief=tk.FLAT, cursor="hand2").grid(row=0, column=2, padx=(5, 0))
+        
+        options_frame = tk.Frame(main_frame)
+        options_frame.grid(row=3, column=1, sticky="w", pady=(5, 0))
+        tk.Checkbutton(options_frame, text="Düzenli ifade", variable=regex_var, font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        tk.Checkbutton(options_frame, text="Büyük/küçük harf duyarlı", variable=case_var, font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(10, 0))
+        
+        status_label = tk.Label(main_frame, text="", font=("Segoe UI", 9), anchor="w")
+        status_label.grid(row=4, column=0, columnspan=3, sticky="we", pady=(10, 0))
+        
+        def start():
+            file_path = file_var.get()
+            query = query_var.get()
+            if not file_path or not query:
+                return
+                
+            # Kaydedilmemiş değişiklikleri olan açık bir dosyanın üzerine yazma
+            for tab_info in self.tabs.values():
+                if tab_info["file_path"] == file_path and tab_info["document"].dirty:
+                    messagebox.showerror("Hata", "Dosya kaydedilmemiş değişikliklerle açık. Önce kaydedin.", parent=window)
+                    return
+                    
+            # Sınırsız ifadeler parça sınırında bölünebilir
+            if regex_var.get() and max_match_length(query, regex=True) is None:
+                if not messagebox.askyesno(
+                    "Uyarı",
+                    "Bu düzenli ifade sınırsız uzunlukta eşleşebilir (ör. +, *).\n"
+                    "4096 karakterden uzun eşleşmeler parça sınırında bölünebilir.\n\n"
+                    "Devam edilsin mi?",
+                    parent=window
+                ):
+                    return
+                    
+            start_button.config(state=tk.DISABLED)
+            state = {"progress": (0, 0), "result": None, "error": None}
+            
+            def worker():
+                try:
+                    state["result"] = stream_replace_file(
+                        file_path,
+                        query,
+                        replace_var.get(),
+                        regex=regex_var.get(),
+                        nocase=not case_var.get(),
+                        progress=lambda done, total: state.__setitem__("progress", (done, total))
+                    )
+                except Exception as e:
+                    state["error"] = e
+                    
+            thread = threading.Thread(target=worker, daemon=True)
+            thread.start()
+            
+            def poll():
+                if not window.winfo_exists():
+                    return
+                if thread.is_alive():
+                    done, total = state["progress"]
+                    if total:
+                        status_label.config(text=f"İşleniyor... %{done * 100 // total}")
+                    window.after(100, poll)
+                    return
+                    
+                start_button.config(state=tk.NORMAL)
+                if state["error"] is not None:
+                    self.performance_monitor.record_error("Toplu Değiştirme Hatası", str(state["error"]))
+                    status_label.config(text=f"Hata: {state['error']}")
+                    return
+                    
+                result = state["result"]
+                self.performance_monitor.record_response_time("batch_replace", result["seconds"])
+                self.performance_monitor.update_usage_stats("replace_count", result["replacements"])
+                status_label.config(
+                    text=f"{result['replacements']} değişiklik, "
+                         f"{self.format_file_size(result['bytes'])}, "
+                         f"{result['seconds']:.2f} saniye "
+                         f"({self.format_file_size(result['bytes_per_second'])}/s)"
+                )
+                
+            poll()
+            
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=5, column=0, columnspan=3, sticky="e", pady=(10, 0))
+        start_button = tk.Button(
+            button_frame,
+            text="Başlat",
+            command=start,
+            font=("Segoe UI", 9),
+            relief=tk.FLAT,
+            bg="#0078d7",
+            fg="white",
+            activebackground="#106ebe",
+            activeforeground="white",
+            padx=12,
+            cursor="hand2"
+        )
+        start_button.pack(side=tk.RIGHT)
+        tk.Button(button_frame, text="Kapat", command=window.destroy, font=("Segoe UI", 9), relief=tk.FLAT, padx=12, cursor="hand2").pack(side=tk.RIGHT, padx=(0, 5))
+        
+        window.bind("<Escape>", lambda e: window.destroy())
+        
+    def show_search_all_tabs(self):
+        """Tüm sekmelerde arama penceresini gösterir"""
+        if self.search_all_window is not None and self.search_all_window.winfo_exists():
+            self.search_all_window.lift()
+            self.search_all_window.query_entry.focus_set()
+            return
+            
+        window = tk.Toplevel(self.root)
+        window.title("Tüm Sekmelerde Ara")
+        window.geometry("700x500")
+        window.transient(self.root)
+        self.search_all_window = window
+        
+        # Ana çerçeve
+        main_frame = tk.Frame(window, padx=15, pady=15)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Arama satırı
+        query_frame = tk.Frame(main_frame)
+        query_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        tk.Label(query_frame, text="Ara:", font=("Segoe UI", 9), width=8, anchor="w").pack(side=tk.LEFT)
+        
+        query_entry = tk.Entry(query_frame, font=("Segoe UI", 9))
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        window.query_entry = query_entry
+        
+        # Arama çubuğundaki metni başlangıç değeri olarak kullan
+        if self.search_text is not None and self.search_text.get():
+            query_entry.insert(0, self.search_text.get())
+            
+        regex_var = tk.BooleanVar(value=False)
+        case_var = tk.BooleanVar(value=False)
+        
+        def run_search():
+            query = query_entry.get()
+            if query:
+                self.search_all_tabs(query, regex_var.get(), not case_var.get())
+                
+        tk.Button(
+            query_frame,
+            text="Ara",
+            command=run_search,
+            font=("Segoe UI", 9),
+            relief=tk.FLAT,
+            bg="#0078d7",
+            fg="white",
+            activebackground="#106ebe",
+            activeforeground="white",
+            padx=12,
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+        
+        # Seçenekler
+        options_frame = tk.Frame(main_frame)
+        options_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Checkbutton(options_frame, text="Düzenli ifade", variable=regex_var, font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        tk.Checkbutton(options_frame, text="Büyük/küçük harf duyarlı", variable=case_var, font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Sonuç ağacı
+        tree_frame = tk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tree = ttk.Treeview(tree_frame, show="tree")
+        tree_scrollbar = tk.Scrollbar(tree_frame, command=tree.yview)
+        tree.configure(yscrollcommand=tree_scrollbar.set)
+        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        window.tree = tree
+        window.result_locations = {}  # Ağaç öğesi -> (tab_id, satır, sütun, uzunluk)
+        
+        # Durum etiketi
+        status_label = tk.Label(main_frame, text="", font=("Segoe UI", 9), anchor="w")
+        status_label.pack(fill=tk.X, pady=(5, 0))
+        window.status_label = status_label
+        
+        tree.bind("<Double-1>", lambda e: self.goto_search_all_result())
+        tree.bind("<Return>", lambda e: self.goto_search_all_result())
+        query_entry.bind("<Return>", lambda e: run_search())
+        window.bind("<Escape>", lambda e: window.destroy())
+        
+        query_entry.focus_set()
+        if query_entry.get():
+            run_search()
+            
+    @perf.timed("search_all_submit")
+    def search_all_tabs(self, query, regex=False, nocase=True):
+        """Tüm sekmelerin anlık görüntülerinde arka planda arama başlatır"""
+        start_time = time.perf_counter()
+        key = (query, regex, nocase)
+        try:
+            compile_search_pattern(*key)
+        except re.error as e:
+            messagebox.showerror("Hata", f"Geçersiz düzenli ifade:\n{str(e)}")
+            return
+            
+        # Yalnızca içeriği değişen sekmelerin anlık görüntüsünü al
+        versions = {}
+        snapshots = {}
+        for tab_id, tab_info in list(self.tabs.items()):
+            versions[tab_id] = tab_info["document"].version
+            if self.tab_searcher.get_cached(tab_id, tab_info["document"].version, key) is None:
+                content = self.get_tab_content(tab_id)
+                if content is None:
+                    continue
+                snapshots[tab_id] = content
+                
+        futures = self.tab_searcher.submit(snapshots, key)
+        self.search_all_request = key
+        self._poll_search_all(key, versions, futures, start_time)
+        
+    def _poll_search_all(self, key, versions, futures, start_time):
+        """Arka plan aramasının bitip bitmediğini arayüz döngüsünden kontrol eder"""
+        if self.search_all_request != key:
+            return  # Daha yeni bir arama başlatıldı
+            
+        if not all(future.done() for future in futures.values()):
+            self.root.after(20, lambda: self._poll_search_all(key, versions, futures, start_time))
+            return
+            
+        results = {}
+        for tab_id, version in versions.items():
+            if tab_id not in self.tabs:
+                continue
+            if tab_id in futures:
+                try:
+                    result = futures[tab_id].result()
+                except Exception as e:
+                    self.performance_monitor.record_error("Çoklu Arama Hatası", str(e))
+                    continue
+                self.tab_searcher.store(tab_id, version, key, result)
+            else:
+                result = self.tab_searcher.get_cached(tab_id, version, key)
+            if result and result["count"]:
+                results[tab_id] = result
+                
+        self._show_search_all_results(results, len(futures))
+        
+        # Performans metriklerini güncelle
+        duration = time.perf_counter() - start_time
+        self.performance_monitor.record_response_time("search_all_tabs", duration)
+        self.performance_monitor.update_usage_stats("search_count")
+        
+    def _show_search_all_results(self, results, rescanned):
+        """Arama sonuçlarını sekmelere göre gruplanmış olarak gösterir"""
+        window = self.search_all_window
+        if window is None or not window.winfo_exists():
+            return
+            
+        tree = window.tree
+        tree.delete(*tree.get_children())
+        window.result_locations = {}
+        
+        total = 0
+        for tab_id in self.tabs:
+            if tab_id not in results:
+                continue
+            result = results[tab_id]
+            total += result["count"]
+            file_path = self.tabs[tab_id]["file_path"]
+            title = os.path.basename(file_path) if file_path else "Yeni Dosya"
+            parent = tree.insert("", tk.END, text=f"{title} ({result['count']} eşleşme)", open=True)
+            for line, column, length, line_text in result["matches"]:
+                item = tree.insert(parent, tk.END, text=f"{line}: {line_text.strip()}")
+                window.result_locations[item] = (tab_id, line, column, length)
+            if result["count"] > len(result["matches"]):
+                tree.insert(parent, tk.END, text=f"... {result['count'] - len(result['matches'])} eşleşme daha")
+                
+        window.status_label.config(
+            text=f"{len(results)} sekmede {total} eşleşme ({rescanned} sekme yeniden tarandı)"
+        )
+        
+    def goto_search_all_result(self):
+        """Seçili arama sonucunun bulunduğu sekmeye ve konuma gider"""
+        window = self.search_all_window
+        if window is None or not window.winfo_exists():
+            return
+            
+        selection = window.tree.selection()
+        if not selection or selection[0] not in window.result_locations:
+            return
+            
+        tab_id, line, column, length = window.result_locations[selection[0]]
+        if tab_id not in self.tabs:
+            return
+            
+        text_widget = self.select_tab(tab_id)
+        if text_widget is None:
+            return
+        start = f"{line}.{column}"
+        end = f"{start}+{length}c"
+        text_widget.tag_remove("search", "1.0", tk.END)
+        text_widget.tag_add("search", start, end)
+        theme = self.theme_colors[self.current_theme.get()]
+        text_widget.tag_config("search", background=theme["search_highlight_bg"], foreground=theme["search_highlight_fg"])
+        text_widget.mark_set(tk.INSERT, start)
+        text_widget.see(start)
+        text_widget.focus_set()
+
     def change_font(self):
         """Yazı tipi değiştirme penceresini gösterir"""
         try:
@@ -3140,6 +6066,7 @@ class TextEditor:
             
             # Mevcut yazı tipini kaydet
             current_font = None
+            previous_text_font = self.text_font
             if self.tabs:
                 current_font = self.get_current_text_widget().cget("font")
             
@@ -3350,9 +6277,11 @@ Hızlı kahverengi tilki
                     )
                     
                     # Tüm sekmelere yeni yazı tipini uygula
+                    self.text_font = new_font
                     for tab_id in self.tabs:
                         text_widget = self.tabs[tab_id]["text_widget"]
-                        text_widget.configure(font=new_font)
+                        if text_widget is not None:
+                            text_widget.configure(font=new_font)
                     
                     font_window.destroy()
                 except Exception as e:
@@ -3362,10 +6291,12 @@ Hızlı kahverengi tilki
             def cancel():
                 try:
                     # Orijinal yazı tipini geri yükle
+                    self.text_font = previous_text_font
                     if current_font:
                         for tab_id in self.tabs:
                             text_widget = self.tabs[tab_id]["text_widget"]
-                            text_widget.configure(font=current_font)
+                            if text_widget is not None:
+                                text_widget.configure(font=current_font)
                 except Exception as e:
                     self.performance_monitor.record_error("FontCancel", str(e))
                 finally:
@@ -3436,14 +6367,61 @@ Hızlı kahverengi tilki
             
         return True
 
+    def start_profiling(self):
+        """Ana iş parçacığını belirtilen süre boyunca örnekleyen profilleyiciyi başlatır"""
+        if self.profiler is not None and self.profiler.running:
+            messagebox.showinfo("Bilgi", "Profil çıkarma zaten devam ediyor.")
+            return
+            
+        duration = simpledialog.askinteger(
+            "Performans Profili",
+            "Kaç saniye örneklensin?",
+            initialvalue=10,
+            minvalue=1,
+            maxvalue=300,
+            parent=self.root
+        )
+        if not duration:
+            return
+            
+        self.profiler = SamplingProfiler()
+        self.profiler.start(duration)
+        self.status_bar.config(text=f"Performans profili çıkarılıyor ({duration} saniye)...")
+        self.root.after(200, self._poll_profiler)
+        
+    def _poll_profiler(self):
+        """Profilleyici bitince katlanmış yığın dosyasını yazar ve raporu açar"""
+        if self.profiler.running:
+            self.root.after(200, self._poll_profiler)
+            return
+            
+        profiler = self.profiler
+        directory = os.path.dirname(os.path.abspath(self.performance_monitor.metrics_log.path))
+        path = os.path.join(directory, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.folded")
+        try:
+            profiler.write_collapsed(path)
+        except Exception as e:
+            self.performance_monitor.record_error("Profil Kaydetme Hatası", str(e))
+            path = None
+            
+        self.last_profile = {
+            "elapsed": profiler.elapsed,
+            "samples": profiler.samples,
+            "path": path,
+            "top": profiler.top_functions()
+        }
+        self.status_bar.config(text=f"Performans profili tamamlandı: {profiler.samples} örnek")
+        self.show_performance_report()
+        
     def show_performance_report(self):
         """Performans raporunu gösterir"""
         report = self.performance_monitor.get_performance_report()
+        history = self.performance_monitor.get_history_report()
         
         # Rapor penceresi
         report_window = tk.Toplevel(self.root)
         report_window.title("Performans Raporu")
-        report_window.geometry("700x500")
+        report_window.geometry("700x960")
         
         # Ana çerçeve
         main_frame = tk.Frame(report_window, padx=20, pady=20)
@@ -3467,8 +6445,10 @@ Hızlı kahverengi tilki
         # Sistem metrikleri
         metrics = [
             ("Çalışma Süresi", f"{report['uptime']:.1f} saniye"),
-            ("Bellek Kullanımı", f"{report['memory_usage']:.1f} MB"),
-            ("CPU Kullanımı", f"{report['cpu_usage']:.1f}%"),
+            ("Bellek Kullanımı", f"{report['memory_usage']:.1f} MB (en yüksek {report['peak_memory_usage']:.1f} MB)"),
+            ("CPU Kullanımı", f"{report['cpu_usage']:.1f}% (ortalama {report['average_cpu_usage']:.1f}%)"),
+            ("İş Parçacığı / Açık Dosya", f"{report['thread_count']} / {report['open_files']}"),
+            ("Disk Okuma / Yazma", f"{report['io_read_rate'] / 1024:.1f} / {report['io_write_rate'] / 1024:.1f} KB/s"),
             ("Ortalama Yanıt Süresi", f"{report['average_response_time']:.3f} saniye"),
             ("Hata Sayısı", str(report['error_count']))
         ]
@@ -3491,6 +6471,139 @@ Hızlı kahverengi tilki
                 font=("Segoe UI", 10, "bold")
             ).pack(side=tk.LEFT, padx=(10, 0))
         
+        # İşlem başına gecikme yüzdelikleri
+        latency_frame = tk.LabelFrame(main_frame, text="İşlem Süreleri (ms)", padx=10, pady=10)
+        latency_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        operation_names = {
+            "open_file": "Dosya Açma",
+            "save_file": "Dosya Kaydetme",
+            "save_as": "Farklı Kaydetme",
+            "save_all": "Tümünü Kaydetme",
+            "search_text": "Arama",
+            "highlighting": "Vurgulama",
+            "highlight_toggle": "Vurgulama Aç/Kapat",
+            "keystroke": "Tuş İşleme",
+            "theme_switch": "Tema Değiştirme",
+            "batch_replace": "Toplu Değiştirme",
+            "search_all_tabs": "Tüm Sekmelerde Arama",
+            "search_all_submit": "Çoklu Arama Başlatma",
+            "highlight_incremental": "Artımlı Vurgulama",
+            "highlight_structured": "Yapısal Vurgulama",
+            "highlight_apply": "Analiz Uygulama",
+            "highlight_tokens": "Etiket Uygulama",
+            "tab_new": "Yeni Sekme",
+            "tab_switch": "Sekme Geçişi",
+            "tab_load": "Sekme Yükleme",
+            "tab_hibernate": "Sekme Uyutma",
+            "tab_close": "Sekme Kapatma",
+            "theme_tab": "Sekme Teması",
+            "replace_text": "Değiştirme",
+            "replace_all": "Tümünü Değiştirme",
+            "click": "Tıklama İşleme",
+            "status_bar": "Durum Çubuğu",
+            "session_save": "Oturum Kaydetme",
+            "session_restore": "Oturum Geri Yükleme",
+            "input_latency": "Tuş → Ekran"
+        }
+        # Kendi süre: iç içe ölçümlerde alt işlemler hariç toplam süre (s)
+        headers = ("İşlem", "Sayı", "p50", "p90", "p99", "En Yüksek", "Kendi (s)")
+        for column, header in enumerate(headers):
+            tk.Label(
+                latency_frame,
+                text=header,
+                font=("Segoe UI", 10, "bold"),
+                anchor="w" if column == 0 else "e",
+                width=20 if column == 0 else 9
+            ).grid(row=0, column=column, sticky="ew")
+            
+        for row, (operation, summary) in enumerate(report["latencies"].items(), 1):
+            if summary["count"]:
+                values = [str(summary["count"])] + [
+                    f"{summary[key] * 1000:.1f}" for key in ("p50", "p90", "p99", "max")
+                ] + [f"{report['self_times'].get(operation, 0.0):.2f}"]
+            else:
+                values = ["0", "-", "-", "-", "-", "-"]
+            cells = [operation_names.get(operation, operation)] + values
+            for column, value in enumerate(cells):
+                tk.Label(
+                    latency_frame,
+                    text=value,
+                    font=("Segoe UI", 10),
+                    anchor="w" if column == 0 else "e",
+                    width=20 if column == 0 else 9
+                ).grid(row=row, column=column, sticky="ew")
+        
+        # Tuş basımından ekran çizimine kadar geçen süre
+        input_frame = tk.LabelFrame(main_frame, text="Tuş → Ekran Gecikmesi (ms)", padx=10, pady=10)
+        input_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        if report["input_latency"]:
+            headers = ("Boyut", "Dil", "Sayı", "p50", "p95", "p99", "En Yüksek")
+            for column, header in enumerate(headers):
+                tk.Label(
+                    input_frame,
+                    text=header,
+                    font=("Segoe UI", 10, "bold"),
+                    anchor="w" if column < 2 else "e",
+                    width=10 if column < 2 else 9
+                ).grid(row=0, column=column, sticky="ew")
+                
+            for row, (size_bucket, language, summary) in enumerate(report["input_latency"], 1):
+                cells = [size_bucket, language, str(summary["count"])] + [
+                    f"{summary[key] * 1000:.1f}" for key in ("p50", "p95", "p99", "max")
+                ]
+                for column, value in enumerate(cells):
+                    tk.Label(
+                        input_frame,
+                        text=value,
+                        font=("Segoe UI", 10),
+                        anchor="w" if column < 2 else "e",
+                        width=10 if column < 2 else 9
+                    ).grid(row=row, column=column, sticky="ew")
+        else:
+            tk.Label(
+                input_frame,
+                text="Henüz tuş gecikmesi ölçülmedi",
+                font=("Segoe UI", 10),
+                anchor="w"
+            ).pack(fill=tk.X)
+        
+        # Olay döngüsü takılmaları ve neden olan işlemler
+        stall_frame = tk.LabelFrame(main_frame, text="Arayüz Takılmaları", padx=10, pady=10)
+        stall_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        threshold_ms = self.performance_monitor.stall_threshold * 1000
+        stall_rows = [(f"Takılma Sayısı (>{threshold_ms:.0f} ms)", str(report["stall_count"]))]
+        for lag, timestamp, operation in report["worst_stalls"][:3]:
+            stall_rows.append((
+                "En Kötü" if len(stall_rows) == 1 else "",
+                f"{lag * 1000:.0f} ms — {operation} ({datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')})"
+            ))
+        for index, (operation, count, total) in enumerate(report["stall_attribution"][:3]):
+            stall_rows.append((
+                "En Çok Neden Olan" if index == 0 else "",
+                f"{operation}: {count} kez, toplam {total:.2f} saniye"
+            ))
+            
+        for label, value in stall_rows:
+            frame = tk.Frame(stall_frame)
+            frame.pack(fill=tk.X, pady=2)
+            
+            tk.Label(
+                frame,
+                text=label,
+                font=("Segoe UI", 10),
+                width=20,
+                anchor="w"
+            ).pack(side=tk.LEFT)
+            
+            tk.Label(
+                frame,
+                text=value,
+                font=("Segoe UI", 10, "bold")
+            ).pack(side=tk.LEFT, padx=(10, 0))
+        
         # Kullanım istatistikleri çerçevesi
         stats_frame = tk.LabelFrame(main_frame, text="Kullanım İstatistikleri", padx=10, pady=10)
         stats_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -3499,6 +6612,7 @@ Hızlı kahverengi tilki
         stats = [
             ("Açılan Dosya Sayısı", report['usage_stats']['files_opened']),
             ("Kaydedilen Dosya Sayısı", report['usage_stats']['files_saved']),
+            ("Farklı Kaydedilen Dosya", report['usage_stats']['files_saved_as']),
             ("Arama Sayısı", report['usage_stats']['search_count']),
             ("Değiştirme Sayısı", report['usage_stats']['replace_count']),
             ("Sözdizimi Vurgulama Süresi", f"{report['usage_stats']['syntax_highlighting_time']:.1f} saniye")
@@ -3522,6 +6636,82 @@ Hızlı kahverengi tilki
                 font=("Segoe UI", 10, "bold")
             ).pack(side=tk.LEFT, padx=(10, 0))
         
+        # Son örnekleyici profil: en çok örneklenen fonksiyonlar
+        if self.last_profile is not None:
+            profile = self.last_profile
+            profile_frame = tk.LabelFrame(main_frame, text="Son Profil", padx=10, pady=10)
+            profile_frame.pack(fill=tk.X, pady=(0, 10))
+            
+            tk.Label(
+                profile_frame,
+                text=(
+                    f"{profile['elapsed']:.1f} saniye, {profile['samples']} örnek"
+                    f" | Yığın dosyası: {profile['path'] or 'kaydedilemedi'}"
+                ),
+                font=("Segoe UI", 9),
+                anchor="w",
+                wraplength=620,
+                justify=tk.LEFT
+            ).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 5))
+            
+            headers = ("Fonksiyon", "Kendi %", "Toplam %")
+            for column, header in enumerate(headers):
+                tk.Label(
+                    profile_frame,
+                    text=header,
+                    font=("Segoe UI", 10, "bold"),
+                    anchor="w" if column == 0 else "e",
+                    width=48 if column == 0 else 9
+                ).grid(row=1, column=column, sticky="ew")
+                
+            samples = profile["samples"] or 1
+            for row, (name, own, total) in enumerate(profile["top"][:10], 2):
+                cells = (name, f"{own * 100 / samples:.1f}", f"{total * 100 / samples:.1f}")
+                for column, value in enumerate(cells):
+                    tk.Label(
+                        profile_frame,
+                        text=value,
+                        font=("Segoe UI", 9),
+                        anchor="w" if column == 0 else "e",
+                        width=48 if column == 0 else 9
+                    ).grid(row=row, column=column, sticky="ew")
+        
+        # Kayıtlı geçmiş (döndürülen metrik dosyalarından)
+        history_frame = tk.LabelFrame(main_frame, text="Kayıtlı Geçmiş", padx=10, pady=10)
+        history_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        since = history["since"]
+        history_rows = [
+            ("Oturum Sayısı", str(history["sessions"])),
+            ("Kayıt Başlangıcı", datetime.fromtimestamp(since).strftime("%d.%m.%Y %H:%M") if since else "-"),
+            ("Bellek Örnekleri", f"{history['samples']} (en yüksek {history['peak_memory_usage']:.1f} MB)"),
+            ("Toplam Hata", str(history["error_count"]))
+        ]
+        for operation, summary in history["latencies"].items():
+            history_rows.append((
+                operation_names.get(operation, operation),
+                f"{summary['count']} kez, p50 {summary['p50'] * 1000:.1f} ms, "
+                f"p99 {summary['p99'] * 1000:.1f} ms"
+            ))
+            
+        for label, value in history_rows:
+            frame = tk.Frame(history_frame)
+            frame.pack(fill=tk.X, pady=2)
+            
+            tk.Label(
+                frame,
+                text=label,
+                font=("Segoe UI", 10),
+                width=20,
+                anchor="w"
+            ).pack(side=tk.LEFT)
+            
+            tk.Label(
+                frame,
+                text=value,
+                font=("Segoe UI", 10, "bold")
+            ).pack(side=tk.LEFT, padx=(10, 0))
+        
         # Alt çerçeve (butonlar için)
         bottom_frame = tk.Frame(main_frame)
         bottom_frame.pack(fill=tk.X, pady=(10, 0))
@@ -3596,6 +6786,13 @@ Hızlı kahverengi tilki
             "• Sistem bilgilerini içerir",
             "• İşlem istatistiklerini gösterir",
             "",
+            "Performans Profili:",
+            "-----------------",
+            "• Yardım > Performans Profili Çıkar... ile başlatılır",
+            "• Ana iş parçacığı seçilen süre boyunca örneklenir",
+            "• Katlanmış yığın dosyası (.folded) metrik dosyasının yanına yazılır",
+            "• En çok zaman harcayan fonksiyonlar raporda listelenir",
+            "",
             "Önemli Notlar:",
             "-------------",
             "• Performans izleme otomatik olarak başlar",
@@ -3627,9 +6824,10 @@ Hızlı kahverengi tilki
                 if result is None:  # İptal
                     return False
                 elif result:  # Evet
-                    for tab_id in unsaved_tabs:
-                        if not self.save_tab(tab_id):
-                            return False
+                    with perf.span("save_all"):
+                        for tab_id in unsaved_tabs:
+                            if not self.save_tab(tab_id):
+                                return False
                 # Hayır seçeneğinde hiçbir şey yapma
             
             return True
@@ -3639,161 +6837,12 @@ Hızlı kahverengi tilki
             messagebox.showerror("Hata", f"Tüm sekmeler kaydedilirken hata oluştu:\n{str(e)}")
             return False
 
-    def highlight_python_syntax(self, text_widget, start_pos="1.0", end_pos="end"):
-        """Python sözdizimi vurgulaması uygular"""
-        # Etiketleri tanımla
-        text_widget.tag_configure("keyword", foreground=self.syntax_colors["keywords"])
-        text_widget.tag_configure("string", foreground=self.syntax_colors["strings"])
-        text_widget.tag_configure("comment", foreground=self.syntax_colors["comments"])
-        text_widget.tag_configure("function", foreground=self.syntax_colors["functions"])
-        text_widget.tag_configure("number", foreground=self.syntax_colors["numbers"])
-        text_widget.tag_configure("class", foreground=self.syntax_colors["classes"])
-        text_widget.tag_configure("decorator", foreground=self.syntax_colors["decorators"])
-        text_widget.tag_configure("builtin", foreground=self.syntax_colors["builtins"])
-        
-        # Python anahtar kelimeleri
-        keywords = [
-            "False", "None", "True", "and", "as", "assert", "async", "await", "break", "class",
-            "continue", "def", "del", "elif", "else", "except", "finally", "for", "from", "global",
-            "if", "import", "in", "is", "lambda", "nonlocal", "not", "or", "pass", "raise", "return",
-            "try", "while", "with", "yield"
-        ]
-        
-        # Yerleşik fonksiyonlar
-        builtins = [
-            "abs", "all", "any", "ascii", "bin", "bool", "bytearray", "bytes", "callable", "chr",
-            "classmethod", "compile", "complex", "delattr", "dict", "dir", "divmod", "enumerate",
-            "eval", "exec", "filter", "float", "format", "frozenset", "getattr", "globals", "hasattr",
-            "hash", "help", "hex", "id", "input", "int", "isinstance", "issubclass", "iter", "len",
-            "list", "locals", "map", "max", "memoryview", "min", "next", "object", "oct", "open",
-            "ord", "pow", "print", "property", "range", "repr", "reversed", "round", "set", "setattr",
-            "slice", "sorted", "staticmethod", "str", "sum", "super", "tuple", "type", "vars", "zip"
-        ]
-        
-        # Yorumları vurgula
-        pos = start_pos
-        while True:
-            # Tek satırlık yorumlar
-            pos = text_widget.search(r'#', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            line_end = text_widget.index(f"{pos} lineend")
-            text_widget.tag_add("comment", pos, line_end)
-            pos = line_end
-            
-            # Çok satırlı yorumlar
-            pos = text_widget.search(r'"""', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            comment_end = text_widget.search(r'"""', f"{pos}+3c", end_pos, regexp=True)
-            if comment_end:
-                text_widget.tag_add("comment", pos, f"{comment_end}+3c")
-                pos = f"{comment_end}+3c"
-            else:
-                pos = text_widget.index(f"{pos}+3c")
-        
-        # Anahtar kelimeleri vurgula
-        for keyword in keywords:
-            pos = start_pos
-            while True:
-                pos = text_widget.search(r'\y' + keyword + r'\y', pos, end_pos, regexp=True)
-                if not pos:
-                    break
-                text_widget.tag_add("keyword", pos, f"{pos}+{len(keyword)}c")
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Yerleşik fonksiyonları vurgula
-        for builtin in builtins:
-            pos = start_pos
-            while True:
-                pos = text_widget.search(r'\y' + builtin + r'\y', pos, end_pos, regexp=True)
-                if not pos:
-                    break
-                text_widget.tag_add("builtin", pos, f"{pos}+{len(builtin)}c")
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Sayıları vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\b\d+(\.\d+)?\b', pos, end_pos, regexp=True)
-            if not pos:
-                break
-            number_end = text_widget.search(r'\b', pos, end_pos, regexp=True)
-            if number_end:
-                text_widget.tag_add("number", pos, number_end)
-                pos = number_end
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Stringleri vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'["\']', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            quote = text_widget.get(pos)
-            string_end = text_widget.search(quote, f"{pos}+1c", end_pos)
-            if string_end:
-                text_widget.tag_add("string", pos, f"{string_end}+1c")
-                pos = f"{string_end}+1c"
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Fonksiyon tanımlamalarını vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\bdef\s+([a-zA-Z_]\w*)', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            func_name_start = text_widget.search(r'[a-zA-Z_]\w*', f"{pos}+4c", end_pos)
-            if func_name_start:
-                func_name_end = text_widget.search(r'\(', func_name_start, end_pos)
-                if func_name_end:
-                    text_widget.tag_add("function", func_name_start, func_name_end)
-                    pos = func_name_end
-                else:
-                    pos = text_widget.index(f"{pos}+1c")
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Sınıf tanımlamalarını vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'\bclass\s+([a-zA-Z_]\w*)', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            class_name_start = text_widget.search(r'[a-zA-Z_]\w*', f"{pos}+6c", end_pos)
-            if class_name_start:
-                class_name_end = text_widget.search(r'[:(]', class_name_start, end_pos)
-                if class_name_end:
-                    text_widget.tag_add("class", class_name_start, class_name_end)
-                    pos = class_name_end
-                else:
-                    pos = text_widget.index(f"{pos}+1c")
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-        
-        # Dekoratörleri vurgula
-        pos = start_pos
-        while True:
-            pos = text_widget.search(r'@[a-zA-Z_]\w*', pos, end_pos, regexp=True)
-            if not pos:
-                break
-                
-            decorator_end = text_widget.search(r'[(\n]', pos, end_pos)
-            if decorator_end:
-                text_widget.tag_add("decorator", pos, decorator_end)
-                pos = decorator_end
-            else:
-                pos = text_widget.index(f"{pos}+1c")
-
 # Ana program başlangıcı
 if __name__ == "__main__":
+    # Komut satırından toplu değiştirme: editor.py --replace ARA DEĞİŞTİR DOSYA
+    if len(sys.argv) > 1 and sys.argv[1] == "--replace":
+        sys.exit(batch_replace_main(sys.argv[2:]))
+        
     # Ana pencere oluşturma
     root = tk.Tk()
     editor = TextEditor(root)
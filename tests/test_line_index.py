@@ -0,0 +1,66 @@
+import random
+import unittest
+
+import tkinter
+
+from editor import Document, LineIndex
+
+
+class EmojiColumnTest(unittest.TestCase):
+    """Tk 'satır.sütun' indeksleri BMP dışı karakter içeren satırlarda da doğru konuma çözülmeli"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tcl = tkinter.Tcl()
+        cls.previous_width = LineIndex.ASTRAL_WIDTH
+        LineIndex.ASTRAL_WIDTH = int(cls.tcl.call("string", "length", "\U0001F600"))
+
+    @classmethod
+    def tearDownClass(cls):
+        LineIndex.ASTRAL_WIDTH = cls.previous_width
+
+    def tk_column(self, line_text, column):
+        """Python sütununun Tcl'in saydığı birimdeki karşılığı"""
+        return int(self.tcl.call("string", "length", line_text[:column])) if column else 0
+
+    def assert_matches_tcl(self, text, line_index):
+        offset = 0
+        for line, line_text in enumerate(text.split("\n"), 1):
+            for column in range(len(line_text) + 1):
+                tk_column = self.tk_column(line_text, column)
+                self.assertEqual(line_index.offset(line, tk_column), offset + column)
+                self.assertEqual(line_index.position(offset + column), (line, tk_column))
+                self.assertEqual(line_index.to_index(offset + column), f"{line}.{tk_column}")
+            offset += len(line_text) + 1
+        offsets = list(range(len(text) + 1))
+        self.assertEqual(line_index.to_indices(offsets), [line_index.to_index(o) for o in offsets])
+
+    def test_emoji_line(self):
+        text = "a = '😀b😀'\nplain\n😀😀x\n"
+        self.assert_matches_tcl(text, LineIndex(text))
+
+    def test_edits_by_tk_index_keep_document_in_sync(self):
+        # Editördeki vekil komut gibi: Tk indeksini satır indeksiyle çözüp belgeye uygula
+        rng = random.Random(0)
+        text = "print('😀')\nx = 1\n"
+        document = Document(text)
+        for _ in range(300):
+            line_index = document.line_index
+            line = rng.randint(1, line_index.line_count())
+            line_text = document.line_text(line)
+            column = self.tk_column(line_text, rng.randint(0, len(line_text)))
+            start = line_index.offset(line, column)
+            if rng.random() < 0.6:
+                chars = rng.choice(("😀", "é", "z", "\n", "🎉ab"))
+                document.insert(start, chars)
+                text = text[:start] + chars + text[start:]
+            else:
+                end = min(start + rng.randint(1, 3), len(text))
+                document.delete(start, end)
+                text = text[:start] + text[end:]
+            self.assertEqual(document.text, text)
+        self.assert_matches_tcl(text, document.line_index)
+
+
+if __name__ == "__main__":
+    unittest.main()